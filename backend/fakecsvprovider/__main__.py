@@ -1,4 +1,5 @@
 import os
+from typing import Any, Dict
 
 from flask import Flask
 
@@ -17,4 +18,18 @@ def fixture() -> str:
 2022,2022-11-13,0000,Test League,Team A,Team B,65.59,39.99,0.7832,0.0673,0.1495,2.58,0.62,77.1,28.8,1,1,0.49,0.45,1.05,0.75,3.15,0.0"""
 
 
+@app.route('/v4/matches')
+def matches() -> Dict[str, Any]:
+    return {
+        "matches": [
+            {
+                "area": {"name": "Test"},
+                "competition": {"name": "League"},
+                "homeTeam": {"shortName": "Always Wins"},
+                "awayTeam": {"shortName": "Always Loses"},
+            },
+        ]
+    }
+
+
 app.run(debug=True, host="0.0.0.0", port=int(os.environ.get('PORT', 5002)))
@@ -1,25 +1,51 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List
+from functools import partial
+from typing import Any, Callable, Iterable, Optional
 
 from flask import Flask
 
 from matchpredictor.forecast.forecast_api import forecast_api
+from matchpredictor.forecast.forecast_cache import ForecastCache
 from matchpredictor.forecast.forecaster import Forecaster
 from matchpredictor.health import health_api
 from matchpredictor.matchresults.result import Result
-from matchpredictor.matchresults.results_provider import training_results
-from matchpredictor.model.model_provider import Model, ModelProvider
-from matchpredictor.model.models_api import models_api
+from matchpredictor.matchresults.results_frame import ResultsFrame
+from matchpredictor.matchresults.results_provider import ResultsSplit, load_frame
+from matchpredictor.model.ingest_api import ingest_api
+from matchpredictor.model.model_provider import Model, ModelNotReady, ModelProvider, PendingModel
+from matchpredictor.model.model_store import ModelStore, model_version, results_fingerprint
+from matchpredictor.model.models_api import model_not_ready, models_api
+from matchpredictor.model.training import SharedArtifact
 from matchpredictor.predictors.alphabet_predictor import AlphabetPredictor
+from matchpredictor.predictors.elo_predictor import train_elo_predictor
 from matchpredictor.predictors.home_predictor import HomePredictor
-from matchpredictor.predictors.past_results_predictor import train_results_predictor
+from matchpredictor.predictors.past_results_predictor import (
+    PastResultsPredictor,
+    calculate_table,
+    train_results_predictor,
+)
+from matchpredictor.predictors.poisson_predictor import train_dixon_coles_predictor, train_poisson_predictor
+from matchpredictor.predictors.predictor import Predictor
 from matchpredictor.predictors.random_forest_regressor import (
+    form_matches,
+    random_forest_predictor,
     train_random_forest_predictor,
 )
+from matchpredictor.predictors.rolling_form import calculate_form
 from matchpredictor.predictors.simulation_predictor import (
+    exact_offense_and_defense_predictor,
+    exact_offense_predictor,
+    offense_and_defense_predictor,
+    offense_predictor,
+    train_exact_offense_and_defense_predictor,
+    train_exact_offense_predictor,
     train_offense_and_defense_predictor,
     train_offense_predictor,
 )
+from matchpredictor.predictors.simulators.scoring_rates import ScoringRates
+from matchpredictor.predictors.tuning import TuningConfig
 from matchpredictor.teams.teams_api import teams_api
 from matchpredictor.teams.teams_provider import TeamsProvider
 from matchpredictor.upcominggames.football_data_api_client import FootballDataApiClient
@@ -30,32 +56,92 @@ from matchpredictor.upcominggames.upcoming_games_api import upcoming_games_api
 # )
 
 
-def build_model_provider(training_data: List[Result]) -> ModelProvider:
-    return ModelProvider(
+def build_model_provider(
+    training_data: Iterable[Result],
+    model_store: Optional[ModelStore] = None,
+    tuning: TuningConfig = TuningConfig(),
+    simulation_cache_seconds: float = 0,
+    simulation_seed: int = 0,
+    training_workers: Optional[int] = None,
+) -> ModelProvider:
+    data_fingerprint = results_fingerprint(training_data)
+    scoring_rates = SharedArtifact(lambda: ScoringRates(training_data))
+    points_table = SharedArtifact(lambda: calculate_table(training_data))
+    form = SharedArtifact(lambda: calculate_form(training_data, form_matches))
+
+    def trained(
+        name: str,
+        train: Callable[..., Predictor],
+        *params: Any,
+        in_progress: bool = False,
+        build: Optional[Callable[[], Predictor]] = None,
+        cache_seconds: Optional[float] = None,
+    ) -> PendingModel:
+        # The version always names the public trainer, whichever way the predictor is built.
+        version = model_version(data_fingerprint, train, params)
+        build_predictor = build or (lambda: train(training_data, *params))
+
+        def train_model() -> Model:
+            if model_store is None:
+                predictor = build_predictor()
+            else:
+                predictor = model_store.load_or_train(name, version, build_predictor)
+            return Model(name, predictor, version, cache_seconds)
+
+        return PendingModel(name, train_model, in_progress)
+
+    def simulated(
+        name: str,
+        train: Callable[..., Predictor],
+        build: Callable[[ScoringRates, int, int], Predictor],
+        simulations: int,
+    ) -> PendingModel:
+        return trained(
+            name, train, simulations, simulation_seed,
+            in_progress=True,
+            build=lambda: build(scoring_rates.get(), simulations, simulation_seed),
+            cache_seconds=simulation_cache_seconds,
+        )
+
+    def exact(name: str, train: Callable[..., Predictor], build: Callable[[ScoringRates], Predictor]) -> PendingModel:
+        return trained(name, train, in_progress=True, build=lambda: build(scoring_rates.get()))
+
+    # Trainers share a bounded thread pool rather than processes, so the shared
+    # scoring rates, points table and form are handed to every model without
+    # copying. The heavy lifting happens in numpy and scikit-learn, which
+    # release the GIL.
+    model_provider = ModelProvider(
         [
             Model("Home", HomePredictor()),
-            Model("Points", train_results_predictor(training_data)),
-            Model(
-                "Offense simulator (fast)",
-                train_offense_predictor(training_data, 1_000),
-            ),
-            Model("Offense simulator", train_offense_predictor(training_data, 10_000)),
-            Model(
-                "Full simulator (fast)",
-                train_offense_and_defense_predictor(training_data, 1_000),
+            trained("Points", train_results_predictor, build=lambda: PastResultsPredictor(points_table.get())),
+            trained("Elo", train_elo_predictor),
+            simulated("Offense simulator (fast)", train_offense_predictor, offense_predictor, 1_000),
+            simulated("Offense simulator", train_offense_predictor, offense_predictor, 10_000),
+            exact("Offense simulator (exact)", train_exact_offense_predictor, exact_offense_predictor),
+            simulated(
+                "Full simulator (fast)", train_offense_and_defense_predictor, offense_and_defense_predictor, 1_000
             ),
-            Model(
-                "Full simulator",
-                train_offense_and_defense_predictor(training_data, 10_000),
+            simulated("Full simulator", train_offense_and_defense_predictor, offense_and_defense_predictor, 10_000),
+            exact(
+                "Full simulator (exact)",
+                train_exact_offense_and_defense_predictor,
+                exact_offense_and_defense_predictor,
             ),
+            trained("Poisson", train_poisson_predictor, in_progress=True),
+            trained("Dixon-Coles", train_dixon_coles_predictor, in_progress=True),
             Model("Alphabet Provider", AlphabetPredictor()),
-            Model(
-                "Random Forest Predictor", train_random_forest_predictor(training_data)
+            trained(
+                "Random Forest Predictor", train_random_forest_predictor, tuning,
+                build=lambda: random_forest_predictor(training_data, points_table.get(), form.get(), tuning),
             ),
             # The linear regression model uses scikit learn, so can cause issues on some machines
-            # Model("Linear regression", train_regression_predictor(training_data))
-        ]
+            # trained("Linear regression", train_regression_predictor)
+        ],
+        partial(ThreadPoolExecutor, training_workers or os.cpu_count()),
     )
+    model_provider.warm_up()
+
+    return model_provider
 
 
 @dataclass
@@ -65,32 +151,73 @@ class AppEnvironment:
     regression_csv_include: bool
     season: int
     football_data_api_key: str
+    model_store_location: Optional[str] = None
+    csv_cache_location: Optional[str] = None
+    tuning: TuningConfig = TuningConfig()
+    forecast_cache_size: int = 10_000
+    forecast_cache_seconds: float = 3600
+    simulation_cache_seconds: float = 0
+    simulation_seed: int = 0
+    training_workers: Optional[int] = None
+    # Serve as soon as the data is loaded, and train models in the background.
+    lazy_models: bool = True
+    football_data_location: str = "https://api.football-data.org/v4"
+    upcoming_games_cache_seconds: float = 300
+    # POST /results is only served when a token is set.
+    ingest_token: Optional[str] = None
+
+
+def load_training_data(env: AppEnvironment) -> ResultsFrame:
+    last_two_years = ResultsSplit(first_season=env.season - 2, before_season=env.season)
+
+    results = load_frame(env.csv_location, last_two_years, env.csv_cache_location)
 
+    if env.regression_csv_include:
+        results += load_frame(env.regression_csv_location, last_two_years, env.csv_cache_location)
 
-def create_app(env: AppEnvironment) -> Flask:
-    app = Flask(__name__)
+    return results
 
-    def last_two_years(result: Result) -> bool:
-        return result.season >= env.season - 2
 
-    results = training_results(env.csv_location, env.season, last_two_years)
+def build_model_store(env: AppEnvironment) -> Optional[ModelStore]:
+    if env.model_store_location is None:
+        return None
 
-    if env.regression_csv_include:
-        results += training_results(
-            env.regression_csv_location, env.season, last_two_years
-        )
+    return ModelStore(env.model_store_location)
 
-    fixtures = list(map(lambda r: r.fixture, results))
 
-    teams_provider = TeamsProvider(fixtures)
-    models_provider = build_model_provider(results)
-    forecaster = Forecaster(models_provider)
-    football_data_api_client = FootballDataApiClient(env.football_data_api_key)
+def build_environment_model_provider(env: AppEnvironment, training_data: Iterable[Result]) -> ModelProvider:
+    """The models as the environment configures them, for both the app and make train,
+    so that the versions trained ahead of time are the ones the app looks up."""
+    return build_model_provider(
+        training_data, build_model_store(env), env.tuning, env.simulation_cache_seconds, env.simulation_seed,
+        env.training_workers,
+    )
+
+
+def create_app(env: AppEnvironment) -> Flask:
+    app = Flask(__name__)
+
+    results = load_training_data(env)
+
+    teams_provider = TeamsProvider(results)
+    models_provider = build_environment_model_provider(env, results)
+    if not env.lazy_models:
+        models_provider.list()
+
+    forecaster = Forecaster(
+        models_provider, ForecastCache(env.forecast_cache_size, env.forecast_cache_seconds)
+    )
+    football_data_api_client = FootballDataApiClient(
+        env.football_data_api_key, env.football_data_location, cache_seconds=env.upcoming_games_cache_seconds
+    )
 
     app.register_blueprint(forecast_api(forecaster))
     app.register_blueprint(teams_api(teams_provider))
     app.register_blueprint(models_api(models_provider))
-    app.register_blueprint(upcoming_games_api(football_data_api_client))
-    app.register_blueprint(health_api())
+    app.register_blueprint(upcoming_games_api(football_data_api_client, forecaster, teams_provider))
+    app.register_blueprint(health_api(models_provider))
+    app.register_error_handler(ModelNotReady, model_not_ready)
+    if env.ingest_token:
+        app.register_blueprint(ingest_api(models_provider, env.ingest_token))
 
     return app
@@ -0,0 +1,19 @@
+import hashlib
+import json
+from typing import Any
+
+from flask import Response, request
+
+
+class CachedJson(object):
+    """A JSON body serialized once and served with an ETag, so clients can make conditional requests."""
+
+    def __init__(self, value: Any) -> None:
+        self.body = json.dumps(value, separators=(",", ":")).encode()
+        self.etag = hashlib.sha256(self.body).hexdigest()[:16]
+
+    def response(self) -> Response:
+        response = Response(self.body, mimetype="application/json")
+        response.set_etag(self.etag)
+        response.make_conditional(request)
+        return response
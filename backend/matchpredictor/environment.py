@@ -0,0 +1,42 @@
+from typing import Mapping
+
+from matchpredictor.app import AppEnvironment
+from matchpredictor.predictors.tuning import tuning_config_from_environment
+
+
+def require_env(env: Mapping[str, str], name: str) -> str:
+    value = env.get(name)
+    if value is None:
+        raise Exception(f"Failed to read {name} from the environment")
+    return value
+
+
+def app_environment_from_environment(env: Mapping[str, str], serving: bool = True) -> AppEnvironment:
+    """The app's settings. The football-data.org key is only required when serving,
+    as training models ahead of time never calls the API."""
+    if serving:
+        football_data_api_key = require_env(env, "FOOTBALL_DATA_API_KEY")
+    else:
+        football_data_api_key = env.get("FOOTBALL_DATA_API_KEY", "")
+
+    return AppEnvironment(
+        csv_location=env.get(
+            "CSV_LOCATION",
+            "https://projects.fivethirtyeight.com/soccer-api/club/spi_matches.csv",
+        ),
+        regression_csv_location=env.get("REGRESSION_CSV_LOCATION", " "),
+        regression_csv_include=False,
+        season=2023,
+        football_data_api_key=football_data_api_key,
+        csv_cache_location=env.get("CSV_CACHE_LOCATION"),
+        tuning=tuning_config_from_environment(env),
+        forecast_cache_size=int(env.get("FORECAST_CACHE_SIZE", 10_000)),
+        forecast_cache_seconds=float(env.get("FORECAST_CACHE_SECONDS", 3600)),
+        simulation_cache_seconds=float(env.get("SIMULATION_CACHE_SECONDS", 0)),
+        simulation_seed=int(env.get("SIMULATION_SEED", 0)),
+        training_workers=int(env["TRAINING_WORKERS"]) if env.get("TRAINING_WORKERS") else None,
+        model_store_location=env.get("MODEL_STORE_LOCATION"),
+        football_data_location=env.get("FOOTBALL_DATA_LOCATION", "https://api.football-data.org/v4"),
+        upcoming_games_cache_seconds=float(env.get("UPCOMING_GAMES_CACHE_SECONDS", 300)),
+        ingest_token=env.get("INGEST_TOKEN"),
+    )
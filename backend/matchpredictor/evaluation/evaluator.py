@@ -1,8 +1,112 @@
+import math
 import time
-from typing import Iterable, Tuple
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from matchpredictor.matchresults.result import Result
-from matchpredictor.predictors.predictor import Predictor
+import numpy as np
+
+from matchpredictor.matchresults.result import Outcome, Result
+from matchpredictor.predictors.predictor import Prediction, Predictor
+
+# Probabilities are clipped before taking logs, so one confident miss
+# cannot make the log loss infinite.
+probability_floor = 1e-15
+
+
+@dataclass(frozen=True)
+class ChunkScore(object):
+    predictions: int
+    correct: int
+    # Predictions that came with a confidence, which log_loss and brier_score sum over.
+    scored: int
+    log_loss: float
+    brier_score: float
+    seconds: float
+    latencies: List[float]
+
+
+@dataclass(frozen=True)
+class Evaluation(object):
+    predictions: int
+    accuracy: float
+    # None when the model does not give a confidence with every prediction,
+    # since there is then no probability to score it on.
+    log_loss: Optional[float]
+    brier_score: Optional[float]
+    seconds: float
+    predictions_per_second: float
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+
+    @staticmethod
+    def combine(scores: List[ChunkScore]) -> "Evaluation":
+        predictions = sum(s.predictions for s in scores)
+        seconds = sum(s.seconds for s in scores)
+        latencies = [latency for s in scores for latency in s.latencies] or [0.0]
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]).tolist()
+        scored = sum(s.scored for s in scores) == predictions
+
+        return Evaluation(
+            predictions=predictions,
+            accuracy=sum(s.correct for s in scores) / predictions,
+            log_loss=sum(s.log_loss for s in scores) / predictions if scored else None,
+            brier_score=sum(s.brier_score for s in scores) / predictions if scored else None,
+            seconds=seconds,
+            predictions_per_second=predictions / seconds if seconds > 0 else math.inf,
+            latency_p50=p50,
+            latency_p95=p95,
+            latency_p99=p99,
+        )
+
+
+def outcome_probabilities(prediction: Prediction) -> Optional[Dict[Outcome, float]]:
+    # Predictors only give the probability of the outcome they pick, so the
+    # rest is shared evenly. Predictions without a confidence have none.
+    if prediction.confidence is None:
+        return None
+
+    confidence = prediction.confidence
+    others = (1 - confidence) / 2
+
+    return {outcome: confidence if outcome == prediction.outcome else others for outcome in Outcome}
+
+
+def score_chunk(predictor: Predictor, results: List[Result], latency_samples: int = 0) -> ChunkScore:
+    start_time = time.perf_counter()
+    predictions = predictor.predict_batch([result.fixture for result in results])
+    seconds = time.perf_counter() - start_time
+
+    correct = 0
+    scored = 0
+    log_loss = 0.0
+    brier_score = 0.0
+    for result, prediction in zip(results, predictions):
+        correct += prediction.outcome == result.outcome
+
+        probabilities = outcome_probabilities(prediction)
+        if probabilities is None:
+            continue
+
+        scored += 1
+        log_loss -= math.log(min(max(probabilities[result.outcome], probability_floor), 1))
+        brier_score += sum((p - (outcome == result.outcome)) ** 2 for outcome, p in probabilities.items())
+
+    return ChunkScore(
+        predictions=len(results),
+        correct=correct,
+        scored=scored,
+        log_loss=log_loss,
+        brier_score=brier_score,
+        seconds=seconds,
+        latencies=[_latency(predictor, result) for result in results[:latency_samples]],
+    )
+
+
+def _latency(predictor: Predictor, result: Result) -> float:
+    start_time = time.perf_counter()
+    predictor.predict(result.fixture)
+    return time.perf_counter() - start_time
 
 
 class Evaluator(object):
@@ -10,14 +114,17 @@ class Evaluator(object):
         self.predictor = predictor
 
     def measure_accuracy(self, validation_data: Iterable[Result]) -> Tuple[float, float]:
-        results = list(validation_data)
+        evaluation = self.evaluate(validation_data, latency_samples=0)
 
-        start_time = time.time()
-        correct_predictions = sum([self.__is_correct(m) for m in results])
-        time_elapsed = time.time() - start_time
+        return evaluation.accuracy, evaluation.seconds
 
-        return correct_predictions / len(results), time_elapsed
+    def evaluate(
+        self, validation_data: Iterable[Result], chunk_size: int = 1_000, latency_samples: int = 100
+    ) -> Evaluation:
+        results = list(validation_data)
+        chunks = [results[i:i + chunk_size] for i in range(0, len(results), chunk_size)]
 
-    def __is_correct(self, result: Result) -> bool:
-        prediction = self.predictor.predict(result.fixture)
-        return prediction.outcome == result.outcome
+        return Evaluation.combine([
+            score_chunk(self.predictor, chunk, latency_samples if index == 0 else 0)
+            for index, chunk in enumerate(chunks)
+        ])
@@ -1,7 +1,11 @@
-from dataclasses import dataclass
-from typing import Iterable, List
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
 
-from matchpredictor.evaluation.evaluator import Evaluator
+from matchpredictor.evaluation.evaluator import ChunkScore, Evaluation, score_chunk
 from matchpredictor.matchresults.result import Result
 from matchpredictor.model.model_provider import Model, ModelProvider
 
@@ -9,42 +13,115 @@ from matchpredictor.model.model_provider import Model, ModelProvider
 @dataclass
 class PredictionReport(object):
     label: str
-    accuracy: float
-    time_elapsed: float
+    evaluation: Evaluation
+
+
+# Set in each worker process by the pool initializer, so models and results
+# are handed over once per worker rather than with every chunk.
+_worker_models: Dict[str, Model] = {}
+_worker_chunks: List[List[Result]] = []
+
+
+def _initialize_worker(models: List[Model], chunks: List[List[Result]]) -> None:
+    global _worker_models, _worker_chunks
+    _worker_models = {model.name: model for model in models}
+    _worker_chunks = chunks
+
+
+def _score(task: Tuple[str, int, int]) -> ChunkScore:
+    model_name, chunk_index, latency_samples = task
+    return score_chunk(_worker_models[model_name].predictor, _worker_chunks[chunk_index], latency_samples)
 
 
 class Reporter:
-    def __init__(self, title: str, validation_data: Iterable[Result], model_provider: ModelProvider) -> None:
+    def __init__(
+        self,
+        title: str,
+        validation_data: Iterable[Result],
+        model_provider: ModelProvider,
+        workers: int = 1,
+        chunk_size: int = 500,
+        latency_samples: int = 100,
+        json_location: Optional[str] = None,
+        output: TextIO = sys.stdout,
+    ) -> None:
         self.title = title
         self.validation_data = validation_data
         self.model_provider = model_provider
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.latency_samples = latency_samples
+        self.json_location = json_location
+        self.output = output
         self.reports: List[PredictionReport] = []
 
     def run_report(self) -> None:
-        reports = map(self.__calculate_accuracy, self.model_provider.list())
-        self.__print_reports(reports)
+        self.reports = self.__evaluate(self.model_provider.list())
+        self.__print_reports(self.reports)
+
+        if self.json_location is not None:
+            self.__write_json(self.json_location, self.reports)
+
+    def __evaluate(self, models: List[Model]) -> List[PredictionReport]:
+        results = list(self.validation_data)
+        chunks = [results[i:i + self.chunk_size] for i in range(0, len(results), self.chunk_size)]
+        tasks = [
+            (model.name, index, self.latency_samples if index == 0 else 0)
+            for model in models
+            for index in range(len(chunks))
+        ]
+
+        if self.workers > 1:
+            with ProcessPoolExecutor(self.workers, initializer=_initialize_worker, initargs=(models, chunks)) as pool:
+                scores = list(pool.map(_score, tasks))
+        else:
+            _initialize_worker(models, chunks)
+            scores = [_score(task) for task in tasks]
+
+        return [
+            PredictionReport(
+                label=model.name,
+                evaluation=Evaluation.combine(scores[index * len(chunks):(index + 1) * len(chunks)]),
+            )
+            for index, model in enumerate(models)
+        ]
 
     def __print_reports(self, reports: Iterable[PredictionReport]) -> None:
-        print()
-        print("=" * (len(self.title) + 2))
-        print(f" {self.title} ")
-        print("=" * (len(self.title) + 2))
-        print()
+        def line(text: str = "") -> None:
+            print(text, file=self.output)
+
+        def score(value: Optional[float]) -> str:
+            return "N/A" if value is None else f"{value:.4f}"
+
+        line()
+        line("=" * (len(self.title) + 2))
+        line(f" {self.title} ")
+        line("=" * (len(self.title) + 2))
+        line()
 
-        print(" {:<30} | {:<8} | {:<10}".format("Predictor", "Accuracy", "Elapsed"))
-        print("-" * 32 + "+" + "-" * 10 + "+" + "-" * 11)
+        line(" {:<30} | {:<8} | {:<8} | {:<8} | {:<11} | {:<10} | {:<10}".format(
+            "Predictor", "Accuracy", "Log loss", "Brier", "Pred/s", "p50", "p99"
+        ))
+        line("-" * 32 + "+" + "-" * 10 + "+" + "-" * 10 + "+" + "-" * 10 + "+" + "-" * 13 + "+" + "-" * 12 + "+"
+             + "-" * 11)
 
-        format_line = " {:<30} | {:<8.6f} | {:<8.6f}s"
+        format_line = " {:<30} | {:<8.6f} | {:<8} | {:<8} | {:<11.1f} | {:<10} | {:<10}"
         for r in reports:
-            print(format_line.format(r.label, r.accuracy, r.time_elapsed))
+            e = r.evaluation
+            line(format_line.format(
+                r.label,
+                e.accuracy,
+                score(e.log_loss),
+                score(e.brier_score),
+                e.predictions_per_second,
+                f"{e.latency_p50:.6f}s",
+                f"{e.latency_p99:.6f}s",
+            ))
 
-        print()
+        line()
 
-    def __calculate_accuracy(self, model: Model) -> PredictionReport:
-        accuracy, time_elapsed = Evaluator(model.predictor).measure_accuracy(self.validation_data)
+    def __write_json(self, location: str, reports: List[PredictionReport]) -> None:
+        os.makedirs(os.path.dirname(location) or ".", exist_ok=True)
 
-        return PredictionReport(
-            label=model.name,
-            accuracy=accuracy,
-            time_elapsed=time_elapsed
-        )
+        with open(location, "w") as report_file:
+            json.dump({"title": self.title, "reports": [asdict(r) for r in reports]}, report_file, indent=2)
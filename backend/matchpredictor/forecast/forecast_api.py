@@ -1,9 +1,26 @@
+from typing import Any, Dict, List, Optional
+
 from flask import Blueprint, Response, jsonify, request
 
-from matchpredictor.forecast.forecaster import Forecaster
+from matchpredictor.forecast.forecaster import Forecast, Forecaster
 from matchpredictor.matchresults.result import Fixture, Scenario, Team
 
 
+def fixture_from_json(fixture_json: Dict[str, Any]) -> Fixture:
+    if not all(isinstance(fixture_json[key], str) for key in ["home_name", "away_name", "league"]):
+        raise TypeError("Fixture names must be strings")
+
+    return Fixture(
+        home_team=Team(name=fixture_json["home_name"]),
+        away_team=Team(name=fixture_json["away_name"]),
+        league=fixture_json["league"],
+    )
+
+
+def is_list_of(value: Any, item_type: type) -> bool:
+    return isinstance(value, list) and all(isinstance(item, item_type) for item in value)
+
+
 def forecast_api(forecaster: Forecaster) -> Blueprint:
     api = Blueprint("forecast_api", __name__)
 
@@ -28,6 +45,41 @@ def forecast_api(forecaster: Forecaster) -> Blueprint:
 
         return jsonify(result)
 
+    @api.route("/forecasts", methods=["POST"])
+    def forecasts() -> Response:
+        body: Any = request.get_json(silent=True)
+
+        try:
+            model_names: List[str] = body["model_names"]
+            fixtures_json = body["fixtures"]
+            if not is_list_of(model_names, str) or not is_list_of(fixtures_json, dict):
+                return Response("Cannot read fixtures", 400)
+            fixtures = [fixture_from_json(f) for f in fixtures_json]
+        except (KeyError, TypeError):
+            return Response("Cannot read fixtures", 400)
+
+        # Forecasts are grouped by model, with one entry per fixture in request
+        # order and null for fixtures that cannot be forecast.
+        results: List[Optional[Forecast]] = []
+        for model_name in model_names:
+            model_forecasts = forecaster.forecast_batch(fixtures, model_name=model_name)
+
+            if model_forecasts is None:
+                return Response("Cannot forecast fixtures", 400)
+
+            results += model_forecasts
+
+        return jsonify({"forecasts": results})
+
+    @api.route("/forecast-cache", methods=["GET"])
+    def forecast_cache() -> Response:
+        stats = forecaster.cache_stats()
+
+        if stats is None:
+            return Response("Forecasts are not cached", 404)
+
+        return jsonify(stats)
+
     @api.route("/forecast-in-progress", methods=["GET"])
     def forecast_in_progress() -> Response:
         home_name = request.args["home_name"]
@@ -57,4 +109,33 @@ def forecast_api(forecaster: Forecaster) -> Blueprint:
 
         return jsonify(result)
 
+    @api.route("/forecast-scorelines", methods=["GET"])
+    def forecast_scorelines() -> Response:
+        home_name = request.args["home_name"]
+        away_name = request.args["away_name"]
+        league = request.args["league"]
+        model_name = request.args["model_name"]
+        minutes_elapsed = request.args.get("minutes_elapsed", default=0, type=int)
+        home_goals = request.args.get("home_goals", default=0, type=int)
+        away_goals = request.args.get("away_goals", default=0, type=int)
+
+        result = forecaster.forecast_scorelines(
+            Fixture(
+                home_team=Team(name=home_name),
+                away_team=Team(name=away_name),
+                league=league,
+            ),
+            Scenario(
+                minutes_elapsed=minutes_elapsed,
+                home_goals=home_goals,
+                away_goals=away_goals,
+            ),
+            model_name=model_name,
+        )
+
+        if result is None:
+            return Response("Cannot forecast scorelines", 400)
+
+        return jsonify(result)
+
     return api
@@ -0,0 +1,67 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Optional, Tuple
+
+from matchpredictor.matchresults.result import Fixture, Scenario
+from matchpredictor.predictors.predictor import Prediction
+
+
+@dataclass(frozen=True)
+class ForecastKey(object):
+    model_name: str
+    model_version: str
+    fixture: Fixture
+    scenario: Optional[Scenario]
+
+
+@dataclass(frozen=True)
+class ForecastCacheStats(object):
+    hits: int
+    misses: int
+    size: int
+
+
+class ForecastCache(object):
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.__clock = clock
+        self.__entries: OrderedDict[ForecastKey, Tuple[float, Prediction]] = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, key: ForecastKey) -> Optional[Prediction]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is None or entry[0] <= self.__clock():
+                if entry is not None:
+                    del self.__entries[key]
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: ForecastKey, prediction: Prediction, ttl_seconds: Optional[float] = None) -> None:
+        expires_at = self.__clock() + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+
+        with self.__lock:
+            self.__entries[key] = (expires_at, prediction)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def stats(self) -> ForecastCacheStats:
+        with self.__lock:
+            return ForecastCacheStats(hits=self.hits, misses=self.misses, size=len(self.__entries))
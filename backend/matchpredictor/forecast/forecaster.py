@@ -1,8 +1,11 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, List, Optional
 
+from matchpredictor.forecast.forecast_cache import ForecastCache, ForecastCacheStats, ForecastKey
 from matchpredictor.matchresults.result import Fixture, Team, Outcome, Scenario
-from matchpredictor.model.model_provider import ModelProvider
+from matchpredictor.model.model_provider import Model, ModelProvider
+from matchpredictor.predictors.predictor import InProgressPredictor, Prediction, ScorelinePredictor
+from matchpredictor.predictors.scorelines import ScorelineMarkets, ScorelineProbability
 
 
 @dataclass(frozen=True)
@@ -13,23 +16,39 @@ class Forecast(object):
     confidence: Optional[float]
 
 
+@dataclass(frozen=True)
+class ScorelineForecast(object):
+    fixture: Fixture
+    model_name: str
+    scenario: Scenario
+    markets: ScorelineMarkets
+    # Only the likely full time scores, most likely first.
+    scorelines: List[ScorelineProbability]
+
+
 def fixture_is_invalid(fixture: Fixture) -> bool:
     return fixture.home_team.name == fixture.away_team.name
 
 
+def scenario_is_invalid(scenario: Scenario) -> bool:
+    return scenario.home_goals < 0 or scenario.away_goals < 0
+
+
 class Forecaster:
-    def __init__(self, model_provider: ModelProvider) -> None:
+    def __init__(self, model_provider: ModelProvider, cache: Optional[ForecastCache] = None) -> None:
         self.__model_provider = model_provider
+        self.__cache = cache
 
     def forecast(self, fixture: Fixture, model_name: str) -> Optional[Forecast]:
         if fixture_is_invalid(fixture):
             return None
 
-        predictor = self.__model_provider.get_predictor(model_name)
-        if predictor is None:
+        model = self.__model_provider.get_model(model_name)
+        if model is None:
             return None
 
-        prediction = predictor.predict(fixture)
+        predictor = model.predictor
+        prediction = self.__cached(model, fixture, None, lambda: predictor.predict(fixture))
 
         return Forecast(
             fixture=fixture,
@@ -38,15 +57,51 @@ class Forecaster:
             confidence=prediction.confidence
         )
 
+    def forecast_batch(self, fixtures: List[Fixture], model_name: str) -> Optional[List[Optional[Forecast]]]:
+        """One forecast per fixture, in order, with None for fixtures that cannot be forecast."""
+        model = self.__model_provider.get_model(model_name)
+        if model is None:
+            return None
+
+        predictions = [
+            None if fixture_is_invalid(fixture) else self.__lookup(model, fixture, None) for fixture in fixtures
+        ]
+        missing = [
+            fixture for fixture, prediction in zip(fixtures, predictions)
+            if prediction is None and not fixture_is_invalid(fixture)
+        ]
+
+        if missing:
+            computed = iter(model.predictor.predict_batch(missing))
+            for index, fixture in enumerate(fixtures):
+                if predictions[index] is None and not fixture_is_invalid(fixture):
+                    predictions[index] = self.__store(model, fixture, None, next(computed))
+
+        return [
+            None if prediction is None else Forecast(
+                fixture=fixture,
+                model_name=model_name,
+                outcome=prediction.outcome,
+                confidence=prediction.confidence
+            )
+            for fixture, prediction in zip(fixtures, predictions)
+        ]
+
     def forecast_in_progress(self, fixture: Fixture, scenario: Scenario, model_name: str) -> Optional[Forecast]:
         if fixture_is_invalid(fixture):
             return None
 
-        predictor = self.__model_provider.get_in_progress_predictor(model_name)
-        if predictor is None:
+        model = self.__model_provider.get_model(model_name)
+        if model is None:
             return None
 
-        prediction = predictor.predict_in_progress(fixture, scenario)
+        if not isinstance(model.predictor, InProgressPredictor):
+            return None
+        in_progress_predictor: InProgressPredictor = model.predictor
+
+        prediction = self.__cached(
+            model, fixture, scenario, lambda: in_progress_predictor.predict_in_progress(fixture, scenario)
+        )
 
         return Forecast(
             fixture=fixture,
@@ -54,3 +109,54 @@ class Forecaster:
             outcome=prediction.outcome,
             confidence=prediction.confidence
         )
+
+    def forecast_scorelines(
+        self, fixture: Fixture, scenario: Scenario, model_name: str
+    ) -> Optional[ScorelineForecast]:
+        if fixture_is_invalid(fixture) or scenario_is_invalid(scenario):
+            return None
+
+        model = self.__model_provider.get_model(model_name)
+        if model is None or not isinstance(model.predictor, ScorelinePredictor):
+            return None
+
+        distribution = model.predictor.predict_scorelines(fixture, scenario)
+        if distribution is None:
+            return None
+
+        return ScorelineForecast(
+            fixture=fixture,
+            model_name=model_name,
+            scenario=scenario,
+            markets=distribution.markets(),
+            scorelines=distribution.scorelines(),
+        )
+
+    def cache_stats(self) -> Optional[ForecastCacheStats]:
+        if self.__cache is None:
+            return None
+
+        return self.__cache.stats()
+
+    def __cached(
+        self, model: Model, fixture: Fixture, scenario: Optional[Scenario], predict: Callable[[], Prediction]
+    ) -> Prediction:
+        prediction = self.__lookup(model, fixture, scenario)
+        if prediction is not None:
+            return prediction
+
+        return self.__store(model, fixture, scenario, predict())
+
+    def __lookup(self, model: Model, fixture: Fixture, scenario: Optional[Scenario]) -> Optional[Prediction]:
+        if self.__cache is None or model.cache_seconds == 0:
+            return None
+
+        return self.__cache.get(ForecastKey(model.name, model.version, fixture, scenario))
+
+    def __store(
+        self, model: Model, fixture: Fixture, scenario: Optional[Scenario], prediction: Prediction
+    ) -> Prediction:
+        if self.__cache is not None and model.cache_seconds != 0:
+            self.__cache.put(ForecastKey(model.name, model.version, fixture, scenario), prediction, model.cache_seconds)
+
+        return prediction
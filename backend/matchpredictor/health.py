@@ -1,11 +1,20 @@
-from flask import Blueprint, jsonify, Response
+from flask import Blueprint, jsonify, make_response, Response
 
+from matchpredictor.model.model_provider import ModelProvider
 
-def health_api() -> Blueprint:
+
+def health_api(model_provider: ModelProvider) -> Blueprint:
     api = Blueprint("health_api", __name__)
 
     @api.route("/", methods=["GET"])
     def health() -> Response:
-        return jsonify({"status": "UP"})
+        return jsonify({"status": "UP", "models": model_provider.readiness()})
+
+    @api.route("/ready", methods=["GET"])
+    def ready() -> Response:
+        models = model_provider.readiness()
+        ready = all(state == "ready" for state in models.values())
+
+        return make_response(jsonify({"ready": ready, "models": models}), 200 if ready else 503)
 
     return api
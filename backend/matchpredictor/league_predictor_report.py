@@ -1,17 +1,27 @@
+import os
+import re
+
 from matchpredictor.app import build_model_provider
 from matchpredictor.evaluation.reporter import Reporter
-from matchpredictor.matchresults.result import Result
-from matchpredictor.matchresults.results_provider import training_results, validation_results
+from matchpredictor.matchresults.results_provider import ResultsSplit, load_splits
 
 
 def predictor_report_for(league: str, year: int) -> None:
-    def matches_league(result: Result) -> bool:
-        return result.fixture.league == league
-
     csv_location = 'https://projects.fivethirtyeight.com/soccer-api/club/spi_matches.csv'
-    training_data = training_results(csv_location, year,
-                                     lambda result: result.season >= year - 3 and matches_league(result))
-    validation_data = validation_results(csv_location, year, matches_league)
+    csv_cache_location = 'csv-cache'
+    leagues = frozenset([league])
+    splits = load_splits(csv_location, {
+        "training": ResultsSplit(first_season=year - 3, before_season=year, leagues=leagues),
+        "validation": ResultsSplit(first_season=year, before_season=year + 1, leagues=leagues),
+    }, csv_cache_location)
+    training_data = splits["training"]
+    validation_data = splits["validation"]
 
-    Reporter(f"{league} {year}", validation_data, build_model_provider(training_data)) \
-        .run_report()
+    title = f"{league} {year}"
+    Reporter(
+        title,
+        validation_data,
+        build_model_provider(training_data),
+        workers=os.cpu_count() or 1,
+        json_location=os.path.join("reports", re.sub(r"[^a-z0-9]+", "-", title.lower()) + ".json"),
+    ).run_report()
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Callable, Dict, Iterable, Optional
+
+import requests
+
+from matchpredictor.matchresults.results_frame import ResultsFrame
+
+
+class ResultsCache(object):
+    def __init__(self, location: str) -> None:
+        self.location = location
+
+    def frame(self, csv_location: str, parse: Callable[[Iterable[str]], ResultsFrame]) -> ResultsFrame:
+        directory = os.path.join(self.location, hashlib.sha256(csv_location.encode()).hexdigest()[:16])
+        validators = self.__read_validators(directory)
+
+        try:
+            response = requests.get(csv_location, headers=self.__conditional_headers(validators), stream=True)
+        except requests.RequestException:
+            if validators is None:
+                raise
+            return ResultsFrame.load(directory)
+
+        with response:
+            # A 304 confirms the snapshot is current, and any other failure falls back to it.
+            if response.status_code != 200 and validators is not None:
+                return ResultsFrame.load(directory)
+
+            if response.encoding is None:
+                response.encoding = "utf-8"
+            frame = parse(response.iter_lines(decode_unicode=True))
+
+        if response.status_code == 200:
+            self.__write_snapshot(directory, frame, {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            })
+
+        return frame
+
+    @staticmethod
+    def __conditional_headers(validators: Optional[Dict[str, Optional[str]]]) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if validators is None:
+            return headers
+
+        etag = validators.get("etag")
+        last_modified = validators.get("last_modified")
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+
+        return headers
+
+    @staticmethod
+    def __read_validators(directory: str) -> Optional[Dict[str, Optional[str]]]:
+        try:
+            with open(os.path.join(directory, "validators.json")) as validators_file:
+                validators: Dict[str, Optional[str]] = json.load(validators_file)
+                return validators
+        except (OSError, ValueError):
+            return None
+
+    def __write_snapshot(self, directory: str, frame: ResultsFrame, validators: Dict[str, Optional[str]]) -> None:
+        os.makedirs(self.location, exist_ok=True)
+        staging_directory = tempfile.mkdtemp(dir=self.location)
+
+        frame.save(staging_directory)
+        with open(os.path.join(staging_directory, "validators.json"), "w") as validators_file:
+            json.dump(validators, validators_file)
+
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(staging_directory, directory)
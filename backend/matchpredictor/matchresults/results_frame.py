@@ -0,0 +1,226 @@
+import os
+from dataclasses import dataclass, fields, replace
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeAlias
+
+import numpy as np
+from numpy import bool_, float32, float64, int8, int16, int32
+from numpy.typing import NDArray
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+
+outcome_codes = [Outcome.HOME, Outcome.AWAY, Outcome.DRAW]
+
+feature_columns = [
+    "home_importance",
+    "away_importance",
+    "home_spi",
+    "away_spi",
+    "home_xg",
+    "away_xg",
+    "home_nsxg",
+    "away_nsxg",
+]
+
+
+@dataclass(frozen=True, eq=False)
+class ResultsFrame(object):
+    team_names: NDArray[np.str_]
+    leagues: NDArray[np.str_]
+    home_team: NDArray[int32]
+    away_team: NDArray[int32]
+    league: NDArray[int32]
+    season: NDArray[int16]
+    home_goals: NDArray[int16]
+    away_goals: NDArray[int16]
+    outcome: NDArray[int8]
+    home_importance: NDArray[float32]
+    away_importance: NDArray[float32]
+    home_spi: NDArray[float32]
+    away_spi: NDArray[float32]
+    home_xg: NDArray[float32]
+    away_xg: NDArray[float32]
+    home_nsxg: NDArray[float32]
+    away_nsxg: NDArray[float32]
+
+    @staticmethod
+    def of(results: Iterable[Result]) -> "ResultsFrame":
+        if isinstance(results, ResultsFrame):
+            return results
+
+        return ResultsFrame.from_results(results)
+
+    @staticmethod
+    def from_results(results: Iterable[Result]) -> "ResultsFrame":
+        result_list = list(results)
+
+        def feature(name: str) -> NDArray[float32]:
+            values = [getattr(r.fixture, name) for r in result_list]
+            return np.array([np.nan if v is None else v for v in values], dtype=float32)
+
+        return ResultsFrame.from_columns(
+            home_team_names=[r.fixture.home_team.name for r in result_list],
+            away_team_names=[r.fixture.away_team.name for r in result_list],
+            league_names=[r.fixture.league for r in result_list],
+            season=np.array([r.season for r in result_list], dtype=int16),
+            home_goals=np.array([r.home_goals for r in result_list], dtype=int16),
+            away_goals=np.array([r.away_goals for r in result_list], dtype=int16),
+            features={name: feature(name) for name in feature_columns},
+        )
+
+    @staticmethod
+    def from_columns(
+        home_team_names: List[str],
+        away_team_names: List[str],
+        league_names: List[str],
+        season: NDArray[int16],
+        home_goals: NDArray[int16],
+        away_goals: NDArray[int16],
+        features: Dict[str, NDArray[float32]],
+    ) -> "ResultsFrame":
+        team_names, team_codes = np.unique(
+            np.array(home_team_names + away_team_names, dtype=str), return_inverse=True
+        )
+        leagues, league_codes = np.unique(np.array(league_names, dtype=str), return_inverse=True)
+        home_team, away_team = np.split(team_codes.astype(int32), 2)
+
+        return ResultsFrame(
+            team_names=team_names,
+            leagues=leagues,
+            home_team=home_team,
+            away_team=away_team,
+            league=league_codes.astype(int32),
+            season=season,
+            home_goals=home_goals,
+            away_goals=away_goals,
+            outcome=outcome_from_goals(home_goals, away_goals),
+            **features,
+        )
+
+    @staticmethod
+    def load(directory: str) -> "ResultsFrame":
+        columns: Dict[str, Any] = {
+            field.name: np.load(os.path.join(directory, f"{field.name}.npy"), mmap_mode="r")
+            for field in fields(ResultsFrame)
+        }
+        return ResultsFrame(**columns)
+
+    def save(self, directory: str) -> None:
+        for field in fields(self):
+            np.save(os.path.join(directory, f"{field.name}.npy"), getattr(self, field.name))
+
+    @cached_property
+    def team_ids(self) -> Dict[str, int]:
+        return {str(name): team_id for team_id, name in enumerate(self.team_names)}
+
+    def team_id(self, team: Team) -> Optional[int]:
+        return self.team_ids.get(team.name)
+
+    def filter(self, mask: NDArray[bool_]) -> "ResultsFrame":
+        return self.__rows(mask)
+
+    def results(self) -> List[Result]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.outcome)
+
+    def __getitem__(self, rows: slice) -> "ResultsFrame":
+        return self.__rows(rows)
+
+    def __add__(self, other: "ResultsFrame") -> "ResultsFrame":
+        def concatenated(name: str) -> Any:
+            return np.concatenate([getattr(self, name), getattr(other, name)])
+
+        team_names, team_codes = np.unique(
+            np.concatenate([self.team_names, other.team_names]), return_inverse=True
+        )
+        own_teams, other_teams = np.split(team_codes.astype(int32), [len(self.team_names)])
+
+        leagues, league_codes = np.unique(
+            np.concatenate([self.leagues, other.leagues]), return_inverse=True
+        )
+        own_leagues, other_leagues = np.split(league_codes.astype(int32), [len(self.leagues)])
+
+        return ResultsFrame(
+            team_names=team_names,
+            leagues=leagues,
+            home_team=np.concatenate([own_teams[self.home_team], other_teams[other.home_team]]),
+            away_team=np.concatenate([own_teams[self.away_team], other_teams[other.away_team]]),
+            league=np.concatenate([own_leagues[self.league], other_leagues[other.league]]),
+            **{name: concatenated(name) for name in row_columns if name not in coded_columns},
+        )
+
+    def __rows(self, rows: NDArray[bool_] | slice) -> "ResultsFrame":
+        # Only the teams and leagues the rows use are kept, so a team without a match
+        # in them is unknown, just as it would be to a list of the same results.
+        columns = {name: getattr(self, name)[rows] for name in row_columns}
+
+        used_teams, team_codes = np.unique(
+            np.concatenate([columns["home_team"], columns["away_team"]]), return_inverse=True
+        )
+        home_team, away_team = np.split(team_codes.astype(int32), 2)
+        used_leagues, league_codes = np.unique(columns["league"], return_inverse=True)
+
+        return replace(
+            self,
+            **{
+                **columns,
+                "team_names": self.team_names[used_teams],
+                "leagues": self.leagues[used_leagues],
+                "home_team": home_team,
+                "away_team": away_team,
+                "league": league_codes.astype(int32),
+            },
+        )
+
+    def __iter__(self) -> Iterator[Result]:
+        teams = [Team(str(name)) for name in self.team_names]
+        leagues = [str(league) for league in self.leagues]
+        features = zip(*[decimal_values(getattr(self, name)) for name in feature_columns])
+
+        for home_team, away_team, league, outcome, home_goals, away_goals, season, fixture_features in zip(
+            self.home_team.tolist(),
+            self.away_team.tolist(),
+            self.league.tolist(),
+            self.outcome.tolist(),
+            self.home_goals.tolist(),
+            self.away_goals.tolist(),
+            self.season.tolist(),
+            features,
+        ):
+            yield Result(
+                fixture=Fixture(
+                    home_team=teams[home_team],
+                    away_team=teams[away_team],
+                    league=leagues[league],
+                    **dict(zip(feature_columns, fixture_features)),
+                ),
+                outcome=outcome_codes[outcome],
+                home_goals=home_goals,
+                away_goals=away_goals,
+                season=season,
+            )
+
+
+FrameFilter: TypeAlias = Callable[[ResultsFrame], NDArray[bool_]]
+
+coded_columns = ["home_team", "away_team", "league"]
+
+row_columns = [field.name for field in fields(ResultsFrame) if field.name not in ["team_names", "leagues"]]
+
+
+def outcome_from_goals(home_goals: NDArray[int16], away_goals: NDArray[int16]) -> NDArray[int8]:
+    outcome: NDArray[int8] = np.select(
+        [home_goals > away_goals, home_goals < away_goals],
+        [outcome_codes.index(Outcome.HOME), outcome_codes.index(Outcome.AWAY)],
+        outcome_codes.index(Outcome.DRAW),
+    ).astype(int8)
+    return outcome
+
+
+def decimal_values(column: NDArray[float32]) -> List[Optional[float]]:
+    # Going through the shortest float32 string gives back the decimal that was
+    # parsed, so materialised fixtures carry 53.57 rather than 53.569999694...
+    values: List[float] = column.astype(str).astype(float64).tolist()
+    return [None if np.isnan(v) else v for v in values]
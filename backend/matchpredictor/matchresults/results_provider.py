@@ -1,71 +1,182 @@
 import csv
-from typing import Callable, Dict, List, Optional, cast
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
+import numpy as np
 import requests
+from numpy import bool_, float32, int16
+from numpy.typing import NDArray
 
-from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.matchresults.result import Result
+from matchpredictor.matchresults.results_cache import ResultsCache
+from matchpredictor.matchresults.results_frame import ResultsFrame, feature_columns
+
+
+@dataclass(frozen=True)
+class ResultsSplit(object):
+    """The rows to keep from the CSV, by season range and league.
+
+    Splits are checked against the raw CSV columns, so rows outside every
+    split are dropped before any of their values are parsed.
+    """
+    first_season: Optional[int] = None
+    before_season: Optional[int] = None
+    leagues: Optional[FrozenSet[str]] = None
+
+    def keeps_row(self, row: Dict[str, str]) -> bool:
+        if self.leagues is not None and row.get("league") not in self.leagues:
+            return False
+
+        if self.first_season is None and self.before_season is None:
+            return True
+
+        try:
+            season = int(row["season"].strip())
+        except (KeyError, ValueError, AttributeError):
+            return False
+
+        return (self.first_season is None or season >= self.first_season) \
+            and (self.before_season is None or season < self.before_season)
+
+    def keeps(self, frame: ResultsFrame) -> NDArray[bool_]:
+        rows: NDArray[bool_] = np.ones(len(frame), dtype=bool_)
+
+        if self.first_season is not None:
+            rows &= frame.season >= self.first_season
+        if self.before_season is not None:
+            rows &= frame.season < self.before_season
+        if self.leagues is not None:
+            rows &= np.isin(frame.leagues, list(self.leagues))[frame.league]
+
+        return rows
 
 
 def training_results(
     csv_location: str,
     year: int,
     result_filter: Callable[[Result], bool] = lambda result: True,
+    cache_location: Optional[str] = None,
 ) -> List[Result]:
-    return load_results(csv_location, lambda r: result_filter(r) and r.season < year)
+    frame = load_frame(csv_location, ResultsSplit(before_season=year), cache_location)
+    return [r for r in frame if result_filter(r)]
 
 
 def validation_results(
     csv_location: str,
     year: int,
     result_filter: Callable[[Result], bool] = lambda result: True,
+    cache_location: Optional[str] = None,
 ) -> List[Result]:
-    return load_results(csv_location, lambda r: result_filter(r) and r.season == year)
+    frame = load_frame(csv_location, ResultsSplit(first_season=year, before_season=year + 1), cache_location)
+    return [r for r in frame if result_filter(r)]
 
 
 def load_results(
     csv_location: str,
     result_filter: Callable[[Result], bool] = lambda result: True,
+    cache_location: Optional[str] = None,
 ) -> List[Result]:
-    def match_outcome(home_goals: int, away_goals: int) -> Outcome:
-        if home_goals > away_goals:
-            return Outcome.HOME
-        if away_goals > home_goals:
-            return Outcome.AWAY
-        return Outcome.DRAW
-
-    def result_from_row(row: Dict[str, str]) -> Optional[Result]:
+    return [r for r in load_frame(csv_location, cache_location=cache_location) if result_filter(r)]
+
+
+def load_frame(
+    csv_location: str,
+    split: ResultsSplit = ResultsSplit(),
+    cache_location: Optional[str] = None,
+) -> ResultsFrame:
+    return load_splits(csv_location, {"results": split}, cache_location)["results"]
+
+
+def load_splits(
+    csv_location: str,
+    splits: Dict[str, ResultsSplit],
+    cache_location: Optional[str] = None,
+) -> Dict[str, ResultsFrame]:
+    if cache_location is not None:
+        frame = ResultsCache(cache_location).frame(csv_location, parse_lines)
+        return {name: frame.filter(split.keeps(frame)) for name, split in splits.items()}
+
+    with requests.get(csv_location, stream=True) as response:
+        return parse_splits(response_lines(response), splits)
+
+
+def response_lines(response: requests.Response) -> Iterable[str]:
+    if response.encoding is None:
+        response.encoding = "utf-8"
+
+    line: str
+    for line in response.iter_lines(decode_unicode=True):
+        yield line
+
+
+csv_columns: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "home_team_names": ("team1", str),
+    "away_team_names": ("team2", str),
+    "league_names": ("league", str),
+    "season": ("season", lambda value: int(value.strip())),
+    "home_goals": ("score1", int),
+    "away_goals": ("score2", int),
+    "home_importance": ("importance1", float),
+    "away_importance": ("importance2", float),
+    "home_spi": ("spi1", float),
+    "away_spi": ("spi2", float),
+    "home_xg": ("xg1", float),
+    "away_xg": ("xg2", float),
+    "home_nsxg": ("nsxg1", float),
+    "away_nsxg": ("nsxg2", float),
+}
+
+
+class FrameBuilder(object):
+    """Collects parsed rows into compact typed columns until the frame is built."""
+
+    def __init__(self) -> None:
+        self.names: Dict[str, List[str]] = {"home_team_names": [], "away_team_names": [], "league_names": []}
+        self.numbers: Dict[str, "array[Any]"] = {
+            "season": array("h"),
+            "home_goals": array("h"),
+            "away_goals": array("h"),
+            **{name: array("f") for name in feature_columns},
+        }
+
+    def append(self, row: Dict[str, str]) -> None:
         try:
-            home_goals = int(row["score1"])
-            away_goals = int(row["score2"])
-
-            return Result(
-                fixture=Fixture(
-                    home_team=Team(row["team1"]),
-                    away_team=Team(row["team2"]),
-                    home_importance=float(row["importance1"]),
-                    away_importance=float(row["importance2"]),
-                    home_spi=float(row["spi1"]),
-                    away_spi=float(row["spi2"]),
-                    home_xg=float(row["xg1"]),
-                    away_xg=float(row["xg2"]),
-                    home_nsxg=float(row["nsxg1"]),
-                    away_nsxg=float(row["nsxg2"]),
-                    league=row["league"],
-                ),
-                outcome=match_outcome(home_goals, away_goals),
-                home_goals=home_goals,
-                away_goals=away_goals,
-                season=int(row["season"].strip()),
-            )
-        except (KeyError, ValueError):
-            return None
-
-    training_data = requests.get(csv_location).text
-
-    rows = csv.DictReader(training_data.splitlines())
-
-    results = filter(
-        lambda r: type(r) is Result and result_filter(r), map(result_from_row, rows)
-    )
-
-    return cast(List[Result], list(results))
+            values = [(name, parse(row[csv_name])) for name, (csv_name, parse) in csv_columns.items()]
+        except (KeyError, ValueError, TypeError, AttributeError):
+            return
+
+        for name, value in values:
+            if name in self.names:
+                self.names[name].append(value)
+            else:
+                self.numbers[name].append(value)
+
+    def frame(self) -> ResultsFrame:
+        def column(name: str, dtype: Any) -> NDArray[Any]:
+            return np.frombuffer(self.numbers[name], dtype=dtype).copy()
+
+        return ResultsFrame.from_columns(
+            home_team_names=self.names["home_team_names"],
+            away_team_names=self.names["away_team_names"],
+            league_names=self.names["league_names"],
+            season=column("season", int16),
+            home_goals=column("home_goals", int16),
+            away_goals=column("away_goals", int16),
+            features={name: column(name, float32) for name in feature_columns},
+        )
+
+
+def parse_splits(lines: Iterable[str], splits: Dict[str, ResultsSplit]) -> Dict[str, ResultsFrame]:
+    builders = {name: FrameBuilder() for name in splits}
+
+    for row in csv.DictReader(lines):
+        for name, split in splits.items():
+            if split.keeps_row(row):
+                builders[name].append(row)
+
+    return {name: builder.frame() for name, builder in builders.items()}
+
+
+def parse_lines(lines: Iterable[str]) -> ResultsFrame:
+    return parse_splits(lines, {"results": ResultsSplit()})["results"]
@@ -0,0 +1,51 @@
+import hmac
+from typing import Any, Dict
+
+from flask import Blueprint, Response, jsonify, request
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.model.model_provider import ModelProvider
+
+
+def result_from_json(result_json: Dict[str, Any]) -> Result:
+    names = [result_json["home_name"], result_json["away_name"], result_json["league"]]
+    goals = [result_json["home_goals"], result_json["away_goals"], result_json["season"]]
+    if not all(isinstance(name, str) for name in names) or not all(type(number) is int for number in goals):
+        raise TypeError("Result names must be strings and goals and season integers")
+
+    home_goals, away_goals, season = goals
+    if home_goals < 0 or away_goals < 0:
+        raise ValueError("Goals cannot be negative")
+
+    return Result(
+        fixture=Fixture(home_team=Team(name=names[0]), away_team=Team(name=names[1]), league=names[2]),
+        outcome=Outcome.HOME if home_goals > away_goals else Outcome.AWAY if home_goals < away_goals else Outcome.DRAW,
+        home_goals=home_goals,
+        away_goals=away_goals,
+        season=season,
+    )
+
+
+def ingest_api(model_provider: ModelProvider, token: str) -> Blueprint:
+    """Lets a scheduled job hand new results to the running models, which learn
+    from them without a restart. Requests carry the token as a bearer token.
+    """
+    api = Blueprint("ingest_api", __name__)
+
+    @api.route("/results", methods=["POST"])
+    def ingest() -> Response:
+        authorization = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(authorization.encode(), f"Bearer {token}".encode()):
+            return Response("Not authorized", 401)
+
+        body: Any = request.get_json(silent=True)
+        try:
+            results = [result_from_json(r) for r in body["results"]]
+        except (KeyError, TypeError, ValueError):
+            return Response("Cannot read results", 400)
+
+        model_provider.ingest(results)
+
+        return jsonify({"ingested": len(results)})
+
+    return api
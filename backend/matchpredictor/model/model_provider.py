@@ -1,26 +1,141 @@
-from dataclasses import dataclass
-from typing import Dict, Optional, List
+import hashlib
+import logging
+import os
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, replace
+from functools import partial
+from threading import Lock
+from typing import Callable, Dict, Iterable, Optional, List, Sequence, Tuple
 
+from matchpredictor.matchresults.result import Result
+from matchpredictor.matchresults.results_frame import ResultsFrame
+from matchpredictor.model.model_store import results_fingerprint
+from matchpredictor.model.training import train_concurrently
 from matchpredictor.predictors.predictor import Predictor, InProgressPredictor
 
+logger = logging.getLogger(__name__)
+
+
+class ModelNotReady(Exception):
+    """Raised for a model that is still training, or whose training failed and is being retried."""
+
+    def __init__(self, model_name: str) -> None:
+        super().__init__(f"Model {model_name} is not ready")
+        self.model_name = model_name
+
 
 @dataclass(frozen=True)
 class Model(object):
     name: str
     predictor: Predictor | InProgressPredictor
+    version: str = ""
+    # How long a forecast may be served from the cache: None uses the cache's
+    # own TTL and 0 turns caching off, which suits stochastic predictors.
+    cache_seconds: Optional[float] = None
 
     def predicts_in_progress(self) -> bool:
         return isinstance(self.predictor, InProgressPredictor)
 
 
+@dataclass(frozen=True)
+class PendingModel(object):
+    """A model that is trained, or loaded from the store, the first time it is needed."""
+    name: str
+    train: Callable[[], Model]
+    in_progress: bool = False
+
+    def predicts_in_progress(self) -> bool:
+        return self.in_progress
+
+
 class ModelProvider(object):
-    def __init__(self, models: List[Model]) -> None:
+    """The models, by name. Pending models are trained on an executor from
+    executor_factory, or in the calling thread without one. Asking for a model
+    that is not trained yet raises ModelNotReady rather than waiting, and a model
+    whose training failed is trained again the next time it is asked for.
+    """
+
+    def __init__(
+        self,
+        models: Sequence[Model | PendingModel],
+        executor_factory: Optional[Callable[[], Executor]] = None,
+    ) -> None:
+        self.__names = [model.name for model in models]
         self.__models: Dict[str, Model] = {}
+        self.__pending: Dict[str, PendingModel] = {}
         for model in models:
-            self.__models[model.name] = model
+            if isinstance(model, PendingModel):
+                self.__pending[model.name] = model
+            else:
+                self.__models[model.name] = model
 
-    def get_predictor(self, model_name: str) -> Optional[Predictor]:
+        self.__executor_factory = executor_factory
+        self.__executor: Optional[Executor] = None
+        self.__executor_pid: Optional[int] = None
+        self.__training: Dict[str, Future[Model]] = {}
+        self.__training_lock = Lock()
+        self.__ingest_lock = Lock()
+        # Results ingested while some models are still to be trained, with their fingerprint.
+        self.__ingested_results: Optional[Tuple[ResultsFrame, str]] = None
+
+    def warm_up(self) -> None:
+        self.__start(list(self.__pending))
+
+    def readiness(self) -> Dict[str, str]:
+        with self.__training_lock:
+            self.__executor_in_this_process()
+
+        def state(name: str) -> str:
+            if name in self.__models:
+                return "ready"
+
+            future = self.__training.get(name)
+            if future is None:
+                return "pending"
+            if _failed(future):
+                return "failed"
+            return "training"
+
+        return {name: state(name) for name in self.__names}
+
+    def catalog(self) -> List[Model | PendingModel]:
+        """Every model, without waiting for the pending ones."""
+        return [self.__models.get(name) or self.__pending[name] for name in self.__names]
+
+    def ingest(self, results: Iterable[Result]) -> None:
+        """Update every model that can learn incrementally with new results.
+
+        Updated predictors are copies, and they all replace the current ones in a
+        single swap, so requests already holding a predictor keep a consistent view.
+        Models that are not trained yet, or whose training failed, are given the
+        results once they are trained, so none of them misses them.
+        """
+        frame = ResultsFrame.of(results)
+        if len(frame) == 0:
+            return
+
+        fingerprint = results_fingerprint(frame)
+
+        with self.__ingest_lock:
+            self.__models = {
+                name: self.__ingested(model, frame, fingerprint) for name, model in self.__models.items()
+            }
+            if not self.__all_trained():
+                self.__ingested_results = _combined(self.__ingested_results, frame, fingerprint)
+
+    def get_model(self, model_name: str) -> Optional[Model]:
         model = self.__models.get(model_name)
+        if model is not None or model_name not in self.__pending:
+            return model
+
+        future = self.__start([model_name])[model_name]
+        if not future.done() or _failed(future):
+            raise ModelNotReady(model_name)
+
+        return future.result()
+
+    def get_predictor(self, model_name: str) -> Optional[Predictor]:
+        model = self.get_model(model_name)
 
         if model is None:
             return None
@@ -28,7 +143,7 @@ class ModelProvider(object):
         return model.predictor
 
     def get_in_progress_predictor(self, model_name: str) -> Optional[InProgressPredictor]:
-        model = self.__models.get(model_name)
+        model = self.get_model(model_name)
 
         if model is None or not isinstance(model.predictor, InProgressPredictor):
             return None
@@ -36,4 +151,94 @@ class ModelProvider(object):
         return model.predictor
 
     def list(self) -> List[Model]:
-        return list(self.__models.values())
+        """Every model, waiting for the pending ones. Models that fail to train are left out."""
+        futures = self.__start([name for name in self.__pending if name not in self.__models])
+
+        def trained(name: str) -> Optional[Model]:
+            model = self.__models.get(name)
+            if model is not None or name not in futures:
+                return model
+
+            try:
+                return futures[name].result()
+            except Exception:
+                return None
+
+        models = [trained(name) for name in self.__names]
+        return [model for model in models if model is not None]
+
+    def __start(self, names: List[str]) -> Dict[str, Future[Model]]:
+        with self.__training_lock:
+            executor = self.__executor_in_this_process()
+            futures = {
+                name: self.__training[name] for name in names
+                if name in self.__training and not _failed(self.__training[name])
+            }
+            started = train_concurrently(
+                {name: partial(self.__train, name) for name in names if name not in futures},
+                executor,
+            )
+            self.__training.update(started)
+
+        return {**futures, **started}
+
+    def __executor_in_this_process(self) -> Optional[Executor]:
+        """Pool threads do not survive a fork, so a process forked from the one that
+        built the executor, such as a server worker, builds its own. Training left
+        running in the parent never finishes here, so it is forgotten and started
+        again when the model is next asked for.
+        """
+        if self.__executor_factory is None:
+            return None
+
+        pid = os.getpid()
+        if self.__executor is None or self.__executor_pid != pid:
+            self.__executor = self.__executor_factory()
+            self.__executor_pid = pid
+            self.__training = {name: future for name, future in self.__training.items() if future.done()}
+
+        return self.__executor
+
+    def __train(self, name: str) -> Model:
+        try:
+            model = self.__pending[name].train()
+        except Exception:
+            logger.exception("Training %s failed", name)
+            raise
+
+        with self.__ingest_lock:
+            if self.__ingested_results is not None:
+                model = self.__ingested(model, *self.__ingested_results)
+            self.__models[name] = model
+            if self.__all_trained():
+                self.__ingested_results = None
+        return model
+
+    def __all_trained(self) -> bool:
+        return all(name in self.__models for name in self.__pending)
+
+    @staticmethod
+    def __ingested(model: Model, results: ResultsFrame, fingerprint: str) -> Model:
+        predictor = model.predictor.updated(results)
+        if predictor is model.predictor:
+            return model
+
+        version = hashlib.sha256(f"{model.version}:{fingerprint}".encode()).hexdigest()[:16]
+        return replace(model, predictor=predictor, version=version)
+
+
+def _combined(
+    ingested: Optional[Tuple[ResultsFrame, str]], frame: ResultsFrame, fingerprint: str
+) -> Tuple[ResultsFrame, str]:
+    if ingested is None:
+        return frame, fingerprint
+
+    ingested_frame, ingested_fingerprint = ingested
+    return (
+        ingested_frame + frame,
+        hashlib.sha256(f"{ingested_fingerprint}:{fingerprint}".encode()).hexdigest()[:16],
+    )
+
+
+def _failed(future: Future[Model]) -> bool:
+    return future.done() and future.exception() is not None
@@ -0,0 +1,127 @@
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import sys
+import tempfile
+from dataclasses import fields
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+import joblib  # type: ignore
+
+from matchpredictor.matchresults.result import Result
+from matchpredictor.matchresults.results_frame import ResultsFrame
+from matchpredictor.predictors.predictor import Predictor
+
+
+def results_fingerprint(results: Iterable[Result]) -> str:
+    digest = hashlib.sha256()
+    if isinstance(results, ResultsFrame):
+        for field in fields(results):
+            digest.update(getattr(results, field.name).tobytes())
+    else:
+        for result in results:
+            digest.update(repr(result).encode())
+
+    return digest.hexdigest()
+
+
+def training_modules(module_name: str) -> List[str]:
+    """The module and every predictor module it uses, directly or through other predictor modules."""
+    found = {module_name}
+    to_visit = [module_name]
+
+    while to_visit:
+        module = sys.modules.get(to_visit.pop())
+        for value in vars(module).values() if module is not None else []:
+            used = value.__name__ if isinstance(value, ModuleType) else getattr(value, "__module__", None)
+            if isinstance(used, str) and used.startswith("matchpredictor.predictors") and used not in found:
+                found.add(used)
+                to_visit.append(used)
+
+    return sorted(found)
+
+
+@lru_cache(maxsize=None)
+def training_code_fingerprint(module_name: str) -> str:
+    digest = hashlib.sha256()
+    for name in training_modules(module_name):
+        try:
+            digest.update(inspect.getsource(sys.modules[name]).encode())
+        except (OSError, TypeError):
+            digest.update(name.encode())
+
+    return digest.hexdigest()
+
+
+def model_version(data_fingerprint: str, trainer: Callable[..., Predictor], params: Tuple[Any, ...]) -> str:
+    # The training code is part of the version, so changing features or the
+    # hyperparameter grid retrains instead of loading a stale model.
+    digest = hashlib.sha256()
+    digest.update(data_fingerprint.encode())
+    digest.update(f"{trainer.__module__}.{trainer.__qualname__}".encode())
+    digest.update(training_code_fingerprint(trainer.__module__).encode())
+    digest.update(repr(params).encode())
+
+    return digest.hexdigest()[:16]
+
+
+class ModelStore(object):
+    def __init__(self, location: str) -> None:
+        self.location = location
+
+    def load(self, name: str, version: str) -> Optional[Predictor]:
+        path = self.__path(name, version)
+        if not os.path.exists(path):
+            return None
+
+        # Files written by an older version of a predictor class are retrained.
+        try:
+            predictor: Predictor = joblib.load(path, mmap_mode="r")
+        except (AttributeError, ImportError, EOFError, pickle.UnpicklingError):
+            return None
+
+        return predictor
+
+    def save(self, name: str, version: str, predictor: Predictor) -> None:
+        os.makedirs(self.location, exist_ok=True)
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.location, suffix=".tmp")
+        os.close(file_descriptor)
+        try:
+            joblib.dump(predictor, temporary_path)
+            os.replace(temporary_path, self.__path(name, version))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+        self.__remove_other_versions(name, version)
+
+    def load_or_train(self, name: str, version: str, train: Callable[[], Predictor]) -> Predictor:
+        predictor = self.load(name, version)
+        if predictor is not None:
+            return predictor
+
+        predictor = train()
+        self.save(name, version, predictor)
+
+        return predictor
+
+    def __path(self, name: str, version: str) -> str:
+        return os.path.join(self.location, f"{self.__slug(name)}-{version}.joblib")
+
+    def __remove_other_versions(self, name: str, version: str) -> None:
+        prefix = f"{self.__slug(name)}-"
+        current = os.path.basename(self.__path(name, version))
+
+        for file_name in os.listdir(self.location):
+            if file_name.startswith(prefix) and file_name.endswith(".joblib") and file_name != current:
+                if re.fullmatch(r"[0-9a-f]{16}\.joblib", file_name[len(prefix):]):
+                    os.remove(os.path.join(self.location, file_name))
+
+    @staticmethod
+    def __slug(name: str) -> str:
+        return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
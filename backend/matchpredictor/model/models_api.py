@@ -1,8 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
-from flask import Blueprint, jsonify, Response
+from flask import Blueprint, Response
 
-from matchpredictor.model.model_provider import ModelProvider
+from matchpredictor.cached_json import CachedJson
+from matchpredictor.model.model_provider import ModelNotReady, ModelProvider
 
 
 @dataclass(frozen=True)
@@ -11,13 +12,24 @@ class ModelInfo(object):
     predicts_in_progress: bool
 
 
+def model_not_ready(error: ModelNotReady) -> Response:
+    # Registered on the app, since every API that forecasts can ask for a model still training.
+    response = Response(f"Model {error.model_name} is not ready", 503)
+    response.headers["Retry-After"] = "10"
+    return response
+
+
 def models_api(model_provider: ModelProvider) -> Blueprint:
     api = Blueprint("models_api", __name__)
 
+    # Ingesting results replaces predictors but never adds, removes or renames models,
+    # and pending models declare whether they predict in progress before they are trained.
+    models_json = CachedJson({
+        "models": [asdict(ModelInfo(model.name, model.predicts_in_progress())) for model in model_provider.catalog()]
+    })
+
     @api.route("/models", methods=["GET"])
     def models() -> Response:
-        return jsonify({
-            "models": [ModelInfo(model.name, model.predicts_in_progress()) for model in model_provider.list()]
-        })
+        return models_json.response()
 
     return api
@@ -0,0 +1,57 @@
+from concurrent.futures import Executor, Future
+from threading import Lock
+from typing import Callable, Dict, Generic, Mapping, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SharedArtifact(Generic[T]):
+    """Training input shared by several models, built once by the first model that needs it.
+
+    Models loaded from the store never ask for it, so it is not built at all
+    when every model that uses it is already trained.
+    """
+
+    def __init__(self, build: Callable[[], T]) -> None:
+        self.__build = build
+        self.__value: Optional[T] = None
+        self.__lock = Lock()
+
+    def get(self) -> T:
+        with self.__lock:
+            if self.__value is None:
+                self.__value = self.__build()
+            return self.__value
+
+
+def train_concurrently(
+    trainers: Mapping[str, Callable[[], T]], executor: Optional[Executor] = None
+) -> Dict[str, Future[T]]:
+    """Starts every trainer on the executor and returns a future for each, by name.
+
+    Without an executor the trainers run one after another in the calling
+    thread, and the futures are already done when this returns. A thread pool
+    lets shared artifacts be handed to every trainer without copying, and the
+    heavy lifting happens in numpy and scikit-learn, which release the GIL.
+    """
+    futures: Dict[str, Future[T]] = {}
+    for name, train in trainers.items():
+        future: Future[T] = Future()
+        futures[name] = future
+
+        if executor is None:
+            _run(train, future)
+        else:
+            executor.submit(_run, train, future)
+
+    return futures
+
+
+def _run(train: Callable[[], T], future: Future[T]) -> None:
+    try:
+        result = train()
+    except Exception as e:
+        future.set_exception(e)
+        return
+
+    future.set_result(result)
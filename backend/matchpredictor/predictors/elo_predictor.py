@@ -0,0 +1,159 @@
+import copy
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+from numpy import float64, intp
+from numpy.typing import NDArray
+
+from matchpredictor.matchresults.result import Fixture, Result, Team
+from matchpredictor.matchresults.results_frame import ResultsFrame
+from matchpredictor.predictors.predictor import Prediction, Predictor
+from matchpredictor.predictors.simulation_predictor import most_likely_outcome
+
+initial_rating = 1500.0
+default_home_advantage = 65.0
+default_k_factors = (10.0, 15.0, 20.0, 25.0, 30.0, 40.0, 50.0)
+
+
+def expected_home_score(
+    home_ratings: NDArray[float64], away_ratings: NDArray[float64], home_advantage: float
+) -> NDArray[float64]:
+    expected: NDArray[float64] = 1 / (1 + 10 ** ((away_ratings - home_ratings - home_advantage) / 400))
+    return expected
+
+
+def goal_difference_weight(goal_difference: NDArray[float64]) -> NDArray[float64]:
+    # Wider wins move ratings further, as in the World Football Elo ratings.
+    margin = np.abs(goal_difference)
+    weight: NDArray[float64] = np.where(margin <= 1, 1.0, np.where(margin == 2, 1.5, (11 + margin) / 8))
+    return weight
+
+
+class EloRatings(object):
+    """Ratings in an array indexed by team ID, updated in place one result at a time."""
+
+    def __init__(self, k_factor: float, home_advantage: float = default_home_advantage, draw_rate: float = 0.25) -> None:
+        self.k_factor = k_factor
+        self.home_advantage = home_advantage
+        # The chance of a draw between evenly matched teams.
+        self.draw_rate = draw_rate
+        self.team_index: Dict[str, int] = {}
+        # Grown by doubling, with one spare entry at the end for unknown teams.
+        self.ratings: NDArray[float64] = np.full(16, initial_rating)
+
+    def team_id(self, team: Team) -> int:
+        return self.team_index.get(team.name, len(self.team_index))
+
+    def team_ids(self, teams: List[Team]) -> NDArray[intp]:
+        return np.array([self.team_id(team) for team in teams], dtype=intp)
+
+    def rating(self, team: Team) -> float:
+        return float(self.ratings[self.team_id(team)])
+
+    def record(self, home_team: Team, away_team: Team, home_goals: int, away_goals: int) -> None:
+        home = self.__intern(home_team)
+        away = self.__intern(away_team)
+
+        expected = 1 / (1 + 10 ** ((self.ratings[away] - self.ratings[home] - self.home_advantage) / 400))
+        score = 1.0 if home_goals > away_goals else 0.0 if home_goals < away_goals else 0.5
+        margin = abs(home_goals - away_goals)
+        weight = 1.0 if margin <= 1 else 1.5 if margin == 2 else (11 + margin) / 8
+
+        change = self.k_factor * weight * (score - expected)
+        self.ratings[home] += change
+        self.ratings[away] -= change
+
+    def add_results(self, results: Iterable[Result]) -> None:
+        for result in results:
+            self.record(result.fixture.home_team, result.fixture.away_team, result.home_goals, result.away_goals)
+
+    def outcome_probabilities(
+        self, home_ids: NDArray[intp], away_ids: NDArray[intp]
+    ) -> Tuple[NDArray[float64], NDArray[float64], NDArray[float64]]:
+        expected = expected_home_score(self.ratings[home_ids], self.ratings[away_ids], self.home_advantage)
+
+        # Draws are likeliest between even teams, and shared so the expected score stays the same.
+        draw = self.draw_rate * 4 * expected * (1 - expected)
+        return expected - draw / 2, 1 - expected - draw / 2, draw
+
+    def copy(self) -> "EloRatings":
+        ratings = copy.copy(self)
+        ratings.team_index = dict(self.team_index)
+        ratings.ratings = self.ratings.copy()
+        return ratings
+
+    def __intern(self, team: Team) -> int:
+        index = self.team_index.setdefault(team.name, len(self.team_index))
+
+        if index + 1 >= len(self.ratings):
+            grown = np.full(2 * len(self.ratings), initial_rating)
+            grown[:len(self.ratings)] = self.ratings
+            self.ratings = grown
+
+        return index
+
+
+def fit_elo(
+    frame: ResultsFrame,
+    k_factors: Sequence[float] = default_k_factors,
+    home_advantage: float = default_home_advantage,
+) -> EloRatings:
+    """Replays the results once for every candidate K-factor at the same time, and keeps
+    the ratings of the one whose expected scores had the lowest squared error.
+    """
+    candidates = np.array(k_factors, dtype=float64)
+    ratings = np.full((len(candidates), len(frame.team_names) + 1), initial_rating)
+    expected = np.zeros((len(candidates), len(frame)))
+
+    goal_difference = frame.home_goals.astype(float64) - frame.away_goals.astype(float64)
+    scores = (np.sign(goal_difference) + 1) / 2
+    steps = goal_difference_weight(goal_difference)[:, None] * candidates[None, :]
+
+    for match, (home, away) in enumerate(zip(frame.home_team.tolist(), frame.away_team.tolist())):
+        match_expected = 1 / (1 + 10 ** ((ratings[:, away] - ratings[:, home] - home_advantage) / 400))
+        change = steps[match] * (scores[match] - match_expected)
+        ratings[:, home] += change
+        ratings[:, away] -= change
+        expected[:, match] = match_expected
+
+    errors = ((scores[None, :] - expected) ** 2).sum(axis=1)
+    best = int(np.argmin(errors)) if len(frame) else 0
+
+    elo = EloRatings(float(candidates[best]), home_advantage, fit_draw_rate(scores, expected[best]))
+    elo.team_index = {name: index for index, name in enumerate(frame.team_names.tolist())}
+    elo.ratings = ratings[best]
+    return elo
+
+
+def fit_draw_rate(scores: NDArray[float64], expected: NDArray[float64]) -> float:
+    evenness = float((4 * expected * (1 - expected)).sum())
+    if evenness == 0:
+        return 0.25
+
+    return min(float((scores == 0.5).sum()) / evenness, 0.5)
+
+
+class EloPredictor(Predictor):
+    def __init__(self, ratings: EloRatings) -> None:
+        self.ratings = ratings
+
+    def predict(self, fixture: Fixture) -> Prediction:
+        return self.predict_batch([fixture])[0]
+
+    def predict_batch(self, fixtures: List[Fixture]) -> List[Prediction]:
+        home, away, draw = self.ratings.outcome_probabilities(
+            self.ratings.team_ids([fixture.home_team for fixture in fixtures]),
+            self.ratings.team_ids([fixture.away_team for fixture in fixtures]),
+        )
+
+        return [most_likely_outcome(h, a, d) for h, a, d in zip(home.tolist(), away.tolist(), draw.tolist())]
+
+    def updated(self, results: Iterable[Result]) -> Predictor:
+        ratings = self.ratings.copy()
+        ratings.add_results(results)
+
+        return EloPredictor(ratings)
+
+
+def train_elo_predictor(results: Iterable[Result]) -> Predictor:
+    return EloPredictor(fit_elo(ResultsFrame.of(results)))
@@ -1,31 +1,36 @@
-from typing import List, Optional, Tuple
+from typing import Iterable, Tuple
 
 import numpy as np
 from numpy import float64
 from numpy.typing import NDArray
+from scipy.sparse import hstack  # type: ignore
 from sklearn.linear_model import LogisticRegression  # type: ignore
-from sklearn.preprocessing import OneHotEncoder  # type: ignore
 
-from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.matchresults.result import Fixture, Outcome, Result
+from matchpredictor.matchresults.results_frame import ResultsFrame
 from matchpredictor.predictors.predictor import Prediction, Predictor
+from matchpredictor.predictors.team_encoding import TeamEncoding
 
 
 class LinearRegressionPredictor(Predictor):
-    def __init__(self, model: LogisticRegression, team_encoding: OneHotEncoder) -> None:
+    def __init__(self, model: LogisticRegression, team_encoding: TeamEncoding) -> None:
         self.model = model
         self.team_encoding = team_encoding
 
     def predict(self, fixture: Fixture) -> Prediction:
-        encoded_home_name = self.__encode_team(fixture.home_team)
-        encoded_away_name = self.__encode_team(fixture.away_team)
+        home_index = self.team_encoding.index_of(fixture.home_team)
+        away_index = self.team_encoding.index_of(fixture.away_team)
 
-        if encoded_home_name is None:
+        if home_index is None:
             return Prediction(outcome=Outcome.AWAY)
-        if encoded_away_name is None:
+        if away_index is None:
             return Prediction(outcome=Outcome.HOME)
 
-        x: NDArray[float64] = np.concatenate([encoded_home_name, encoded_away_name], 1)
-        pred = self.model.predict(x)
+        # With one-hot teams and no intercept, each class score is just the sum
+        # of the home and away team coefficients.
+        teams = len(self.team_encoding.team_index)
+        scores: NDArray[float64] = self.model.coef_[:, home_index] + self.model.coef_[:, teams + away_index]
+        pred = self.model.classes_[int(scores[0] > 0) if len(scores) == 1 else np.argmax(scores)]
 
         if pred > 0:
             return Prediction(outcome=Outcome.HOME)
@@ -34,30 +39,17 @@ class LinearRegressionPredictor(Predictor):
         else:
             return Prediction(outcome=Outcome.DRAW)
 
-    def __encode_team(self, team: Team) -> Optional[NDArray[float64]]:
-        try:
-            result: NDArray[float64] = self.team_encoding.transform(
-                np.array(team.name).reshape(-1, 1)
-            )
-            return result
-        except ValueError:
-            return None
 
+def build_model(results: Iterable[Result]) -> Tuple[LogisticRegression, TeamEncoding]:
+    frame = ResultsFrame.of(results)
 
-def build_model(results: List[Result]) -> Tuple[LogisticRegression, OneHotEncoder]:
-    home_names = np.array([r.fixture.home_team.name for r in results])
-    away_names = np.array([r.fixture.away_team.name for r in results])
-    home_goals = np.array([r.home_goals for r in results])
-    away_goals = np.array([r.away_goals for r in results])
+    team_encoding = TeamEncoding(frame.team_names)
 
-    team_names = np.array(list(home_names) + list(away_names)).reshape(-1, 1)
-    team_encoding = OneHotEncoder(sparse=False).fit(team_names)
-
-    encoded_home_names = team_encoding.transform(home_names.reshape(-1, 1))
-    encoded_away_names = team_encoding.transform(away_names.reshape(-1, 1))
-
-    x: NDArray[float64] = np.concatenate([encoded_home_names, encoded_away_names], 1)
-    y = np.sign(home_goals - away_goals)
+    x = hstack(
+        [team_encoding.encode(frame.home_team), team_encoding.encode(frame.away_team)],
+        format="csr",
+    )
+    y = np.sign(frame.home_goals.astype(np.int32) - frame.away_goals)
 
     model = LogisticRegression(
         penalty="l2", fit_intercept=False, multi_class="ovr", C=1
@@ -67,7 +59,7 @@ def build_model(results: List[Result]) -> Tuple[LogisticRegression, OneHotEncode
     return model, team_encoding
 
 
-def train_regression_predictor(results: List[Result]) -> Predictor:
+def train_regression_predictor(results: Iterable[Result]) -> Predictor:
     model, team_encoding = build_model(results)
 
     return LinearRegressionPredictor(model, team_encoding)
@@ -1,15 +1,19 @@
-from typing import Iterable, Dict
+from typing import Iterable
+
+import numpy as np
 
 from matchpredictor.matchresults.result import Outcome, Fixture, Result, Team
+from matchpredictor.matchresults.results_frame import ResultsFrame
 from matchpredictor.predictors.predictor import Predictor, Prediction
+from matchpredictor.predictors.team_counts import TeamCounts
 
 
 class PointsTable:
     def __init__(self) -> None:
-        self.points_dict: Dict[str, int] = {}
+        self.counts = TeamCounts("points")
 
     def points_for(self, team: Team) -> int:
-        return self.points_dict.get(team.name, 0)
+        return self.counts.count("points", team)
 
     def record_win(self, team: Team) -> None:
         self.__add_points(team, 3)
@@ -17,9 +21,21 @@ class PointsTable:
     def record_draw(self, team: Team) -> None:
         self.__add_points(team, 1)
 
+    def add_results(self, results: Iterable[Result]) -> None:
+        frame = ResultsFrame.of(results)
+
+        home_points = np.select([frame.home_goals > frame.away_goals, frame.home_goals == frame.away_goals], [3, 1], 0)
+        away_points = np.select([frame.away_goals > frame.home_goals, frame.home_goals == frame.away_goals], [3, 1], 0)
+
+        self.counts.add(frame, home={"points": home_points}, away={"points": away_points})
+
+    def copy(self) -> "PointsTable":
+        table = PointsTable()
+        table.counts = self.counts.copy()
+        return table
+
     def __add_points(self, team: Team, points: int) -> None:
-        previous_points = self.points_dict.get(team.name, 0)
-        self.points_dict[team.name] = previous_points + points
+        self.counts.increment("points", team, points)
 
 
 class PastResultsPredictor(Predictor):
@@ -37,18 +53,16 @@ class PastResultsPredictor(Predictor):
         else:
             return Prediction(Outcome.DRAW)
 
+    def updated(self, results: Iterable[Result]) -> Predictor:
+        table = self.table.copy()
+        table.add_results(results)
+
+        return PastResultsPredictor(table)
+
 
 def calculate_table(results: Iterable[Result]) -> PointsTable:
     table = PointsTable()
-
-    for result in results:
-        if result.outcome == Outcome.HOME:
-            table.record_win(result.fixture.home_team)
-        elif result.outcome == Outcome.AWAY:
-            table.record_win(result.fixture.away_team)
-        else:
-            table.record_draw(result.fixture.home_team)
-            table.record_draw(result.fixture.away_team)
+    table.add_results(results)
 
     return table
 
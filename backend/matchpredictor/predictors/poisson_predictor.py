@@ -0,0 +1,233 @@
+import math
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from numpy import float64, intp
+from numpy.typing import NDArray
+
+from matchpredictor.matchresults.result import Fixture, Result, Scenario, Team
+from matchpredictor.matchresults.results_frame import ResultsFrame
+from matchpredictor.predictors.predictor import Prediction, Predictor, ScorelinePredictor
+from matchpredictor.predictors.scorelines import ScorelineDistribution
+from matchpredictor.predictors.simulation_predictor import most_likely_outcome
+from matchpredictor.predictors.simulators.goal_distribution import OutcomeProbabilities
+
+match_minutes = 90
+max_goals = 10
+goals = np.arange(max_goals + 1)
+log_factorials = np.array([math.lgamma(k + 1) for k in goals])
+
+
+@dataclass(frozen=True)
+class PoissonStrengths(object):
+    """Fitted team strengths. A team's expected goals against an opponent are
+    goals_per_side * attack * the opponent's defence, times home_advantage at home.
+    """
+    team_index: Dict[str, int]
+    # Indexed by team ID, with one extra entry at the end for unknown teams.
+    attack: NDArray[float64]
+    defence: NDArray[float64]
+    goals_per_side: float
+    home_advantage: float
+    rho: float
+
+    def team_ids(self, teams: List[Team]) -> NDArray[intp]:
+        unknown = len(self.team_index)
+        return np.array([self.team_index.get(team.name, unknown) for team in teams], dtype=intp)
+
+    def expected_goals(self, fixtures: List[Fixture]) -> Tuple[NDArray[float64], NDArray[float64]]:
+        home_ids = self.team_ids([fixture.home_team for fixture in fixtures])
+        away_ids = self.team_ids([fixture.away_team for fixture in fixtures])
+
+        home_goals = self.goals_per_side * self.home_advantage * self.attack[home_ids] * self.defence[away_ids]
+        away_goals = self.goals_per_side * self.attack[away_ids] * self.defence[home_ids]
+        return home_goals, away_goals
+
+
+def fit_strengths(
+    frame: ResultsFrame, dixon_coles: bool, iterations: int = 50, prior_matches: float = 1.0
+) -> PoissonStrengths:
+    # Alternating maximum likelihood updates. Every team also gets prior_matches
+    # of average goals against an average opponent, so teams with only a handful
+    # of results are pulled towards the middle rather than to extremes.
+    teams = len(frame.team_names)
+    home, away = frame.home_team, frame.away_team
+    home_goals = frame.home_goals.astype(float64)
+    away_goals = frame.away_goals.astype(float64)
+
+    total_home_goals = float(home_goals.sum())
+    total_away_goals = float(away_goals.sum())
+    goals_per_side = (total_home_goals + total_away_goals) / (2 * len(frame)) if len(frame) else 1.0
+    goals_per_side = max(goals_per_side, 1e-6)
+
+    scored = np.bincount(home, home_goals, teams) + np.bincount(away, away_goals, teams)
+    conceded = np.bincount(home, away_goals, teams) + np.bincount(away, home_goals, teams)
+    prior_goals = prior_matches * goals_per_side
+
+    attack = np.ones(teams)
+    defence = np.ones(teams)
+    home_advantage = 1.0
+
+    for _ in range(iterations):
+        attack_exposure = np.bincount(home, home_advantage * defence[away], teams) \
+            + np.bincount(away, defence[home], teams)
+        attack = (scored + prior_goals) / (goals_per_side * attack_exposure + prior_goals)
+
+        defence_exposure = np.bincount(away, home_advantage * attack[home], teams) \
+            + np.bincount(home, attack[away], teams)
+        defence = (conceded + prior_goals) / (goals_per_side * defence_exposure + prior_goals)
+
+        if len(frame):
+            home_exposure = float((attack[home] * defence[away]).sum())
+            home_advantage = total_home_goals / (goals_per_side * home_exposure) if home_exposure else 1.0
+
+        # Only the products of attack and defence are identified, so fix the mean attack at one.
+        scale = float(attack.mean()) if teams else 1.0
+        attack /= scale
+        defence *= scale
+
+    strengths = PoissonStrengths(
+        team_index={name: index for index, name in enumerate(frame.team_names.tolist())},
+        attack=np.append(attack, 1.0),
+        defence=np.append(defence, 1.0),
+        goals_per_side=goals_per_side,
+        home_advantage=home_advantage,
+        rho=0.0,
+    )
+
+    if not dixon_coles or len(frame) == 0:
+        return strengths
+
+    return replace(strengths, rho=fit_rho(strengths, frame))
+
+
+def fit_rho(strengths: PoissonStrengths, frame: ResultsFrame) -> float:
+    # The correction only touches 0-0, 1-0, 0-1 and 1-1, so the likelihood of
+    # every candidate rho is a sum over those matches, computed all at once.
+    home_rates = strengths.goals_per_side * strengths.home_advantage \
+        * strengths.attack[frame.home_team] * strengths.defence[frame.away_team]
+    away_rates = strengths.goals_per_side * strengths.attack[frame.away_team] * strengths.defence[frame.home_team]
+
+    candidates = np.linspace(-0.2, 0.2, 81)
+    tau = low_score_correction(
+        home_rates[:, None], away_rates[:, None], candidates[None, :],
+        frame.home_goals[:, None], frame.away_goals[:, None],
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_likelihoods = np.where(tau > 0, np.log(tau), -np.inf).sum(axis=0)
+
+    return float(candidates[int(np.argmax(log_likelihoods))])
+
+
+def low_score_correction(
+    home_rates: NDArray[float64],
+    away_rates: NDArray[float64],
+    rho: NDArray[float64] | float,
+    home_goals: NDArray[Any],
+    away_goals: NDArray[Any],
+) -> NDArray[float64]:
+    tau: NDArray[float64] = np.select(
+        [
+            (home_goals == 0) & (away_goals == 0),
+            (home_goals == 0) & (away_goals == 1),
+            (home_goals == 1) & (away_goals == 0),
+            (home_goals == 1) & (away_goals == 1),
+        ],
+        [
+            1 - home_rates * away_rates * rho,
+            1 + home_rates * rho,
+            1 + away_rates * rho,
+            1 - rho + np.zeros_like(home_rates),
+        ],
+        np.ones_like(home_rates * rho),
+    )
+    return tau
+
+
+def poisson_pmf(rates: NDArray[float64]) -> NDArray[float64]:
+    safe_rates = np.maximum(rates, 1e-12)[:, None]
+    pmf: NDArray[float64] = np.exp(goals * np.log(safe_rates) - safe_rates - log_factorials)
+    return pmf
+
+
+def scoreline_matrices(
+    home_rates: NDArray[float64], away_rates: NDArray[float64], rho: float
+) -> NDArray[float64]:
+    """Joint probabilities of each side scoring 0 to max_goals more goals, one matrix per pair of rates."""
+    matrices = poisson_pmf(home_rates)[:, :, None] * poisson_pmf(away_rates)[:, None, :]
+
+    if rho != 0:
+        matrices[:, :2, :2] *= low_score_correction(
+            home_rates[:, None, None], away_rates[:, None, None], rho,
+            goals[None, :2, None], goals[None, None, :2],
+        )
+
+    normalised: NDArray[float64] = matrices / matrices.sum(axis=(1, 2), keepdims=True)
+    return normalised
+
+
+def outcome_probabilities(matrices: NDArray[float64], scenario: Scenario) -> List[OutcomeProbabilities]:
+    goal_difference = np.subtract.outer(goals, goals) + (scenario.home_goals - scenario.away_goals)
+
+    home = (matrices * (goal_difference > 0)).sum(axis=(1, 2))
+    away = (matrices * (goal_difference < 0)).sum(axis=(1, 2))
+    draw = (matrices * (goal_difference == 0)).sum(axis=(1, 2))
+
+    return [
+        OutcomeProbabilities(home=h, away=a, draw=d)
+        for h, a, d in zip(home.tolist(), away.tolist(), draw.tolist())
+    ]
+
+
+class PoissonPredictor(ScorelinePredictor):
+    """Independent Poisson goals for each side, optionally with the Dixon-Coles
+    correction for low scores, so every scoreline has a closed form probability.
+    """
+
+    def __init__(self, frame: ResultsFrame, dixon_coles: bool = True) -> None:
+        self.frame = frame
+        self.dixon_coles = dixon_coles
+        self.strengths = fit_strengths(frame, dixon_coles)
+
+    def predict(self, fixture: Fixture) -> Prediction:
+        return self.predict_in_progress(fixture, Scenario(0, 0, 0))
+
+    def predict_in_progress(self, fixture: Fixture, scenario: Scenario) -> Prediction:
+        return self.__predict([fixture], scenario)[0]
+
+    def predict_batch(self, fixtures: List[Fixture]) -> List[Prediction]:
+        if not fixtures:
+            return []
+
+        return self.__predict(fixtures, Scenario(0, 0, 0))
+
+    def predict_scorelines(self, fixture: Fixture, scenario: Scenario) -> Optional[ScorelineDistribution]:
+        return ScorelineDistribution.from_remaining_goals(self.__scorelines([fixture], scenario)[0], scenario)
+
+    def updated(self, results: Iterable[Result]) -> Predictor:
+        return PoissonPredictor(self.frame + ResultsFrame.of(results), self.dixon_coles)
+
+    def __scorelines(self, fixtures: List[Fixture], scenario: Scenario) -> NDArray[float64]:
+        remaining = min(max(match_minutes - scenario.minutes_elapsed, 0), match_minutes) / match_minutes
+        home_rates, away_rates = self.strengths.expected_goals(fixtures)
+
+        # The correction was fitted on full time scores, so it only applies before kick off.
+        rho = self.strengths.rho if scenario.minutes_elapsed <= 0 else 0.0
+
+        return scoreline_matrices(home_rates * remaining, away_rates * remaining, rho)
+
+    def __predict(self, fixtures: List[Fixture], scenario: Scenario) -> List[Prediction]:
+        return [
+            most_likely_outcome(p.home, p.away, p.draw)
+            for p in outcome_probabilities(self.__scorelines(fixtures, scenario), scenario)
+        ]
+
+
+def train_poisson_predictor(results: Iterable[Result]) -> Predictor:
+    return PoissonPredictor(ResultsFrame.of(results), dixon_coles=False)
+
+
+def train_dixon_coles_predictor(results: Iterable[Result]) -> Predictor:
+    return PoissonPredictor(ResultsFrame.of(results), dixon_coles=True)
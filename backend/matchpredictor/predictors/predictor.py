@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, List, Optional
 
-from matchpredictor.matchresults.result import Fixture, Outcome, Scenario
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Scenario
+from matchpredictor.predictors.scorelines import ScorelineDistribution
 
 
 @dataclass
@@ -16,8 +17,25 @@ class Predictor(ABC):
     def predict(self, fixture: Fixture) -> Prediction:
         pass
 
+    def predict_batch(self, fixtures: List[Fixture]) -> List[Prediction]:
+        return [self.predict(fixture) for fixture in fixtures]
+
+    def updated(self, results: Iterable[Result]) -> "Predictor":
+        """A copy of this predictor that has also learned from the given results.
+
+        Predictors that cannot learn incrementally return themselves.
+        """
+        return self
+
 
 class InProgressPredictor(Predictor):
     @abstractmethod
     def predict_in_progress(self, fixture: Fixture, scenario: Scenario) -> Prediction:
         pass
+
+
+class ScorelinePredictor(InProgressPredictor):
+    @abstractmethod
+    def predict_scorelines(self, fixture: Fixture, scenario: Scenario) -> Optional[ScorelineDistribution]:
+        """The chance of every full time score from the scenario on, or None if this predictor cannot tell."""
+        pass
@@ -1,88 +1,106 @@
-from typing import List, Optional, Tuple
+import copy
+from typing import Any, Iterable, List, Optional, Tuple, cast
 
-import joblib # type: ignore
 import numpy as np
 from numpy import float64
 from numpy.typing import NDArray
 from sklearn.ensemble import RandomForestRegressor # type: ignore
-from sklearn.model_selection import GridSearchCV # type: ignore
-from sklearn.preprocessing import OneHotEncoder # type: ignore
+from scipy.sparse import hstack  # type: ignore
 
 from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
-from matchpredictor.predictors.past_results_predictor import calculate_table
+from matchpredictor.matchresults.results_frame import ResultsFrame, feature_columns
+from matchpredictor.predictors.past_results_predictor import PointsTable, calculate_table
 from matchpredictor.predictors.predictor import Prediction, Predictor
+from matchpredictor.predictors.rolling_form import RollingForm, calculate_form
+from matchpredictor.predictors.team_encoding import TeamEncoding
+from matchpredictor.predictors.tuning import TuningConfig, tuned_random_forest
 
-
-def calculate_average_goals(results: List[Result], team: Team, n: int) -> float:
-    matches = [
-        r for r in results if r.fixture.home_team == team or r.fixture.away_team == team
-    ][-n:]
-    goals = [
-        r.home_goals if r.fixture.home_team == team else r.away_goals for r in matches
-    ]
-    return sum(goals) / len(goals) if goals else 0
+form_matches = 5
 
 
 class RandomForestPredictor(Predictor):
     def __init__(
         self,
         model: RandomForestRegressor,
-        team_encoding: OneHotEncoder,
-        results: List[Result],
+        team_encoding: TeamEncoding,
+        points_table: PointsTable,
+        form: RollingForm,
+        feature_fill_values: NDArray[float64],
     ) -> None:
         self.model = model
         self.team_encoding = team_encoding
-        self.results = results
-        self.points_table = calculate_table(results)
+        self.points_table = points_table
+        self.form = form
+        self.feature_fill_values = feature_fill_values
 
     def predict(self, fixture: Fixture) -> Prediction:
-        encoded_home_name = self.__encode_team(fixture.home_team)
-        encoded_away_name = self.__encode_team(fixture.away_team)
-        if encoded_home_name is None:
-            return Prediction(outcome=Outcome.AWAY)
-        if encoded_away_name is None:
-            return Prediction(outcome=Outcome.HOME)
-
-        home_avg_goals = calculate_average_goals(self.results, fixture.home_team, 5)
-        away_avg_goals = calculate_average_goals(self.results, fixture.away_team, 5)
-
-        encoded_home_points: NDArray[float64] = np.array(
-            self.points_table.points_for(fixture.home_team)
-        ).reshape(-1, 1)
-        encoded_away_points: NDArray[float64] = np.array(
-            self.points_table.points_for(fixture.away_team)
-        ).reshape(-1, 1)
-
-        home_importance = np.array(fixture.home_importance).reshape(-1, 1)
-        away_importance = np.array(fixture.away_importance).reshape(-1, 1)
-        home_spi = np.array(fixture.home_spi).reshape(-1, 1)
-        away_spi = np.array(fixture.away_spi).reshape(-1, 1)
-        home_xg = np.array(fixture.home_xg).reshape(-1, 1)
-        away_xg = np.array(fixture.away_xg).reshape(-1, 1)
-        home_nsxg = np.array(fixture.home_nsxg).reshape(-1, 1)
-        away_nsxg = np.array(fixture.away_nsxg).reshape(-1, 1)
-
-        x: NDArray[float64] = np.concatenate(
+        return self.predict_batch([fixture])[0]
+
+    def predict_batch(self, fixtures: List[Fixture]) -> List[Prediction]:
+        known_teams = self.team_encoding.team_index
+
+        predictions: List[Optional[Prediction]] = []
+        known_fixtures: List[Fixture] = []
+        for fixture in fixtures:
+            if fixture.home_team.name not in known_teams:
+                predictions.append(Prediction(outcome=Outcome.AWAY))
+            elif fixture.away_team.name not in known_teams:
+                predictions.append(Prediction(outcome=Outcome.HOME))
+            else:
+                predictions.append(None)
+                known_fixtures.append(fixture)
+
+        if known_fixtures:
+            pred = iter(self.model.predict(self.__features(known_fixtures)))
+            predictions = [p if p is not None else self.__prediction(*next(pred)) for p in predictions]
+
+        return cast(List[Prediction], predictions)
+
+    def updated(self, results: Iterable[Result]) -> Predictor:
+        """A copy whose points table and form include the new results.
+
+        The forest itself is only refitted by retraining, and teams it has
+        never seen keep the fallback predictions until then.
+        """
+        frame = ResultsFrame.of(results)
+
+        predictor = copy.copy(self)
+        predictor.points_table = self.points_table.copy()
+        predictor.points_table.add_results(frame)
+        predictor.form = self.form.copy()
+        predictor.form.add_results(frame)
+        return predictor
+
+    def __features(self, fixtures: List[Fixture]) -> Any:
+        def column(values: List[Optional[float]]) -> NDArray[float64]:
+            return np.array(values, dtype=float64).reshape(-1, 1)
+
+        home_teams = [f.home_team for f in fixtures]
+        away_teams = [f.away_team for f in fixtures]
+
+        return hstack(
             [
-                encoded_home_name,
-                encoded_away_name,
-                encoded_home_points,
-                encoded_away_points,
-                np.array(home_avg_goals).reshape(-1, 1),
-                np.array(away_avg_goals).reshape(-1, 1),
-                home_importance,
-                away_importance,
-                home_spi,
-                away_spi,
-                home_xg,
-                away_xg,
-                home_nsxg,
-                away_nsxg,
+                self.team_encoding.encode_teams(home_teams),
+                self.team_encoding.encode_teams(away_teams),
+                np.concatenate(
+                    [
+                        column([self.points_table.points_for(t) for t in home_teams]),
+                        column([self.points_table.points_for(t) for t in away_teams]),
+                        column([self.form.average_goals_scored(t) for t in home_teams]),
+                        column([self.form.average_goals_scored(t) for t in away_teams]),
+                        filled(
+                            np.array([[getattr(f, name) for name in feature_columns] for f in fixtures], dtype=float64),
+                            self.feature_fill_values,
+                        ),
+                    ],
+                    1,
+                ),
             ],
-            1,
+            format="csr",
         )
-        pred = self.model.predict(x)
-        home_goals_pred, away_goals_pred = pred[0]
+
+    @staticmethod
+    def __prediction(home_goals_pred: float, away_goals_pred: float) -> Prediction:
         if home_goals_pred > away_goals_pred:
             return Prediction(outcome=Outcome.HOME)
         elif home_goals_pred < away_goals_pred:
@@ -90,107 +108,72 @@ class RandomForestPredictor(Predictor):
         else:
             return Prediction(outcome=Outcome.DRAW)
 
-    def __encode_team(self, team: Team) -> Optional[NDArray[float64]]:
-        try:
-            result: NDArray[float64] = self.team_encoding.transform(
-                np.array(team.name).reshape(-1, 1)
-            )
-            return result
-        except ValueError:
-            return None
-
-
-def build_model(results: List[Result]) -> Tuple[RandomForestRegressor, OneHotEncoder]:
-    home_names = np.array([r.fixture.home_team.name for r in results])
-    away_names = np.array([r.fixture.away_team.name for r in results])
-    home_goals = np.array([r.home_goals for r in results])
-    away_goals = np.array([r.away_goals for r in results])
-    home_importance = np.array([r.fixture.home_importance for r in results]).reshape(
-        -1, 1
-    )
-    away_importance = np.array([r.fixture.away_importance for r in results]).reshape(
-        -1, 1
-    )
-    home_spi = np.array([r.fixture.home_spi for r in results]).reshape(-1, 1)
-    away_spi = np.array([r.fixture.away_spi for r in results]).reshape(-1, 1)
-    team_names = np.array(list(home_names) + list(away_names)).reshape(-1, 1)
-    team_encoding = OneHotEncoder(sparse=False).fit(team_names)
 
-    encoded_home_names = team_encoding.transform(home_names.reshape(-1, 1))
-    encoded_away_names = team_encoding.transform(away_names.reshape(-1, 1))
+def build_model(
+    results: Iterable[Result], points_table: PointsTable, form: RollingForm, tuning: TuningConfig = TuningConfig()
+) -> Tuple[RandomForestRegressor, TeamEncoding, NDArray[float64]]:
+    frame = ResultsFrame.of(results)
 
-    home_avg_goals = np.array(
-        [calculate_average_goals(results, r.fixture.home_team, 5) for r in results]
-    )
-    away_avg_goals = np.array(
-        [calculate_average_goals(results, r.fixture.away_team, 5) for r in results]
-    )
+    def column(values: NDArray[Any]) -> NDArray[Any]:
+        return values.reshape(-1, 1)
 
-    pointsTable = calculate_table(results)
+    team_encoding = TeamEncoding(frame.team_names)
 
-    encoded_home_points = np.array(
-        [pointsTable.points_for(r.fixture.home_team) for r in results]
-    ).reshape(-1, 1)
+    team_avg_goals = np.array([form.average_goals_scored(Team(str(name))) for name in frame.team_names])
 
-    encoded_away_points = np.array(
-        [pointsTable.points_for(r.fixture.away_team) for r in results]
-    ).reshape(-1, 1)
+    team_points = np.array([points_table.points_for(Team(str(name))) for name in frame.team_names])
 
-    home_xg = np.array([r.fixture.home_xg for r in results]).reshape(-1, 1)
-    away_xg = np.array([r.fixture.away_xg for r in results]).reshape(-1, 1)
-    home_nsxg = np.array([r.fixture.home_nsxg for r in results]).reshape(-1, 1)
-    away_nsxg = np.array([r.fixture.away_nsxg for r in results]).reshape(-1, 1)
+    fixture_features = np.column_stack([getattr(frame, name) for name in feature_columns]).astype(float64)
+    fill_values = feature_fill_values(fixture_features)
 
-    x: NDArray[float64] = np.concatenate(
+    x = hstack(
         [
-            encoded_home_names,
-            encoded_away_names,
-            encoded_home_points,
-            encoded_away_points,
-            home_avg_goals.reshape(-1, 1),
-            away_avg_goals.reshape(-1, 1),
-            home_importance,
-            away_importance,
-            home_spi,
-            away_spi,
-            home_xg,
-            away_xg,
-            home_nsxg,
-            away_nsxg,
+            team_encoding.encode(frame.home_team),
+            team_encoding.encode(frame.away_team),
+            column(team_points[frame.home_team]),
+            column(team_points[frame.away_team]),
+            column(team_avg_goals[frame.home_team]),
+            column(team_avg_goals[frame.away_team]),
+            filled(fixture_features, fill_values),
         ],
-        1,
+        format="csr",
     )
 
-    y = np.column_stack((home_goals, away_goals))
+    y = np.column_stack((frame.home_goals, frame.away_goals))
 
-    n_cores = joblib.cpu_count(only_physical_cores=True)
+    model = tuned_random_forest(x, y, tuning)
 
+    return model, team_encoding, fill_values
 
-    # Define the parameter grid
-    param_grid = {
-        "n_estimators": [50, 100, 200],
-        "max_depth": [None, 10, 20, 30],
-        "min_samples_split": [2, 5, 10],
-        "min_samples_leaf": [1, 2, 4],
-    }
 
-    # Create a base model
-    rf = RandomForestRegressor()
+def feature_fill_values(features: NDArray[float64]) -> NDArray[float64]:
+    """The mean of each fixture feature where it is known, or 0 for a feature that never is.
+
+    Fixtures from the API, and results from some leagues, carry no spi, xg or
+    importance, and the forest cannot take the missing values as they are.
+    """
+    known = ~np.isnan(features)
+    counts = known.sum(axis=0)
+    totals = np.where(known, features, 0).sum(axis=0)
+    means: NDArray[float64] = np.divide(totals, counts, out=np.zeros_like(totals), where=counts > 0)
+    return means
 
-    # Instantiate the grid search model
-    grid_search = GridSearchCV(
-        estimator=rf, param_grid=param_grid, cv=3, n_jobs=n_cores, verbose=0
-    )
 
-    # Fit the grid search to the data
-    grid_search.fit(x, y)
+def filled(features: NDArray[float64], fill_values: NDArray[float64]) -> NDArray[float64]:
+    result: NDArray[float64] = np.where(np.isnan(features), fill_values, features)
+    return result
 
-    # Get the best model
-    model = grid_search.best_estimator_
 
-    return model, team_encoding
+def random_forest_predictor(
+    results: Iterable[Result], points_table: PointsTable, form: RollingForm, tuning: TuningConfig = TuningConfig()
+) -> Predictor:
+    """A forest trained on the results, whose points table and form were built from the same results."""
+    model, team_encoding, fill_values = build_model(results, points_table, form, tuning)
+    return RandomForestPredictor(model, team_encoding, points_table, form, fill_values)
 
 
-def train_random_forest_predictor(results: List[Result]) -> Predictor:
-    model, team_encoding = build_model(results)
-    return RandomForestPredictor(model, team_encoding, results)
+def train_random_forest_predictor(
+    results: Iterable[Result], tuning: TuningConfig = TuningConfig()
+) -> Predictor:
+    frame = ResultsFrame.of(results)
+    return random_forest_predictor(frame, calculate_table(frame), calculate_form(frame, form_matches), tuning)
@@ -0,0 +1,83 @@
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable
+
+from matchpredictor.matchresults.result import Result, Team
+from matchpredictor.matchresults.results_frame import ResultsFrame
+
+
+@dataclass
+class TeamForm(object):
+    goals_scored: Deque[int]
+    goals_conceded: Deque[int]
+    total_scored: int = field(default=0)
+    total_conceded: int = field(default=0)
+
+    def record(self, scored: int, conceded: int) -> None:
+        if len(self.goals_scored) == self.goals_scored.maxlen:
+            self.total_scored -= self.goals_scored[0]
+            self.total_conceded -= self.goals_conceded[0]
+
+        self.goals_scored.append(scored)
+        self.goals_conceded.append(conceded)
+        self.total_scored += scored
+        self.total_conceded += conceded
+
+    def average_goals_scored(self) -> float:
+        return self.total_scored / len(self.goals_scored) if self.goals_scored else 0
+
+    def average_goals_conceded(self) -> float:
+        return self.total_conceded / len(self.goals_conceded) if self.goals_conceded else 0
+
+
+class RollingForm(object):
+    def __init__(self, matches: int) -> None:
+        self.matches = matches
+        self.form_dict: Dict[str, TeamForm] = {}
+
+    def record(self, home_team: str, away_team: str, home_goals: int, away_goals: int) -> None:
+        self.__team_form(home_team).record(home_goals, away_goals)
+        self.__team_form(away_team).record(away_goals, home_goals)
+
+    def add_results(self, results: Iterable[Result]) -> None:
+        frame = ResultsFrame.of(results)
+        team_names = frame.team_names.tolist()
+
+        for home_team, away_team, home_goals, away_goals in zip(
+            frame.home_team.tolist(),
+            frame.away_team.tolist(),
+            frame.home_goals.tolist(),
+            frame.away_goals.tolist(),
+        ):
+            self.record(team_names[home_team], team_names[away_team], home_goals, away_goals)
+
+    def copy(self) -> "RollingForm":
+        form = RollingForm(self.matches)
+        form.form_dict = {
+            team: TeamForm(deque(f.goals_scored, self.matches), deque(f.goals_conceded, self.matches),
+                           f.total_scored, f.total_conceded)
+            for team, f in self.form_dict.items()
+        }
+        return form
+
+    def average_goals_scored(self, team: Team) -> float:
+        form = self.form_dict.get(team.name)
+        return form.average_goals_scored() if form is not None else 0
+
+    def average_goals_conceded(self, team: Team) -> float:
+        form = self.form_dict.get(team.name)
+        return form.average_goals_conceded() if form is not None else 0
+
+    def __team_form(self, team: str) -> TeamForm:
+        form = self.form_dict.get(team)
+        if form is None:
+            form = TeamForm(deque(maxlen=self.matches), deque(maxlen=self.matches))
+            self.form_dict[team] = form
+        return form
+
+
+def calculate_form(results: Iterable[Result], matches: int) -> RollingForm:
+    form = RollingForm(matches)
+    form.add_results(results)
+
+    return form
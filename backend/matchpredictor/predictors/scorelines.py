@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+from numpy import float64
+from numpy.typing import NDArray
+
+from matchpredictor.matchresults.result import Scenario
+
+max_goals = 10
+total_goals_lines = [0.5, 1.5, 2.5, 3.5, 4.5]
+
+
+@dataclass(frozen=True)
+class ScorelineProbability(object):
+    home_goals: int
+    away_goals: int
+    probability: float
+
+
+@dataclass(frozen=True)
+class TotalGoalsLine(object):
+    line: float
+    over: float
+    under: float
+
+
+@dataclass(frozen=True)
+class ScorelineMarkets(object):
+    home: float
+    draw: float
+    away: float
+    both_teams_score: float
+    total_goals: List[TotalGoalsLine]
+
+
+@dataclass(frozen=True)
+class ScorelineDistribution(object):
+    """Full time score probabilities, kept as the score so far plus remaining[h, a],
+    the chance of the home side adding h more goals and the away side a more.
+    Neither side is expected to add more than max_goals.
+    """
+    remaining: NDArray[float64]
+    home_goals: int = 0
+    away_goals: int = 0
+
+    @staticmethod
+    def from_remaining_goals(remaining: NDArray[float64], scenario: Scenario) -> "ScorelineDistribution":
+        kept = remaining[:max_goals + 1, :max_goals + 1]
+        total = kept.sum()
+
+        return ScorelineDistribution(
+            kept / total if total > 0 else kept,
+            home_goals=scenario.home_goals,
+            away_goals=scenario.away_goals,
+        )
+
+    def markets(self) -> ScorelineMarkets:
+        home_goals = np.arange(self.remaining.shape[0]) + self.home_goals
+        away_goals = np.arange(self.remaining.shape[1]) + self.away_goals
+        goal_difference = np.subtract.outer(home_goals, away_goals)
+        total_goals = np.add.outer(home_goals, away_goals)
+
+        def total(mask: NDArray[np.bool_]) -> float:
+            return float(self.remaining[mask].sum())
+
+        return ScorelineMarkets(
+            home=total(goal_difference > 0),
+            draw=total(goal_difference == 0),
+            away=total(goal_difference < 0),
+            both_teams_score=total(np.logical_and.outer(home_goals > 0, away_goals > 0)),
+            total_goals=[
+                TotalGoalsLine(line=line, over=total(total_goals > line), under=total(total_goals < line))
+                for line in total_goals_lines
+            ],
+        )
+
+    def scorelines(self, min_probability: float = 0.0005, decimals: int = 4) -> List[ScorelineProbability]:
+        """The likely full time scores only, most likely first, which keeps the payload small."""
+        home_goals, away_goals = np.nonzero(self.remaining >= min_probability)
+        probabilities = self.remaining[home_goals, away_goals]
+        order = np.argsort(-probabilities, kind="stable")
+
+        return [
+            ScorelineProbability(
+                home_goals=self.home_goals + int(home_goals[i]),
+                away_goals=self.away_goals + int(away_goals[i]),
+                probability=round(float(probabilities[i]), decimals),
+            )
+            for i in order.tolist()
+        ]
@@ -1,20 +1,38 @@
-from typing import Iterable
+from typing import Iterable, List, Optional
 
 from matchpredictor.matchresults.result import Fixture, Outcome, Result, Scenario
 from matchpredictor.predictors.predictor import (
-    InProgressPredictor,
     Prediction,
     Predictor,
+    ScorelinePredictor,
 )
+from matchpredictor.predictors.scorelines import ScorelineDistribution
+from matchpredictor.predictors.simulators.goal_distribution import remaining_goals_distribution
+from matchpredictor.predictors.simulators.in_play_table import in_play_probabilities
 from matchpredictor.predictors.simulators.scoring_rates import ScoringRates
 from matchpredictor.predictors.simulators.simulator import (
+    GoalRateSimulator,
+    GoalRates,
+    ScoringRateGoals,
     Simulator,
+    offense_and_defense_goal_rates,
     offense_and_defense_simulator,
+    offense_goal_rates,
     offense_simulator,
+    updated_goal_rates,
 )
 
 
-class SimulationPredictor(InProgressPredictor):
+def most_likely_outcome(home: float, away: float, draw: float) -> Prediction:
+    if home > away and home > draw:
+        return Prediction(outcome=Outcome.HOME, confidence=home)
+    if away > draw:
+        return Prediction(outcome=Outcome.AWAY, confidence=away)
+    else:
+        return Prediction(outcome=Outcome.DRAW, confidence=draw)
+
+
+class SimulationPredictor(ScorelinePredictor):
     def __init__(self, simulator: Simulator, simulations: int) -> None:
         self.simulator = simulator
         self.simulations = simulations
@@ -23,33 +41,97 @@ class SimulationPredictor(InProgressPredictor):
         return self.predict_in_progress(fixture, Scenario(0, 0, 0))
 
     def predict_in_progress(self, fixture: Fixture, scenario: Scenario) -> Prediction:
-        results = [self.simulator(fixture, scenario) for _ in range(self.simulations)]
+        counts = self.simulator(fixture, scenario, self.simulations)
+
+        return most_likely_outcome(
+            home=counts.home / self.simulations,
+            away=counts.away / self.simulations,
+            draw=counts.draw / self.simulations,
+        )
+
+    def predict_scorelines(self, fixture: Fixture, scenario: Scenario) -> Optional[ScorelineDistribution]:
+        if not isinstance(self.simulator, GoalRateSimulator):
+            return None
+
+        remaining = self.simulator.scorelines(fixture, scenario, self.simulations)
+        return ScorelineDistribution.from_remaining_goals(remaining, scenario)
+
+    def updated(self, results: Iterable[Result]) -> Predictor:
+        if not isinstance(self.simulator, GoalRateSimulator):
+            return self
+
+        return SimulationPredictor(self.simulator.updated(results), self.simulations)
+
+
+class ExactPredictor(ScorelinePredictor):
+    def __init__(self, goal_rates: GoalRates) -> None:
+        self.goal_rates = goal_rates
+
+    def predict(self, fixture: Fixture) -> Prediction:
+        return self.predict_in_progress(fixture, Scenario(0, 0, 0))
+
+    def predict_in_progress(self, fixture: Fixture, scenario: Scenario) -> Prediction:
+        home_goal_rate, away_goal_rate = self.goal_rates(fixture)
+        probabilities = in_play_probabilities(home_goal_rate, away_goal_rate, scenario)
+
+        return most_likely_outcome(
+            home=probabilities.home,
+            away=probabilities.away,
+            draw=probabilities.draw,
+        )
+
+    def predict_batch(self, fixtures: List[Fixture]) -> List[Prediction]:
+        if not isinstance(self.goal_rates, ScoringRateGoals):
+            return super().predict_batch(fixtures)
 
-        home_count = sum(map(lambda r: r is Outcome.HOME, results))
-        away_count = sum(map(lambda r: r is Outcome.AWAY, results))
-        draw_count = sum(map(lambda r: r is Outcome.DRAW, results))
+        home_goal_rates, away_goal_rates = self.goal_rates.batch(fixtures)
+        predictions = []
+        for home_goal_rate, away_goal_rate in zip(home_goal_rates.tolist(), away_goal_rates.tolist()):
+            probabilities = in_play_probabilities(home_goal_rate, away_goal_rate, Scenario(0, 0, 0))
+            predictions.append(most_likely_outcome(probabilities.home, probabilities.away, probabilities.draw))
 
-        if home_count > away_count and home_count > draw_count:
-            return Prediction(
-                outcome=Outcome.HOME, confidence=home_count / self.simulations
-            )
-        if away_count > draw_count:
-            return Prediction(
-                outcome=Outcome.AWAY, confidence=away_count / self.simulations
-            )
-        else:
-            return Prediction(
-                outcome=Outcome.DRAW, confidence=draw_count / self.simulations
-            )
+        return predictions
 
+    def predict_scorelines(self, fixture: Fixture, scenario: Scenario) -> Optional[ScorelineDistribution]:
+        home_goal_rate, away_goal_rate = self.goal_rates(fixture)
+        remaining_minutes = max(90 - scenario.minutes_elapsed, 0)
 
-def train_offense_predictor(results: Iterable[Result], simulations: int) -> Predictor:
-    return SimulationPredictor(offense_simulator(ScoringRates(results)), simulations)
+        remaining = remaining_goals_distribution(home_goal_rate, away_goal_rate, remaining_minutes)
+        return ScorelineDistribution.from_remaining_goals(remaining, scenario)
+
+    def updated(self, results: Iterable[Result]) -> Predictor:
+        return ExactPredictor(updated_goal_rates(self.goal_rates, results))
+
+
+def offense_predictor(scoring_rates: ScoringRates, simulations: int, seed: int = 0) -> Predictor:
+    return SimulationPredictor(offense_simulator(scoring_rates, seed), simulations)
+
+
+def offense_and_defense_predictor(scoring_rates: ScoringRates, simulations: int, seed: int = 0) -> Predictor:
+    return SimulationPredictor(offense_and_defense_simulator(scoring_rates, seed), simulations)
+
+
+def exact_offense_predictor(scoring_rates: ScoringRates) -> Predictor:
+    return ExactPredictor(offense_goal_rates(scoring_rates))
+
+
+def exact_offense_and_defense_predictor(scoring_rates: ScoringRates) -> Predictor:
+    return ExactPredictor(offense_and_defense_goal_rates(scoring_rates))
+
+
+def train_offense_predictor(results: Iterable[Result], simulations: int, seed: int = 0) -> Predictor:
+    return offense_predictor(ScoringRates(results), simulations, seed)
 
 
 def train_offense_and_defense_predictor(
-    results: Iterable[Result], simulations: int
+    results: Iterable[Result], simulations: int, seed: int = 0
 ) -> Predictor:
-    return SimulationPredictor(
-        offense_and_defense_simulator(ScoringRates(results)), simulations
-    )
+    return offense_and_defense_predictor(ScoringRates(results), simulations, seed)
+
+
+def train_exact_offense_predictor(results: Iterable[Result]) -> Predictor:
+    return exact_offense_predictor(ScoringRates(results))
+
+
+def train_exact_offense_and_defense_predictor(results: Iterable[Result]) -> Predictor:
+    return exact_offense_and_defense_predictor(ScoringRates(results))
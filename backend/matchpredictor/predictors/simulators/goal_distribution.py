@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from math import comb
+
+import numpy as np
+from numpy import float64
+from numpy.typing import NDArray
+
+
+@dataclass(frozen=True)
+class OutcomeProbabilities(object):
+    home: float
+    away: float
+    draw: float
+
+
+def binomial_pmf(trials: int, probability: float) -> NDArray[float64]:
+    p = min(max(probability, 0.0), 1.0)
+    goals = np.arange(trials + 1)
+    coefficients = np.array([comb(trials, k) for k in goals], dtype=float64)
+
+    pmf: NDArray[float64] = coefficients * np.power(p, goals) * np.power(1 - p, trials - goals)
+    return pmf
+
+
+def remaining_goals_distribution(
+        home_goal_rate: float,
+        away_goal_rate: float,
+        remaining_minutes: int,
+) -> NDArray[float64]:
+    # The simulators score with one Bernoulli trial per side per minute, so the goals
+    # each side adds are binomial and the joint distribution is their outer product.
+    home_pmf = binomial_pmf(remaining_minutes, home_goal_rate)
+    away_pmf = binomial_pmf(remaining_minutes, away_goal_rate)
+
+    joint: NDArray[float64] = np.outer(home_pmf, away_pmf)
+    return joint
+
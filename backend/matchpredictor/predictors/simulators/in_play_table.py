@@ -0,0 +1,68 @@
+from functools import lru_cache
+
+import numpy as np
+from numpy import float64
+from numpy.typing import NDArray
+
+from matchpredictor.matchresults.result import Scenario
+from matchpredictor.predictors.simulators.goal_distribution import OutcomeProbabilities
+
+match_minutes = 90
+
+
+class InPlayTable(object):
+    """Outcome probabilities for every in-play scenario of one pair of goal rates.
+
+    Row m holds the cumulative distribution of the goal difference the home
+    side adds over m remaining minutes, offset so that column k is a
+    difference of k - 90. Every scenario is then answered with two lookups.
+    """
+
+    def __init__(self, home_goal_rate: float, away_goal_rate: float) -> None:
+        home = min(max(home_goal_rate, 0.0), 1.0)
+        away = min(max(away_goal_rate, 0.0), 1.0)
+
+        # Each minute moves the difference up one, down one or not at all.
+        up = home * (1 - away)
+        down = away * (1 - home)
+        stay = 1 - up - down
+
+        distributions = np.zeros((match_minutes + 1, 2 * match_minutes + 1))
+        distributions[0, match_minutes] = 1
+        for minutes in range(1, match_minutes + 1):
+            previous = distributions[minutes - 1]
+            distributions[minutes] = stay * previous
+            distributions[minutes, 1:] += up * previous[:-1]
+            distributions[minutes, :-1] += down * previous[1:]
+
+        self.cumulative: NDArray[float64] = np.cumsum(distributions, axis=1)
+
+    def outcome_probabilities(self, scenario: Scenario) -> OutcomeProbabilities:
+        remaining_minutes = min(max(match_minutes - scenario.minutes_elapsed, 0), match_minutes)
+        cumulative = self.cumulative[remaining_minutes]
+
+        # The match is drawn when the remaining difference cancels the current one.
+        level = scenario.away_goals - scenario.home_goals + match_minutes
+        away = self.__at_most(cumulative, level - 1)
+        up_to_draw = self.__at_most(cumulative, level)
+
+        return OutcomeProbabilities(home=1 - up_to_draw, away=away, draw=up_to_draw - away)
+
+    @staticmethod
+    def __at_most(cumulative: NDArray[float64], level: int) -> float:
+        if level < 0:
+            return 0.0
+        if level >= len(cumulative) - 1:
+            return 1.0
+        return float(cumulative[level])
+
+
+@lru_cache(maxsize=256)
+def in_play_table(home_goal_rate: float, away_goal_rate: float) -> InPlayTable:
+    # Keyed on the rates themselves, so tables built from out of date scoring
+    # rates are never hit again and age out of the cache.
+    return InPlayTable(home_goal_rate, away_goal_rate)
+
+
+def in_play_probabilities(home_goal_rate: float, away_goal_rate: float, scenario: Scenario) -> OutcomeProbabilities:
+    return in_play_table(home_goal_rate, away_goal_rate).outcome_probabilities(scenario)
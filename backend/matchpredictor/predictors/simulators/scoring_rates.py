@@ -1,72 +1,71 @@
-from dataclasses import dataclass
-from typing import Dict, Iterable
+import copy
+from typing import Iterable, List
 
-from matchpredictor.matchresults.result import Team, Result
-
-
-@dataclass
-class TeamScoring(object):
-    goal_scored: int
-    goals_conceded: int
-    matches: int
-
-    def goals_scored_per_minute(self) -> float:
-        if self.matches == 0:
-            return 1 / 90
+import numpy as np
+from numpy import float64, intp
+from numpy.typing import NDArray
 
-        return self.goal_scored / 90 / self.matches
-
-    def goals_conceded_per_match(self) -> float:
-        if self.matches == 0:
-            return 1
-
-        return self.goals_conceded / self.matches
+from matchpredictor.matchresults.result import Team, Result
+from matchpredictor.matchresults.results_frame import ResultsFrame
+from matchpredictor.predictors.team_counts import TeamCounts
 
 
 class ScoringRates:
-    scoring_dict: Dict[Team, TeamScoring]
+    counts: TeamCounts
     total_goals: int
     total_matches: int
+    # Indexed by team ID, with one extra entry at the end for unknown teams.
+    attack_rates: NDArray[float64]
+    defence_factors: NDArray[float64]
 
     def __init__(self, results: Iterable[Result]) -> None:
-        self.scoring_dict = {}
+        self.counts = TeamCounts("goals_scored", "goals_conceded", "matches")
         self.total_goals = 0
         self.total_matches = 0
 
-        for result in results:
-            self.__add_result(result)
+        self.add_results(results)
 
-    def defensive_factor(self, team: Team) -> float:
-        if team not in self.scoring_dict.keys():
-            return 1
+    def add_results(self, results: Iterable[Result]) -> None:
+        frame = ResultsFrame.of(results)
+        matches = np.ones(len(frame))
 
-        team_scoring = self.scoring_dict.get(team, TeamScoring(0, 0, 0))
-        goals_conceded_per_match = self.__global_goals_per_match() / 2
+        self.counts.add(
+            frame,
+            home={"goals_scored": frame.home_goals, "goals_conceded": frame.away_goals, "matches": matches},
+            away={"goals_scored": frame.away_goals, "goals_conceded": frame.home_goals, "matches": matches},
+        )
+        self.total_goals += int(frame.home_goals.sum()) + int(frame.away_goals.sum())
+        self.total_matches += len(frame)
 
-        return team_scoring.goals_conceded_per_match() / goals_conceded_per_match
+        self.__compile()
 
-    def goals_scored_per_minute(self, team: Team) -> float:
-        team_scoring = self.scoring_dict.get(team, TeamScoring(0, 0, 0))
+    def copy(self) -> "ScoringRates":
+        rates = copy.copy(self)
+        rates.counts = self.counts.copy()
+        return rates
 
-        return team_scoring.goals_scored_per_minute()
+    def team_id(self, team: Team) -> int:
+        return self.counts.team_index.get(team.name, len(self.counts.team_index))
 
-    def __add_result(self, result: Result) -> None:
-        home_team_scoring = self.scoring_dict.get(result.fixture.home_team, TeamScoring(0, 0, 0))
-        self.scoring_dict[result.fixture.home_team] = TeamScoring(
-            goal_scored=home_team_scoring.goal_scored + result.home_goals,
-            goals_conceded=home_team_scoring.goals_conceded + result.away_goals,
-            matches=home_team_scoring.matches + 1,
-        )
+    def team_ids(self, teams: List[Team]) -> NDArray[intp]:
+        return np.array([self.team_id(team) for team in teams], dtype=intp)
 
-        away_team_scoring = self.scoring_dict.get(result.fixture.away_team, TeamScoring(0, 0, 0))
-        self.scoring_dict[result.fixture.away_team] = TeamScoring(
-            goal_scored=away_team_scoring.goal_scored + result.away_goals,
-            goals_conceded=away_team_scoring.goals_conceded + result.home_goals,
-            matches=away_team_scoring.matches + 1,
-        )
+    def defensive_factor(self, team: Team) -> float:
+        return float(self.defence_factors[self.team_id(team)])
+
+    def goals_scored_per_minute(self, team: Team) -> float:
+        return float(self.attack_rates[self.team_id(team)])
+
+    def __compile(self) -> None:
+        matches = self.counts.counters["matches"]
+        goals_scored = self.counts.counters["goals_scored"]
+        goals_conceded = self.counts.counters["goals_conceded"]
 
-        self.total_goals += (result.home_goals + result.away_goals)
-        self.total_matches += 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            global_goals_per_match = self.total_goals / self.total_matches if self.total_matches else 0
+            attack_rates = np.where(matches > 0, goals_scored / 90 / matches, 1 / 90)
+            goals_conceded_per_match = np.where(matches > 0, goals_conceded / matches, 1)
+            defence_factors = goals_conceded_per_match / (global_goals_per_match / 2)
 
-    def __global_goals_per_match(self) -> float:
-        return self.total_goals / self.total_matches
+        self.attack_rates = np.append(attack_rates, 1 / 90)
+        self.defence_factors = np.append(defence_factors, 1)
@@ -1,56 +1,176 @@
-from random import random
-from typing import TypeAlias, Callable
+import hashlib
+from dataclasses import dataclass
+from typing import TypeAlias, Callable, Iterable, List, Optional, Tuple
 
-from matchpredictor.matchresults.result import Fixture, Outcome, Scenario
+import numpy as np
+from numpy import float64
+from numpy.random import Generator, SeedSequence
+from numpy.typing import NDArray
+
+from matchpredictor.matchresults.result import Fixture, Result, Scenario
 from matchpredictor.predictors.simulators.scoring_rates import ScoringRates
 
-Simulator: TypeAlias = Callable[[Fixture, Scenario], Outcome]
 
+@dataclass(frozen=True)
+class SimulationCounts(object):
+    home: int
+    away: int
+    draw: int
+
+
+GoalRates: TypeAlias = Callable[[Fixture], Tuple[float, float]]
+Simulator: TypeAlias = Callable[[Fixture, Scenario, int], SimulationCounts]
+
+
+def fixture_generator(seed: int, fixture: Fixture, scenario: Scenario) -> Generator:
+    """A random stream that only depends on the seed, the teams and the scenario.
+
+    Identical requests get identical simulations, and concurrent requests
+    each draw from their own generator without sharing any state.
+    """
+    key = "|".join([
+        fixture.home_team.name,
+        fixture.away_team.name,
+        fixture.league,
+        str(scenario.minutes_elapsed),
+        str(scenario.home_goals),
+        str(scenario.away_goals),
+    ])
+    entropy = int.from_bytes(hashlib.sha256(key.encode()).digest()[:16], "big")
 
-def offense_simulator(scoring_rates: ScoringRates) -> Simulator:
-    def simulate(fixture: Fixture, scenario: Scenario) -> Outcome:
-        home_goal_rate = scoring_rates.goals_scored_per_minute(fixture.home_team)
-        away_goal_rate = scoring_rates.goals_scored_per_minute(fixture.away_team)
+    return np.random.default_rng(SeedSequence([seed, entropy]))
 
-        return __outcome_from_goal_rate(home_goal_rate, away_goal_rate, scenario)
 
-    return simulate
+class ScoringRateGoals(object):
+    """Per-minute goal rates for a fixture, read from ScoringRates.
 
+    With defense each side's rate is scaled by the other side's defensive factor.
+    """
 
-def offense_and_defense_simulator(scoring_rates: ScoringRates) -> Simulator:
-    def simulate(fixture: Fixture, scenario: Scenario) -> Outcome:
-        home_goal_rate = scoring_rates.goals_scored_per_minute(fixture.home_team)
-        home_defensive_factor = scoring_rates.defensive_factor(fixture.home_team)
+    def __init__(self, scoring_rates: ScoringRates, defense: bool) -> None:
+        self.scoring_rates = scoring_rates
+        self.defense = defense
 
-        away_goal_rate = scoring_rates.goals_scored_per_minute(fixture.away_team)
-        away_defensive_factor = scoring_rates.defensive_factor(fixture.away_team)
+    def __call__(self, fixture: Fixture) -> Tuple[float, float]:
+        rates = self.scoring_rates
+        home_id = rates.team_id(fixture.home_team)
+        away_id = rates.team_id(fixture.away_team)
 
-        return __outcome_from_goal_rate(
-            home_goal_rate * away_defensive_factor,
-            away_goal_rate * home_defensive_factor,
-            scenario
+        home_goal_rate = float(rates.attack_rates[home_id])
+        away_goal_rate = float(rates.attack_rates[away_id])
+
+        if not self.defense:
+            return home_goal_rate, away_goal_rate
+
+        return (
+            home_goal_rate * float(rates.defence_factors[away_id]),
+            away_goal_rate * float(rates.defence_factors[home_id]),
         )
 
-    return simulate
+    def batch(self, fixtures: List[Fixture]) -> Tuple[NDArray[float64], NDArray[float64]]:
+        rates = self.scoring_rates
+        home_ids = rates.team_ids([fixture.home_team for fixture in fixtures])
+        away_ids = rates.team_ids([fixture.away_team for fixture in fixtures])
+
+        home_goal_rates = rates.attack_rates[home_ids]
+        away_goal_rates = rates.attack_rates[away_ids]
+
+        if not self.defense:
+            return home_goal_rates, away_goal_rates
+
+        return home_goal_rates * rates.defence_factors[away_ids], away_goal_rates * rates.defence_factors[home_ids]
+
+    def updated(self, results: Iterable[Result]) -> "ScoringRateGoals":
+        scoring_rates = self.scoring_rates.copy()
+        scoring_rates.add_results(results)
+
+        return ScoringRateGoals(scoring_rates, self.defense)
+
+
+class GoalRateSimulator(object):
+    def __init__(self, goal_rates: GoalRates, seed: int = 0) -> None:
+        self.goal_rates = goal_rates
+        self.seed = seed
+
+    def __call__(self, fixture: Fixture, scenario: Scenario, simulations: int) -> SimulationCounts:
+        home_goal_rate, away_goal_rate = self.goal_rates(fixture)
+        generator = fixture_generator(self.seed, fixture, scenario)
+
+        return simulate_outcomes(home_goal_rate, away_goal_rate, scenario, simulations, generator)
+
+    def scorelines(self, fixture: Fixture, scenario: Scenario, simulations: int) -> NDArray[float64]:
+        """Frequencies of the goals each side adds to full time, from the same draws as the outcome counts."""
+        home_goal_rate, away_goal_rate = self.goal_rates(fixture)
+        generator = fixture_generator(self.seed, fixture, scenario)
+
+        goals = simulate_goals(home_goal_rate, away_goal_rate, scenario, simulations, generator)
+        size = max(90 - scenario.minutes_elapsed, 0) + 1
+        counts = np.bincount(goals[:, 0] * size + goals[:, 1], minlength=size * size)
+
+        frequencies: NDArray[float64] = counts.reshape(size, size) / simulations
+        return frequencies
+
+    def updated(self, results: Iterable[Result]) -> "GoalRateSimulator":
+        return GoalRateSimulator(updated_goal_rates(self.goal_rates, results), self.seed)
 
 
-def __outcome_from_goal_rate(
+def updated_goal_rates(goal_rates: GoalRates, results: Iterable[Result]) -> GoalRates:
+    if isinstance(goal_rates, ScoringRateGoals):
+        return goal_rates.updated(results)
+
+    return goal_rates
+
+
+def offense_goal_rates(scoring_rates: ScoringRates) -> GoalRates:
+    return ScoringRateGoals(scoring_rates, defense=False)
+
+
+def offense_and_defense_goal_rates(scoring_rates: ScoringRates) -> GoalRates:
+    return ScoringRateGoals(scoring_rates, defense=True)
+
+
+def offense_simulator(scoring_rates: ScoringRates, seed: int = 0) -> Simulator:
+    return goal_rate_simulator(offense_goal_rates(scoring_rates), seed)
+
+
+def offense_and_defense_simulator(scoring_rates: ScoringRates, seed: int = 0) -> Simulator:
+    return goal_rate_simulator(offense_and_defense_goal_rates(scoring_rates), seed)
+
+
+def goal_rate_simulator(goal_rates: GoalRates, seed: int = 0) -> Simulator:
+    return GoalRateSimulator(goal_rates, seed)
+
+
+def simulate_goals(
+        home_goal_rate: float,
+        away_goal_rate: float,
+        scenario: Scenario,
+        simulations: int,
+        generator: Optional[Generator] = None,
+) -> NDArray[np.int64]:
+    # Each remaining minute is a Bernoulli trial per side, so the goals scored over
+    # the rest of the match are binomial. Drawing those totals for every simulation
+    # in one call is equivalent to rolling each minute separately.
+    remaining_minutes = max(90 - scenario.minutes_elapsed, 0)
+    goal_rates = np.clip([home_goal_rate, away_goal_rate], 0, 1)
+
+    if generator is None:
+        generator = np.random.default_rng()
+    goals: NDArray[np.int64] = generator.binomial(remaining_minutes, goal_rates, size=(simulations, 2))
+    return goals
+
+
+def simulate_outcomes(
         home_goal_rate: float,
         away_goal_rate: float,
         scenario: Scenario,
-) -> Outcome:
-    home_score = scenario.home_goals
-    away_score = scenario.away_goals
-
-    for _ in range(90 - scenario.minutes_elapsed):
-        if random() <= home_goal_rate:
-            home_score += 1
-        if random() <= away_goal_rate:
-            away_score += 1
-
-    if home_score > away_score:
-        return Outcome.HOME
-    elif away_score > home_score:
-        return Outcome.AWAY
-    else:
-        return Outcome.DRAW
+        simulations: int,
+        generator: Optional[Generator] = None,
+) -> SimulationCounts:
+    goals = simulate_goals(home_goal_rate, away_goal_rate, scenario, simulations, generator)
+    goal_difference = goals[:, 0] - goals[:, 1] + (scenario.home_goals - scenario.away_goals)
+
+    home = int(np.count_nonzero(goal_difference > 0))
+    away = int(np.count_nonzero(goal_difference < 0))
+
+    return SimulationCounts(home=home, away=away, draw=simulations - home - away)
@@ -0,0 +1,57 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+from numpy import int64, intp
+from numpy.typing import NDArray
+
+from matchpredictor.matchresults.result import Team
+from matchpredictor.matchresults.results_frame import ResultsFrame
+
+
+class TeamCounts(object):
+    """Named integer counters per team, held in arrays that grow as new teams appear."""
+
+    def __init__(self, *counters: str) -> None:
+        self.team_index: Dict[str, int] = {}
+        self.counters: Dict[str, NDArray[int64]] = {name: np.zeros(0, dtype=int64) for name in counters}
+
+    def index_of(self, team: Team) -> Optional[int]:
+        return self.team_index.get(team.name)
+
+    def count(self, counter: str, team: Team) -> int:
+        index = self.index_of(team)
+        return 0 if index is None else int(self.counters[counter][index])
+
+    def add(self, frame: ResultsFrame, home: Dict[str, NDArray[Any]], away: Dict[str, NDArray[Any]]) -> None:
+        positions = self.__intern(frame)
+        home_positions = positions[frame.home_team]
+        away_positions = positions[frame.away_team]
+        teams = len(self.team_index)
+
+        for name, counts in self.counters.items():
+            totals = np.bincount(home_positions, weights=home[name], minlength=teams) \
+                + np.bincount(away_positions, weights=away[name], minlength=teams)
+
+            grown = np.zeros(teams, dtype=int64)
+            grown[:len(counts)] = counts
+            self.counters[name] = grown + totals.astype(int64)
+
+    def increment(self, counter: str, team: Team, amount: int) -> None:
+        index = self.team_index.setdefault(team.name, len(self.team_index))
+        for name, counts in self.counters.items():
+            if len(counts) <= index:
+                self.counters[name] = np.append(counts, 0)
+
+        self.counters[counter][index] += amount
+
+    def copy(self) -> "TeamCounts":
+        counts = TeamCounts()
+        counts.team_index = dict(self.team_index)
+        counts.counters = {name: values.copy() for name, values in self.counters.items()}
+        return counts
+
+    def __intern(self, frame: ResultsFrame) -> NDArray[intp]:
+        for name in frame.team_names.tolist():
+            self.team_index.setdefault(name, len(self.team_index))
+
+        return np.array([self.team_index[name] for name in frame.team_names.tolist()], dtype=intp)
@@ -0,0 +1,27 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from numpy import float64, int32
+from numpy.typing import NDArray
+from scipy.sparse import csr_matrix  # type: ignore
+
+from matchpredictor.matchresults.result import Team
+
+
+class TeamEncoding(object):
+    """One-hot team columns built as sparse rows from a team to index dictionary."""
+
+    def __init__(self, team_names: Iterable[str]) -> None:
+        self.team_index: Dict[str, int] = {str(name): index for index, name in enumerate(team_names)}
+
+    def index_of(self, team: Team) -> Optional[int]:
+        return self.team_index.get(team.name)
+
+    def encode_teams(self, teams: List[Team]) -> Any:
+        return self.encode(np.array([self.team_index[team.name] for team in teams], dtype=int32))
+
+    def encode(self, team_ids: NDArray[int32]) -> Any:
+        rows = len(team_ids)
+        values: NDArray[float64] = np.ones(rows)
+
+        return csr_matrix((values, team_ids, np.arange(rows + 1)), shape=(rows, len(self.team_index)))
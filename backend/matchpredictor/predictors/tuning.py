@@ -0,0 +1,162 @@
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+import joblib  # type: ignore
+import numpy as np
+from numpy import float32
+from numpy.typing import NDArray
+from scipy.sparse import issparse  # type: ignore
+from sklearn.ensemble import RandomForestRegressor  # type: ignore
+from sklearn.experimental import enable_halving_search_cv  # type: ignore # noqa: F401
+from sklearn.model_selection import (  # type: ignore
+    GridSearchCV,
+    HalvingGridSearchCV,
+    HalvingRandomSearchCV,
+    KFold,
+    RandomizedSearchCV,
+)
+
+random_forest_grid: Dict[str, List[Any]] = {
+    "n_estimators": [50, 100, 200],
+    "max_depth": [None, 10, 20, 30],
+    "min_samples_split": [2, 5, 10],
+    "min_samples_leaf": [1, 2, 4],
+}
+
+
+@dataclass(frozen=True)
+class TuningConfig(object):
+    """How the random forest hyperparameters are searched for.
+
+    search is one of "grid", "halving" or "random". The budget caps the
+    number of candidates tried by the halving and random searches. backend
+    is a joblib backend, "loky" for processes or "threading" for threads,
+    and max_cores caps how many of them run at once. When params_location is
+    set the winning parameters are written there and reused by later
+    trainings instead of searching again. seed fixes the candidates sampled
+    by the random searches and the trees grown, so repeated trainings agree.
+    """
+    search: str = "grid"
+    budget: Optional[int] = None
+    cv: int = 3
+    max_cores: Optional[int] = None
+    backend: str = "loky"
+    params_location: Optional[str] = None
+    seed: int = 0
+
+
+def tuning_config_from_environment(environment: Mapping[str, str]) -> TuningConfig:
+    def optional_int(name: str) -> Optional[int]:
+        value = environment.get(name)
+        return int(value) if value else None
+
+    return TuningConfig(
+        search=environment.get("TUNING_SEARCH", "grid"),
+        budget=optional_int("TUNING_BUDGET"),
+        cv=optional_int("TUNING_CV") or 3,
+        max_cores=optional_int("TUNING_MAX_CORES"),
+        backend=environment.get("TUNING_BACKEND", "loky"),
+        params_location=environment.get("TUNING_PARAMS_LOCATION"),
+        seed=optional_int("TUNING_SEED") or 0,
+    )
+
+
+def tuned_random_forest(
+    x: Any,
+    y: NDArray[Any],
+    config: TuningConfig,
+    param_grid: Dict[str, List[Any]] = random_forest_grid,
+) -> RandomForestRegressor:
+    # The trees work in float32, so converting once here saves every candidate
+    # fit from copying the whole matrix again. Sparse matrices stay sparse.
+    features = x.astype(float32) if issparse(x) else np.ascontiguousarray(x, dtype=float32)
+    n_jobs = _cores(config)
+
+    with joblib.parallel_backend(config.backend, n_jobs=n_jobs):
+        params = read_params(config.params_location, param_grid)
+        if params is not None:
+            return RandomForestRegressor(**params, random_state=config.seed).fit(features, y)
+
+        search = _search(config, param_grid, n_jobs, features.shape[0])
+        search.fit(features, y)
+
+    if config.params_location is not None:
+        write_params(config.params_location, param_grid, search.best_params_)
+
+    return search.best_estimator_
+
+
+def read_params(location: Optional[str], param_grid: Dict[str, List[Any]]) -> Optional[Dict[str, Any]]:
+    if location is None:
+        return None
+
+    try:
+        with open(location) as params_file:
+            saved = json.load(params_file)
+    except (OSError, ValueError):
+        return None
+
+    # Parameters found over a different search space are searched for again.
+    if saved.get("param_grid") != param_grid:
+        return None
+
+    params: Dict[str, Any] = saved["best_params"]
+    return params
+
+
+def write_params(location: str, param_grid: Dict[str, List[Any]], best_params: Dict[str, Any]) -> None:
+    directory = os.path.dirname(location) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(file_descriptor, "w") as params_file:
+        json.dump({"param_grid": param_grid, "best_params": _json_params(best_params)}, params_file)
+    os.replace(temporary_path, location)
+
+
+def _cores(config: TuningConfig) -> int:
+    cores: int = joblib.cpu_count(only_physical_cores=True)
+    if config.max_cores is not None:
+        cores = max(1, min(cores, config.max_cores))
+    return cores
+
+
+def _search(config: TuningConfig, param_grid: Dict[str, List[Any]], n_jobs: int, samples: int) -> Any:
+    # Fixing the folds up front lets every candidate share the same splits.
+    folds = list(KFold(n_splits=config.cv).split(np.zeros((samples, 1))))
+    forest = RandomForestRegressor(random_state=config.seed)
+
+    if config.search == "grid":
+        return GridSearchCV(forest, param_grid, cv=folds, n_jobs=n_jobs)
+
+    if config.search == "random":
+        return RandomizedSearchCV(
+            forest, param_grid, n_iter=config.budget or 20, cv=folds, n_jobs=n_jobs, random_state=config.seed
+        )
+
+    if config.search == "halving":
+        # Candidates start with a few trees and only the best are grown further,
+        # so that the final round uses the largest forest in the grid.
+        halving_grid = {name: values for name, values in param_grid.items() if name != "n_estimators"}
+        halving_options: Dict[str, Any] = dict(
+            resource="n_estimators",
+            max_resources=max(param_grid.get("n_estimators", [200])),
+            min_resources="exhaust",
+            factor=2,
+            cv=folds,
+            n_jobs=n_jobs,
+            random_state=config.seed,
+        )
+
+        if config.budget is None:
+            return HalvingGridSearchCV(forest, halving_grid, **halving_options)
+        return HalvingRandomSearchCV(forest, halving_grid, n_candidates=config.budget, **halving_options)
+
+    raise ValueError(f"Unknown search {config.search}")
+
+
+def _json_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: value.item() if isinstance(value, np.generic) else value for name, value in params.items()}
@@ -0,0 +1,105 @@
+import gc
+import os
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Mapping
+
+from flask import Flask
+from gunicorn.app.base import BaseApplication  # type: ignore
+
+from matchpredictor.app import AppEnvironment, create_app
+from matchpredictor.environment import app_environment_from_environment
+
+
+@dataclass(frozen=True)
+class ServingConfig(object):
+    bind: str = "0.0.0.0:5001"
+    workers: int = 2
+    threads: int = 1
+    timeout: int = 120
+    graceful_timeout: int = 30
+    keep_alive: int = 5
+    max_requests: int = 0
+    max_requests_jitter: int = 0
+
+
+def serving_config_from_environment(environment: Mapping[str, str]) -> ServingConfig:
+    defaults = ServingConfig()
+
+    def int_setting(name: str, default: int) -> int:
+        value = environment.get(name)
+        return int(value) if value else default
+
+    return ServingConfig(
+        bind=f"0.0.0.0:{environment.get('PORT', 5001)}",
+        workers=int_setting("SERVE_WORKERS", os.cpu_count() or defaults.workers),
+        threads=int_setting("SERVE_THREADS", defaults.threads),
+        timeout=int_setting("SERVE_TIMEOUT", defaults.timeout),
+        graceful_timeout=int_setting("SERVE_GRACEFUL_TIMEOUT", defaults.graceful_timeout),
+        keep_alive=int_setting("SERVE_KEEP_ALIVE", defaults.keep_alive),
+        max_requests=int_setting("SERVE_MAX_REQUESTS", defaults.max_requests),
+        max_requests_jitter=int_setting("SERVE_MAX_REQUESTS_JITTER", defaults.max_requests_jitter),
+    )
+
+
+def gunicorn_options(config: ServingConfig) -> Dict[str, Any]:
+    return {
+        "bind": config.bind,
+        "workers": config.workers,
+        "threads": config.threads,
+        "timeout": config.timeout,
+        "graceful_timeout": config.graceful_timeout,
+        "keepalive": config.keep_alive,
+        "max_requests": config.max_requests,
+        "max_requests_jitter": config.max_requests_jitter,
+        # The app, and every model in it, is built once in the master process
+        # and the workers forked from it share those pages copy-on-write. Training
+        # threads do not survive the fork, so each worker starts its own if a
+        # model has to be trained again.
+        "preload_app": True,
+        "pre_fork": _freeze_before_fork,
+    }
+
+
+def check_ingest_is_served_by_one_worker(env: AppEnvironment, config: ServingConfig) -> None:
+    """Ingested results are only held by the worker that receives them, so with
+    several workers they would serve different models, and a recycled worker
+    would lose them. Ingest is only served by a single, long lived worker.
+    """
+    if env.ingest_token and (config.workers > 1 or config.max_requests > 0):
+        raise ValueError("INGEST_TOKEN needs SERVE_WORKERS=1 and no SERVE_MAX_REQUESTS")
+
+
+def _freeze_before_fork(server: Any, worker: Any) -> None:
+    # Moving the loaded models out of the collector's reach stops garbage
+    # collection in the workers from writing to, and so copying, shared pages.
+    gc.freeze()
+
+
+class PreloadedServer(BaseApplication):  # type: ignore[misc]
+    """Gunicorn serving an app that was created before the workers are forked.
+
+    A HUP signal gracefully replaces the workers from the same preloaded app,
+    which drops any results ingested since the master process started.
+    Retraining the models needs a restart of the master process.
+    """
+
+    def __init__(self, app: Flask, config: ServingConfig) -> None:
+        self.application = app
+        self.options = gunicorn_options(config)
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Flask:
+        return self.application
+
+
+if __name__ == "__main__":
+    app_environment = app_environment_from_environment(os.environ)
+    serving_config = serving_config_from_environment(os.environ)
+    check_ingest_is_served_by_one_worker(app_environment, serving_config)
+
+    # Models are trained before forking, so that every worker shares them.
+    PreloadedServer(create_app(replace(app_environment, lazy_models=False)), serving_config).run()
@@ -1,15 +1,21 @@
-from flask import Blueprint, jsonify, Response
+from dataclasses import asdict
 
+from flask import Blueprint, Response
+
+from matchpredictor.cached_json import CachedJson
 from matchpredictor.teams.teams_provider import TeamsProvider
 
 
 def teams_api(teams_provider: TeamsProvider) -> Blueprint:
     api = Blueprint("teams_api", __name__)
 
+    # The teams only change with the training data, so the response is built once.
+    teams_json = CachedJson({
+        "teams": [asdict(team) for team in teams_provider.all()]
+    })
+
     @api.route("/teams", methods=["GET"])
     def teams() -> Response:
-        return jsonify({
-            "teams": teams_provider.all()
-        })
+        return teams_json.response()
 
     return api
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Iterable
+
+import numpy as np
 
 from matchpredictor.matchresults.result import Fixture, Team
+from matchpredictor.matchresults.results_frame import ResultsFrame
 
 
 @dataclass(frozen=True)
@@ -12,10 +15,23 @@ class TeamWithLeagues(object):
 
 class TeamsProvider:
 
-    def __init__(self, fixtures: List[Fixture]) -> None:
-        self.fixtures = fixtures
+    def __init__(self, fixtures: Iterable[Fixture] | ResultsFrame) -> None:
+        # Only the teams are kept, so the fixtures can be freed once they are counted.
+        if isinstance(fixtures, ResultsFrame):
+            self.__teams = self.__teams_in_frame(fixtures)
+        else:
+            self.__teams = self.__teams_in_fixtures(fixtures)
+
+        self.__team_names = {team.name for team in self.__teams}
 
     def all(self) -> List[TeamWithLeagues]:
+        return self.__teams
+
+    def knows(self, team: Team) -> bool:
+        return team.name in self.__team_names
+
+    @staticmethod
+    def __teams_in_fixtures(fixtures: Iterable[Fixture]) -> List[TeamWithLeagues]:
         teams: Dict[str, Set[str]] = {}
 
         def add_team(team: Team, league: str) -> None:
@@ -24,8 +40,23 @@ class TeamsProvider:
             else:
                 teams[team.name] = {league}
 
-        for fixture in self.fixtures:
+        for fixture in fixtures:
             add_team(fixture.home_team, fixture.league)
             add_team(fixture.away_team, fixture.league)
 
         return [TeamWithLeagues(name=k, leagues=sorted(list(v))) for k, v in teams.items()]
+
+    @staticmethod
+    def __teams_in_frame(frame: ResultsFrame) -> List[TeamWithLeagues]:
+        appearances = np.column_stack([frame.home_team, frame.away_team]).ravel()
+        leagues = np.repeat(frame.league, 2)
+
+        teams, first_appearance = np.unique(appearances, return_index=True)
+        team_leagues: Dict[int, Set[str]] = {int(team): set() for team in teams[np.argsort(first_appearance)]}
+        for team, league in set(zip(appearances.tolist(), leagues.tolist())):
+            team_leagues[team].add(str(frame.leagues[league]))
+
+        return [
+            TeamWithLeagues(name=str(frame.team_names[team]), leagues=sorted(league_names))
+            for team, league_names in team_leagues.items()
+        ]
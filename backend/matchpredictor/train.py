@@ -0,0 +1,21 @@
+import os
+import sys
+from dataclasses import replace
+
+from matchpredictor.app import build_environment_model_provider, load_training_data
+from matchpredictor.environment import app_environment_from_environment
+
+environment = app_environment_from_environment(os.environ, serving=False)
+app_environment = replace(environment, model_store_location=environment.model_store_location or "models")
+
+model_provider = build_environment_model_provider(app_environment, load_training_data(app_environment))
+
+for model in model_provider.list():
+    print(f"Trained {model.name}")
+
+failed = [name for name, state in model_provider.readiness().items() if state == "failed"]
+for name in failed:
+    print(f"Failed to train {name}")
+
+if failed:
+    sys.exit(1)
@@ -1,10 +1,14 @@
+import datetime
+import time
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import date
-import datetime
-from typing import Optional
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
 
 import dacite
 import requests
+from requests.adapters import HTTPAdapter
 
 
 @dataclass(frozen=True)
@@ -30,24 +34,113 @@ class FootballDataMatchesResponse:
     matches: list[MatchJson]
 
 
-class FootballDataApiClient:
+DateWindow = Tuple[date, date]
+
+
+class UpstreamUnavailable(Exception):
+    pass
 
-    def __init__(self, api_key: str):
+
+class FootballDataApiClient:
+    """Fetches matches over a pooled session, caching each date window.
+
+    Concurrent requests for the same window share one upstream call, and when
+    upstream is rate limited or failing the last good response is served
+    until it is older than stale_seconds.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = 'https://api.football-data.org/v4',
+        timeout_seconds: float = 10,
+        cache_seconds: float = 300,
+        stale_seconds: float = 86_400,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.api_key = api_key
+        self.base_url = base_url
+        self.timeout_seconds = timeout_seconds
+        self.cache_seconds = cache_seconds
+        self.stale_seconds = stale_seconds
+        self.__clock = clock
+        self.__session = requests.Session()
+        self.__session.headers['X-Auth-Token'] = api_key
+        self.__session.mount('https://', HTTPAdapter(pool_maxsize=16))
+        self.__session.mount('http://', HTTPAdapter(pool_maxsize=16))
+        self.__cached: Dict[DateWindow, Tuple[float, FootballDataMatchesResponse]] = {}
+        self.__in_flight: Dict[DateWindow, Future[Optional[FootballDataMatchesResponse]]] = {}
+        self.__lock = Lock()
 
     nine_days = datetime.timedelta(days=9)
 
     def fetch_matches(self, date_from: date) -> Optional[FootballDataMatchesResponse]:
-        date_to = date_from + self.nine_days
+        window = (date_from, date_from + self.nine_days)
+
+        with self.__lock:
+            cached = self.__cached.get(window)
+            if cached is not None and self.__clock() - cached[0] < self.cache_seconds:
+                return cached[1]
+
+            in_flight = self.__in_flight.get(window)
+            if in_flight is not None:
+                leader = False
+            else:
+                in_flight = self.__in_flight[window] = Future()
+                leader = True
+
+        if not leader:
+            return in_flight.result()
 
         try:
-            football_data_api_response = requests \
-                .get(f'https://api.football-data.org/v4/matches?dateFrom={date_from}&dateTo={date_to}', headers={'X-Auth-Token': self.api_key}) \
-                .json()
+            matches = self.__fetch_or_stale(window)
+            in_flight.set_result(matches)
+            return matches
+        except BaseException as e:
+            in_flight.set_exception(e)
+            raise
+        finally:
+            with self.__lock:
+                del self.__in_flight[window]
+
+    def __fetch_or_stale(self, window: DateWindow) -> Optional[FootballDataMatchesResponse]:
+        try:
+            matches = self.__fetch(window)
+        except UpstreamUnavailable:
+            with self.__lock:
+                cached = self.__cached.get(window)
+            if cached is not None and self.__clock() - cached[0] < self.stale_seconds:
+                return cached[1]
+            return None
+
+        if matches is not None:
+            now = self.__clock()
+            with self.__lock:
+                self.__cached = {
+                    w: entry for w, entry in self.__cached.items() if now - entry[0] < self.stale_seconds
+                }
+                self.__cached[window] = (now, matches)
+        return matches
 
+    def __fetch(self, window: DateWindow) -> Optional[FootballDataMatchesResponse]:
+        date_from, date_to = window
+
+        try:
+            response = self.__session.get(
+                f'{self.base_url}/matches',
+                params={'dateFrom': str(date_from), 'dateTo': str(date_to)},
+                timeout=self.timeout_seconds,
+            )
+        except requests.RequestException as e:
+            raise UpstreamUnavailable() from e
+
+        if response.status_code == 429 or response.status_code >= 500:
+            raise UpstreamUnavailable()
+
+        try:
             return dacite.core.from_dict(
                 data_class=FootballDataMatchesResponse,
-                data=football_data_api_response
+                data=response.json()
             )
 
         except requests.JSONDecodeError:
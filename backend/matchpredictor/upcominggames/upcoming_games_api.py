@@ -1,9 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 
-from flask import Blueprint, Response, jsonify
+from flask import Blueprint, Response, jsonify, request
 
+from matchpredictor.forecast.forecaster import Forecaster
+from matchpredictor.matchresults.result import Fixture, Outcome, Team
+from matchpredictor.teams.teams_provider import TeamsProvider
 from matchpredictor.upcominggames.football_data_api_client import FootballDataApiClient, FootballDataMatchesResponse, \
     MatchJson
 
@@ -20,6 +23,26 @@ class UpcomingGamesResponse:
     games: List[UpcomingGame]
 
 
+@dataclass(frozen=True)
+class GameForecast:
+    model_name: str
+    outcome: Outcome
+    confidence: Optional[float]
+
+
+@dataclass(frozen=True)
+class UpcomingGameWithForecasts:
+    league: str
+    home: str
+    away: str
+    forecasts: List[GameForecast]
+
+
+@dataclass(frozen=True)
+class UpcomingGamesWithForecastsResponse:
+    games: List[UpcomingGameWithForecasts]
+
+
 @dataclass(frozen=True)
 class LeagueMappingKey:
     areaName: str
@@ -55,7 +78,47 @@ def response_from_football_data_matches(matches_response: FootballDataMatchesRes
     return UpcomingGamesResponse(games)
 
 
-def upcoming_games_api(api_client: FootballDataApiClient) -> Blueprint:
+def fixture_for(game: UpcomingGame) -> Fixture:
+    return Fixture(home_team=Team(name=game.home), away_team=Team(name=game.away), league=game.league)
+
+
+def forecast_upcoming_games(
+    games: List[UpcomingGame],
+    model_names: List[str],
+    forecaster: Forecaster,
+    teams_provider: TeamsProvider,
+) -> Optional[UpcomingGamesWithForecastsResponse]:
+    fixtures = [fixture_for(game) for game in games]
+    known_fixtures = [
+        f for f in fixtures if teams_provider.knows(f.home_team) and teams_provider.knows(f.away_team)
+    ]
+
+    forecasts: Dict[Fixture, List[GameForecast]] = {}
+    for model_name in model_names:
+        model_forecasts = forecaster.forecast_batch(known_fixtures, model_name)
+
+        if model_forecasts is None:
+            return None
+
+        for forecast in filter(None, model_forecasts):
+            forecasts.setdefault(forecast.fixture, []).append(
+                GameForecast(model_name=model_name, outcome=forecast.outcome, confidence=forecast.confidence)
+            )
+
+    return UpcomingGamesWithForecastsResponse([
+        UpcomingGameWithForecasts(
+            league=game.league,
+            home=game.home,
+            away=game.away,
+            forecasts=forecasts.get(fixture, []),
+        )
+        for game, fixture in zip(games, fixtures)
+    ])
+
+
+def upcoming_games_api(
+    api_client: FootballDataApiClient, forecaster: Forecaster, teams_provider: TeamsProvider
+) -> Blueprint:
     api = Blueprint('upcoming_games_api', __name__)
 
     @api.get('/upcoming-games/<date_from_str>')
@@ -73,6 +136,17 @@ def upcoming_games_api(api_client: FootballDataApiClient) -> Blueprint:
         matches = maybe_football_data_api_matches
         upcoming_games_response = response_from_football_data_matches(matches)
 
-        return jsonify(upcoming_games_response)
+        model_names = request.args.getlist('model_name')
+        if not model_names:
+            return jsonify(upcoming_games_response)
+
+        with_forecasts = forecast_upcoming_games(
+            upcoming_games_response.games, model_names, forecaster, teams_provider
+        )
+
+        if with_forecasts is None:
+            return Response('Cannot forecast upcoming games', 400)
+
+        return jsonify(with_forecasts)
 
     return api
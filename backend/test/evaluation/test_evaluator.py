@@ -0,0 +1,50 @@
+import math
+from unittest import TestCase
+
+from matchpredictor.evaluation.evaluator import Evaluator, outcome_probabilities
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.predictors.home_predictor import HomePredictor
+from matchpredictor.predictors.predictor import Prediction, Predictor
+
+
+class HalfSure(Predictor):
+    def predict(self, fixture: Fixture) -> Prediction:
+        return Prediction(Outcome.HOME, 0.5)
+
+
+def result(outcome: Outcome) -> Result:
+    return Result(Fixture(Team("Chelsea"), Team("Burnley"), "League"), outcome, 0, 0, 2022)
+
+
+validation_data = [result(Outcome.HOME), result(Outcome.HOME), result(Outcome.AWAY), result(Outcome.DRAW)]
+
+
+class TestEvaluator(TestCase):
+    def test_measure_accuracy(self) -> None:
+        accuracy, _ = Evaluator(HomePredictor()).measure_accuracy(validation_data)
+
+        self.assertEqual(0.5, accuracy)
+
+    def test_evaluate(self) -> None:
+        evaluation = Evaluator(HalfSure()).evaluate(validation_data, chunk_size=3, latency_samples=2)
+
+        self.assertEqual(4, evaluation.predictions)
+        self.assertEqual(0.5, evaluation.accuracy)
+        self.assertAlmostEqual(1.5 * math.log(2), evaluation.log_loss or 0)
+        self.assertAlmostEqual(0.625, evaluation.brier_score or 0)
+        self.assertGreater(evaluation.predictions_per_second, 0)
+        self.assertLessEqual(evaluation.latency_p50, evaluation.latency_p99)
+
+    def test_outcome_probabilities(self) -> None:
+        self.assertEqual(
+            {Outcome.HOME: 0.2, Outcome.AWAY: 0.6, Outcome.DRAW: 0.2},
+            outcome_probabilities(Prediction(Outcome.AWAY, 0.6)),
+        )
+        self.assertIsNone(outcome_probabilities(Prediction(Outcome.HOME)))
+
+    def test_evaluate__without_confidences(self) -> None:
+        evaluation = Evaluator(HomePredictor()).evaluate(validation_data, chunk_size=3)
+
+        self.assertEqual(0.5, evaluation.accuracy)
+        self.assertIsNone(evaluation.log_loss)
+        self.assertIsNone(evaluation.brier_score)
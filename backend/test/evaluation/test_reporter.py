@@ -0,0 +1,48 @@
+import io
+import json
+import os
+import tempfile
+from test.evaluation.test_evaluator import validation_data
+from unittest import TestCase
+
+from matchpredictor.evaluation.reporter import Reporter
+from matchpredictor.model.model_provider import Model, ModelProvider
+from matchpredictor.predictors.alphabet_predictor import AlphabetPredictor
+from matchpredictor.predictors.home_predictor import HomePredictor
+
+model_provider = ModelProvider([
+    Model("Home", HomePredictor()),
+    Model("Alphabet", AlphabetPredictor()),
+])
+
+
+class TestReporter(TestCase):
+    def test_run_report(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            location = os.path.join(directory, "report.json")
+
+            output = io.StringIO()
+            Reporter(
+                "League", validation_data, model_provider, chunk_size=3, json_location=location, output=output
+            ).run_report()
+
+            with open(location) as report_file:
+                report = json.load(report_file)
+
+        self.assertEqual("League", report["title"])
+        self.assertEqual(["Home", "Alphabet"], [r["label"] for r in report["reports"]])
+        self.assertEqual(0.5, report["reports"][0]["evaluation"]["accuracy"])
+        self.assertEqual(4, report["reports"][1]["evaluation"]["predictions"])
+        self.assertIsNone(report["reports"][0]["evaluation"]["log_loss"])
+        self.assertIn(" Home ", output.getvalue())
+        self.assertIn("N/A", output.getvalue())
+
+    def test_run_report__in_worker_processes(self) -> None:
+        reporter = Reporter("League", validation_data, model_provider, workers=2, chunk_size=1, output=io.StringIO())
+
+        reporter.run_report()
+
+        self.assertEqual([0.5, 4], [
+            reporter.reports[0].evaluation.accuracy,
+            reporter.reports[1].evaluation.predictions,
+        ])
@@ -1,9 +1,18 @@
-from test.test_builders import build_app_environment
+from test.test_builders import build_app_environment, wait_for_models
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from unittest import TestCase
 
 import responses
+from flask import Flask
 
 from matchpredictor.app import create_app
+from matchpredictor.forecast.forecast_api import forecast_api
+from matchpredictor.forecast.forecaster import Forecaster
+from matchpredictor.model.model_provider import Model, ModelNotReady, ModelProvider, PendingModel
+from matchpredictor.model.models_api import model_not_ready
+from matchpredictor.predictors.home_predictor import HomePredictor
 
 
 class TestForecastApi(TestCase):
@@ -57,6 +66,7 @@ class TestForecastApi(TestCase):
 
         app = create_app(build_app_environment(regression_csv_include=True))
         self.test_client = app.test_client()
+        wait_for_models(self.test_client, "Full simulator", "Full simulator (exact)")
 
     def test_forecast_full_simulator_model(self) -> None:
         response = self.test_client.get(
@@ -121,6 +131,58 @@ class TestForecastApi(TestCase):
 
         self.assertEqual(response.status_code, 400)
 
+    def test_forecasts(self) -> None:
+        response = self.test_client.post(
+            "/forecasts",
+            json={
+                "model_names": ["Home", "Full simulator (exact)"],
+                "fixtures": [
+                    {"home_name": "Rarely Scores", "away_name": "Always Scores", "league": "Test League"},
+                    {"home_name": "Other", "away_name": "Other", "league": "Test League"},
+                ],
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+        forecasts = response.get_json()["forecasts"]
+        self.assertEqual(
+            [f and (f["model_name"], f["outcome"], f["confidence"]) for f in forecasts],
+            [("Home", "home", None), None, ("Full simulator (exact)", "away", 1.0), None],
+        )
+        self.assertEqual(forecasts[0]["fixture"]["home_team"], {"name": "Rarely Scores"})
+
+    def test_forecasts_bad_model(self) -> None:
+        response = self.test_client.post(
+            "/forecasts",
+            json={
+                "model_names": ["Home", "Bad model"],
+                "fixtures": [
+                    {"home_name": "Rarely Scores", "away_name": "Always Scores", "league": "Test League"},
+                ],
+            },
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_forecasts_bad_request(self) -> None:
+        response = self.test_client.post("/forecasts", json={"model_names": ["Home"]})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_forecasts_model_names_not_a_list(self) -> None:
+        response = self.test_client.post(
+            "/forecasts",
+            json={
+                "model_names": 5,
+                "fixtures": [
+                    {"home_name": "Rarely Scores", "away_name": "Always Scores", "league": "Test League"},
+                ],
+            },
+        )
+
+        self.assertEqual(response.status_code, 400)
+
     def test_forecast_in_progress(self) -> None:
         response = self.test_client.get(
             "/forecast-in-progress"
@@ -157,6 +219,48 @@ class TestForecastApi(TestCase):
             },
         )
 
+    def test_forecast_scorelines(self) -> None:
+        response = self.test_client.get(
+            "/forecast-scorelines"
+            "?home_name=Rarely+Scores"
+            "&away_name=Always+Scores"
+            "&league=Test+League"
+            "&model_name=Full+simulator+%28exact%29"
+            "&minutes_elapsed=90"
+            "&home_goals=3"
+            "&away_goals=0"
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+        body = response.get_json()
+        self.assertEqual(body["scorelines"], [{"home_goals": 3, "away_goals": 0, "probability": 1.0}])
+        self.assertEqual(body["markets"]["home"], 1.0)
+        self.assertEqual(body["markets"]["both_teams_score"], 0.0)
+
+    def test_forecast_scorelines_negative_goals(self) -> None:
+        response = self.test_client.get(
+            "/forecast-scorelines"
+            "?home_name=Rarely+Scores"
+            "&away_name=Always+Scores"
+            "&league=Test+League"
+            "&model_name=Full+simulator+%28exact%29"
+            "&home_goals=-1"
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_forecast_scorelines_wrong_model(self) -> None:
+        response = self.test_client.get(
+            "/forecast-scorelines"
+            "?home_name=Rarely+Scores"
+            "&away_name=Always+Scores"
+            "&league=Test+League"
+            "&model_name=Home"
+        )
+
+        self.assertEqual(response.status_code, 400)
+
     def test_forecast_in_progress_wrong_model(self) -> None:
         response = self.test_client.get(
             "/forecast-in-progress"
@@ -170,3 +274,33 @@ class TestForecastApi(TestCase):
         )
 
         self.assertEqual(response.status_code, 400)
+
+
+class TestForecastApiWhileTraining(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.release = threading.Event()
+
+        def train() -> Model:
+            self.release.wait(5)
+            return Model("Slow", HomePredictor())
+
+        provider = ModelProvider([PendingModel("Slow", train)], partial(ThreadPoolExecutor, 1))
+        provider.warm_up()
+
+        app = Flask(__name__)
+        app.register_blueprint(forecast_api(Forecaster(provider)))
+        app.register_error_handler(ModelNotReady, model_not_ready)
+        self.test_client = app.test_client()
+
+    def tearDown(self) -> None:
+        self.release.set()
+        super().tearDown()
+
+    def test_forecast_model_not_ready(self) -> None:
+        response = self.test_client.get(
+            "/forecast?home_name=Rarely+Scores&away_name=Always+Scores&league=Test+League&model_name=Slow"
+        )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "10")
@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+from matchpredictor.forecast.forecast_cache import ForecastCache, ForecastCacheStats, ForecastKey
+from matchpredictor.matchresults.result import Fixture, Outcome, Scenario, Team
+from matchpredictor.predictors.predictor import Prediction
+
+
+class FakeClock(object):
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def key(home_name: str, version: str = "v1", scenario: Scenario | None = None) -> ForecastKey:
+    return ForecastKey("Home", version, Fixture(Team(home_name), Team("Burnley"), "League"), scenario)
+
+
+class TestForecastCache(TestCase):
+    def test_get_and_put(self) -> None:
+        cache = ForecastCache()
+
+        self.assertIsNone(cache.get(key("Chelsea")))
+        cache.put(key("Chelsea"), Prediction(Outcome.HOME))
+
+        self.assertEqual(Prediction(Outcome.HOME), cache.get(key("Chelsea")))
+        self.assertIsNone(cache.get(key("Chelsea", version="v2")))
+        self.assertIsNone(cache.get(key("Chelsea", scenario=Scenario(10, 0, 0))))
+        self.assertEqual(ForecastCacheStats(hits=1, misses=3, size=1), cache.stats())
+
+    def test_expires_entries(self) -> None:
+        clock = FakeClock()
+        cache = ForecastCache(ttl_seconds=10, clock=clock)
+        cache.put(key("Chelsea"), Prediction(Outcome.HOME))
+        cache.put(key("Roma"), Prediction(Outcome.AWAY), ttl_seconds=60)
+
+        clock.now = 30
+
+        self.assertIsNone(cache.get(key("Chelsea")))
+        self.assertEqual(Prediction(Outcome.AWAY), cache.get(key("Roma")))
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = ForecastCache(max_entries=2)
+        cache.put(key("Chelsea"), Prediction(Outcome.HOME))
+        cache.put(key("Roma"), Prediction(Outcome.HOME))
+        cache.get(key("Chelsea"))
+
+        cache.put(key("Lazio"), Prediction(Outcome.HOME))
+
+        self.assertIsNotNone(cache.get(key("Chelsea")))
+        self.assertIsNone(cache.get(key("Roma")))
+        self.assertIsNotNone(cache.get(key("Lazio")))
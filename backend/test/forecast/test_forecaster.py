@@ -1,9 +1,12 @@
 from unittest import TestCase
 
+from matchpredictor.forecast.forecast_cache import ForecastCache, ForecastCacheStats
 from matchpredictor.forecast.forecaster import Forecaster, Forecast
 from matchpredictor.matchresults.result import Outcome, Team, Fixture, Scenario
 from matchpredictor.model.model_provider import ModelProvider, Model
 from matchpredictor.predictors.predictor import Prediction, Predictor, InProgressPredictor
+from matchpredictor.predictors.scorelines import ScorelineProbability
+from matchpredictor.predictors.simulation_predictor import ExactPredictor
 
 
 class Home(Predictor):
@@ -19,6 +22,19 @@ class Away(InProgressPredictor):
         return Prediction(outcome=Outcome.AWAY)
 
 
+class Counting(InProgressPredictor):
+    def __init__(self) -> None:
+        self.predictions = 0
+
+    def predict_in_progress(self, fixture: Fixture, scenario: Scenario) -> Prediction:
+        self.predictions += 1
+        return Prediction(outcome=Outcome.DRAW)
+
+    def predict(self, fixture: Fixture) -> Prediction:
+        self.predictions += 1
+        return Prediction(outcome=Outcome.DRAW)
+
+
 class TestForecaster(TestCase):
     home_model = Model(
         name="Home",
@@ -97,6 +113,40 @@ class TestForecaster(TestCase):
 
         self.assertIsNone(forecast)
 
+    def test_forecast_batch(self) -> None:
+        forecasts = self.forecaster.forecast_batch(
+            [
+                Fixture(Team(name='Chelsea'), Team(name='Burnley'), 'UEFA Champions League'),
+                Fixture(Team(name='Chelsea'), Team(name='Chelsea'), 'UEFA Champions League'),
+                Fixture(Team(name='Roma'), Team(name='Chelsea'), 'UEFA Champions League'),
+            ],
+            'Home',
+        )
+
+        self.assertEqual(forecasts, [
+            Forecast(
+                fixture=Fixture(Team(name='Chelsea'), Team(name='Burnley'), 'UEFA Champions League'),
+                model_name='Home',
+                outcome=Outcome.HOME,
+                confidence=None
+            ),
+            None,
+            Forecast(
+                fixture=Fixture(Team(name='Roma'), Team(name='Chelsea'), 'UEFA Champions League'),
+                model_name='Home',
+                outcome=Outcome.HOME,
+                confidence=None
+            ),
+        ])
+
+    def test_forecast_batch__when_model_cannot_be_found(self) -> None:
+        forecasts = self.forecaster.forecast_batch(
+            [Fixture(Team(name='Chelsea'), Team(name='Burnley'), 'UEFA Champions League')],
+            'This model name does not exist'
+        )
+
+        self.assertIsNone(forecasts)
+
     def test_forecast_in_progress__with_away_model(self) -> None:
         forecast = self.forecaster.forecast_in_progress(
             Fixture(
@@ -144,3 +194,51 @@ class TestForecaster(TestCase):
         )
 
         self.assertIsNone(forecast)
+
+    def test_forecast__caches_predictions(self) -> None:
+        predictor = Counting()
+        forecaster = Forecaster(ModelProvider([Model('Counting', predictor, 'v1')]), ForecastCache())
+        fixture = Fixture(Team(name='Chelsea'), Team(name='Burnley'), 'UEFA Champions League')
+
+        forecaster.forecast(fixture, 'Counting')
+        forecaster.forecast(fixture, 'Counting')
+        forecaster.forecast_batch([fixture, Fixture(Team(name='Roma'), Team(name='Lazio'), 'Serie A')], 'Counting')
+        forecaster.forecast_in_progress(fixture, Scenario(30, 1, 2), 'Counting')
+        forecaster.forecast_in_progress(fixture, Scenario(30, 1, 2), 'Counting')
+
+        self.assertEqual(3, predictor.predictions)
+        self.assertEqual(ForecastCacheStats(hits=3, misses=3, size=3), forecaster.cache_stats())
+
+    def test_forecast__does_not_cache_models_that_opt_out(self) -> None:
+        predictor = Counting()
+        forecaster = Forecaster(ModelProvider([Model('Counting', predictor, cache_seconds=0)]), ForecastCache())
+        fixture = Fixture(Team(name='Chelsea'), Team(name='Burnley'), 'UEFA Champions League')
+
+        forecaster.forecast(fixture, 'Counting')
+        forecaster.forecast(fixture, 'Counting')
+
+        self.assertEqual(2, predictor.predictions)
+
+    def test_forecast_scorelines(self) -> None:
+        forecaster = Forecaster(ModelProvider([Model('Exact', ExactPredictor(lambda fixture: (0.0, 0.0)))]))
+        fixture = Fixture(Team(name='Chelsea'), Team(name='Burnley'), 'UEFA Champions League')
+
+        forecast = forecaster.forecast_scorelines(fixture, Scenario(30, 2, 1), 'Exact')
+
+        assert forecast is not None
+        self.assertEqual(forecast.scorelines, [ScorelineProbability(home_goals=2, away_goals=1, probability=1.0)])
+        self.assertEqual(forecast.markets.home, 1.0)
+        self.assertEqual(forecast.markets.both_teams_score, 1.0)
+        self.assertEqual([line.over for line in forecast.markets.total_goals], [1.0, 1.0, 1.0, 0.0, 0.0])
+
+    def test_forecast_scorelines__when_model_has_no_scorelines(self) -> None:
+        fixture = Fixture(Team(name='Chelsea'), Team(name='Burnley'), 'UEFA Champions League')
+
+        self.assertIsNone(self.forecaster.forecast_scorelines(fixture, Scenario(0, 0, 0), 'Away'))
+        self.assertIsNone(self.forecaster.forecast_scorelines(fixture, Scenario(0, 0, 0), 'Unknown'))
+
+    def test_forecast_scorelines__with_negative_goals(self) -> None:
+        forecaster = Forecaster(ModelProvider([Model('Exact', ExactPredictor(lambda fixture: (0.0, 0.0)))]))
+        fixture = Fixture(Team(name='Chelsea'), Team(name='Burnley'), 'UEFA Champions League')
+
+        self.assertIsNone(forecaster.forecast_scorelines(fixture, Scenario(30, -1, 0), 'Exact'))
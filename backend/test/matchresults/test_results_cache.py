@@ -0,0 +1,121 @@
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+import responses
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.matchresults.results_provider import load_results
+
+csv_body = """season,date,league_id,league,team1,team2,spi1,spi2,prob1,prob2,probtie,proj_score1,proj_score2,importance1,importance2,score1,score2,xg1,xg2,nsxg1,nsxg2,adj_score1,adj_score2
+2016,2016-08-13,2411,Barclays Premier League,Hull City,Leicester City,53.57,66.81,0.3801,0.3548,0.2651,1.4,1.39,38.1,22.2,2,1,0.85,2.77,0.17,1.25,2.1,1.05
+2016,2016-08-13,2411,Barclays Premier League,Burnley,Swansea City,58.98,59.74,0.4289,0.3013,0.2699,1.51,1.29,34.6,33.7,0,1,1.24,1.84,1.71,1.56,0.0,1.05"""
+
+expected_first_result = Result(
+    fixture=Fixture(
+        home_team=Team(name="Hull City"),
+        away_team=Team(name="Leicester City"),
+        home_importance=38.1,
+        away_importance=22.2,
+        home_spi=53.57,
+        away_spi=66.81,
+        home_xg=0.85,
+        away_xg=2.77,
+        home_nsxg=0.17,
+        away_nsxg=1.25,
+        league="Barclays Premier League",
+    ),
+    outcome=Outcome.HOME,
+    home_goals=2,
+    away_goals=1,
+    season=2016,
+)
+
+
+class TestResultsCache(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.cache.cleanup()
+        super().tearDown()
+
+    @responses.activate
+    def test_revalidates_with_etag_and_last_modified(self) -> None:
+        responses.add(
+            method="GET",
+            url="https://example.com/some.csv",
+            status=200,
+            body=csv_body,
+            headers={"ETag": '"v1"', "Last-Modified": "Sat, 01 Jul 2023 10:00:00 GMT"},
+        )
+        responses.add(method="GET", url="https://example.com/some.csv", status=304)
+
+        first_load = load_results("https://example.com/some.csv", cache_location=self.cache.name)
+        second_load = load_results("https://example.com/some.csv", cache_location=self.cache.name)
+
+        self.assertEqual(first_load, second_load)
+        self.assertEqual(expected_first_result, second_load[0])
+        self.assertEqual(Outcome.AWAY, second_load[1].outcome)
+
+        conditional_request = responses.calls[1].request
+        self.assertEqual('"v1"', conditional_request.headers["If-None-Match"])
+        self.assertEqual("Sat, 01 Jul 2023 10:00:00 GMT", conditional_request.headers["If-Modified-Since"])
+
+    @responses.activate
+    def test_closes_the_response_when_the_snapshot_is_current(self) -> None:
+        responses.add(method="GET", url="https://example.com/some.csv", status=200, body=csv_body, headers={"ETag": '"v1"'})
+        responses.add(method="GET", url="https://example.com/some.csv", status=304)
+        load_results("https://example.com/some.csv", cache_location=self.cache.name)
+
+        with patch.object(requests.Response, "close", autospec=True) as close:
+            load_results("https://example.com/some.csv", cache_location=self.cache.name)
+
+        self.assertEqual(304, close.call_args.args[0].status_code)
+
+    @responses.activate
+    def test_applies_the_filter_to_the_snapshot(self) -> None:
+        responses.add(method="GET", url="https://example.com/some.csv", status=200, body=csv_body, headers={"ETag": '"v1"'})
+        responses.add(method="GET", url="https://example.com/some.csv", status=304)
+
+        load_results("https://example.com/some.csv", cache_location=self.cache.name)
+        results = load_results(
+            "https://example.com/some.csv",
+            lambda r: r.fixture.home_team == Team("Burnley"),
+            cache_location=self.cache.name,
+        )
+
+        self.assertEqual(1, len(results))
+        self.assertEqual(Team("Swansea City"), results[0].fixture.away_team)
+
+    @responses.activate
+    def test_serves_the_snapshot_when_upstream_fails(self) -> None:
+        responses.add(method="GET", url="https://example.com/some.csv", status=200, body=csv_body, headers={"ETag": '"v1"'})
+        responses.add(method="GET", url="https://example.com/some.csv", status=500)
+        responses.add(method="GET", url="https://example.com/some.csv", body=requests.ConnectionError())
+
+        load_results("https://example.com/some.csv", cache_location=self.cache.name)
+
+        self.assertEqual(2, len(load_results("https://example.com/some.csv", cache_location=self.cache.name)))
+        self.assertEqual(2, len(load_results("https://example.com/some.csv", cache_location=self.cache.name)))
+
+    @responses.activate
+    def test_downloads_again_when_the_file_changes(self) -> None:
+        responses.add(method="GET", url="https://example.com/some.csv", status=200, body=csv_body, headers={"ETag": '"v1"'})
+        responses.add(
+            method="GET",
+            url="https://example.com/some.csv",
+            status=200,
+            body=csv_body.splitlines()[0] + "\n" + csv_body.splitlines()[1],
+            headers={"ETag": '"v2"'},
+        )
+        responses.add(method="GET", url="https://example.com/some.csv", status=304)
+
+        load_results("https://example.com/some.csv", cache_location=self.cache.name)
+        load_results("https://example.com/some.csv", cache_location=self.cache.name)
+        results = load_results("https://example.com/some.csv", cache_location=self.cache.name)
+
+        self.assertEqual([expected_first_result], results)
+        self.assertEqual('"v2"', responses.calls[2].request.headers["If-None-Match"])
@@ -0,0 +1,80 @@
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.matchresults.results_frame import ResultsFrame
+
+results = [
+    Result(
+        fixture=Fixture(
+            home_team=Team("Hull City"),
+            away_team=Team("Leicester City"),
+            league="Barclays Premier League",
+            home_importance=38.1,
+            away_importance=22.2,
+            home_spi=53.57,
+            away_spi=66.81,
+            home_xg=0.85,
+            away_xg=2.77,
+            home_nsxg=0.17,
+            away_nsxg=1.25,
+        ),
+        outcome=Outcome.HOME,
+        home_goals=2,
+        away_goals=1,
+        season=2016,
+    ),
+    Result(Fixture(Team("Burnley"), Team("Hull City"), "Barclays Premier League"), Outcome.DRAW, 0, 0, 2017),
+    Result(Fixture(Team("Roma"), Team("Lazio"), "Italy Serie A"), Outcome.AWAY, 1, 3, 2017),
+]
+
+
+class TestResultsFrame(TestCase):
+    def test_round_trips_results(self) -> None:
+        frame = ResultsFrame.from_results(results)
+
+        self.assertEqual(3, len(frame))
+        self.assertEqual(results, frame.results())
+
+    def test_columns(self) -> None:
+        frame = ResultsFrame.from_results(results)
+
+        self.assertEqual(["Burnley", "Hull City", "Lazio", "Leicester City", "Roma"], frame.team_names.tolist())
+        self.assertEqual([1, 0, 4], frame.home_team.tolist())
+        self.assertEqual([0, 2, 1], frame.outcome.tolist())
+        self.assertEqual(np.float32, frame.home_spi.dtype)
+        self.assertEqual(1, frame.team_id(Team("Hull City")))
+        self.assertIsNone(frame.team_id(Team("Not in the results")))
+
+    def test_filter_and_slice(self) -> None:
+        frame = ResultsFrame.from_results(results)
+
+        self.assertEqual(results[1:], frame.filter(frame.season == 2017).results())
+        self.assertEqual(results[:2], frame[:2].results())
+
+    def test_filter_and_slice_keep_only_the_teams_they_use(self) -> None:
+        frame = ResultsFrame.from_results(results)
+
+        filtered = frame.filter(frame.season == 2017)
+        self.assertEqual(["Burnley", "Hull City", "Lazio", "Roma"], filtered.team_names.tolist())
+        self.assertEqual(["Barclays Premier League", "Italy Serie A"], filtered.leagues.tolist())
+        self.assertIsNone(filtered.team_id(Team("Leicester City")))
+
+        sliced = frame[2:]
+        self.assertEqual(["Lazio", "Roma"], sliced.team_names.tolist())
+        self.assertEqual(["Italy Serie A"], sliced.leagues.tolist())
+        self.assertEqual(results[2:], sliced.results())
+
+    def test_add(self) -> None:
+        frame = ResultsFrame.from_results(results[:1]) + ResultsFrame.from_results(results[1:])
+
+        self.assertEqual(results, frame.results())
+        self.assertEqual(5, len(frame.team_names))
+
+    def test_save_and_load(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            ResultsFrame.from_results(results).save(directory)
+
+            self.assertEqual(results, ResultsFrame.load(directory).results())
@@ -3,7 +3,7 @@ from unittest import TestCase
 import responses
 
 from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
-from matchpredictor.matchresults.results_provider import load_results
+from matchpredictor.matchresults.results_provider import ResultsSplit, load_results, load_splits
 
 
 class TestResultsProvider(TestCase):
@@ -111,3 +111,39 @@ class TestResultsProvider(TestCase):
         )
 
         self.assertEqual(0, len(results))
+
+    @responses.activate
+    def test_load_splits_in_one_pass(self) -> None:
+        responses.add(
+            method="GET",
+            url="https://example.com/some.csv",
+            status=200,
+            body="""season,date,league_id,league,team1,team2,spi1,spi2,prob1,prob2,probtie,proj_score1,proj_score2,importance1,importance2,score1,score2,xg1,xg2,nsxg1,nsxg2,adj_score1,adj_score2
+2019,2019-08-10,2411,Barclays Premier League,Burnley,Southampton,60.0,61.0,0.4,0.3,0.3,1.3,1.2,30.0,30.0,3,0,1.0,1.0,1.0,1.0,3.0,0.0
+2020,2020-09-12,2411,Barclays Premier League,Fulham,Arsenal,58.0,80.0,0.2,0.6,0.2,1.0,2.0,20.0,40.0,0,3,0.5,2.0,0.5,2.0,0.0,3.0
+2020,2020-09-12,2412,English League Championship,Luton Town,Barnsley,45.0,44.0,0.4,0.3,0.3,1.2,1.1,20.0,20.0,1,1,1.0,1.0,1.0,1.0,1.0,1.0
+2021,2021-08-13,2411,Barclays Premier League,Brentford,Arsenal,60.0,79.0,0.3,0.5,0.2,1.2,1.6,30.0,40.0,2,0,1.3,1.4,1.5,1.2,2.1,0.0
+not a season,2021-08-14,2411,Barclays Premier League,Burnley,Brighton,60.0,65.0,0.4,0.3,0.3,1.3,1.2,30.0,30.0,1,2,1.0,1.0,1.0,1.0,1.0,2.0""",
+        )
+
+        premier_league = frozenset(["Barclays Premier League"])
+        splits = load_splits("https://example.com/some.csv", {
+            "training": ResultsSplit(before_season=2021, leagues=premier_league),
+            "validation": ResultsSplit(first_season=2021, before_season=2022, leagues=premier_league),
+            "everything": ResultsSplit(),
+        })
+
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual([2019, 2020], splits["training"].season.tolist())
+        self.assertEqual(["Brentford"], [r.fixture.home_team.name for r in splits["validation"]])
+        self.assertEqual(4, len(splits["everything"]))
+
+    def test_split_keeps_raw_rows(self) -> None:
+        split = ResultsSplit(first_season=2020, before_season=2022, leagues=frozenset(["Eredivisie"]))
+
+        self.assertTrue(split.keeps_row({"season": "2021", "league": "Eredivisie"}))
+        self.assertFalse(split.keeps_row({"season": "2019", "league": "Eredivisie"}))
+        self.assertFalse(split.keeps_row({"season": "2022", "league": "Eredivisie"}))
+        self.assertFalse(split.keeps_row({"season": "2021", "league": "Serie A"}))
+        self.assertFalse(split.keeps_row({"season": "", "league": "Eredivisie"}))
+        self.assertTrue(ResultsSplit().keeps_row({}))
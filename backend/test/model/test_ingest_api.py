@@ -0,0 +1,56 @@
+from typing import Any, Dict, List
+from unittest import TestCase
+
+from flask import Flask
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Team
+from matchpredictor.model.ingest_api import ingest_api
+from matchpredictor.model.model_provider import Model, ModelProvider
+from matchpredictor.predictors.past_results_predictor import train_results_predictor
+
+headers = {"Authorization": "Bearer secret"}
+
+
+def results_json(home_goals: Any = 0, away_goals: Any = 3) -> Dict[str, List[Dict[str, Any]]]:
+    return {"results": [{
+        "home_name": "Chelsea",
+        "away_name": "Burnley",
+        "league": "England",
+        "home_goals": home_goals,
+        "away_goals": away_goals,
+        "season": 2023,
+    }]}
+
+
+class TestIngestApi(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.provider = ModelProvider([Model("Points", train_results_predictor([]))])
+
+        app = Flask(__name__)
+        app.register_blueprint(ingest_api(self.provider, "secret"))
+        self.test_client = app.test_client()
+
+    def test_ingest(self) -> None:
+        response = self.test_client.post("/results", json=results_json(), headers=headers)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"ingested": 1}, response.get_json())
+
+        predictor = self.provider.get_predictor("Points")
+        assert predictor is not None
+        self.assertEqual(
+            Outcome.AWAY,
+            predictor.predict(Fixture(Team("Chelsea"), Team("Burnley"), "England")).outcome,
+        )
+
+    def test_ingest_without_the_token(self) -> None:
+        response = self.test_client.post("/results", json=results_json())
+
+        self.assertEqual(401, response.status_code)
+
+    def test_ingest_bad_results(self) -> None:
+        for body in [{}, {"results": 5}, results_json(home_goals="2"), results_json(away_goals=-1)]:
+            response = self.test_client.post("/results", json=body, headers=headers)
+
+            self.assertEqual(400, response.status_code)
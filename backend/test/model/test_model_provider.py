@@ -1,7 +1,13 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from unittest import TestCase
+from unittest.mock import patch
 
-from matchpredictor.matchresults.result import Outcome, Fixture, Scenario
-from matchpredictor.model.model_provider import ModelProvider, Model
+from matchpredictor.matchresults.result import Outcome, Fixture, Result, Scenario, Team
+from matchpredictor.model.model_provider import ModelNotReady, ModelProvider, Model, PendingModel
+from matchpredictor.predictors.past_results_predictor import train_results_predictor
 from matchpredictor.predictors.predictor import Prediction, Predictor, InProgressPredictor
 
 
@@ -46,3 +52,155 @@ class TestModelProvider(TestCase):
 
     def test_list(self) -> None:
         self.assertEqual(self.provider.list(), [self.home_model, self.away_model])
+
+    def test_ingest(self) -> None:
+        points_predictor = train_results_predictor([
+            Result(Fixture(Team("Chelsea"), Team("Burnley"), "League"), Outcome.HOME, 1, 0, 2022),
+        ])
+        points_model = Model(name="points model", predictor=points_predictor, version="v1")
+        provider = ModelProvider([self.home_model, points_model])
+        fixture = Fixture(Team("Chelsea"), Team("Burnley"), "League")
+
+        provider.ingest([
+            Result(Fixture(Team("Burnley"), Team("Chelsea"), "League"), Outcome.HOME, 2, 0, 2022),
+            Result(Fixture(Team("Burnley"), Team("Roma"), "League"), Outcome.DRAW, 1, 1, 2022),
+        ])
+
+        ingested_predictor = provider.get_predictor("points model")
+        assert ingested_predictor is not None
+        self.assertEqual(Outcome.AWAY, ingested_predictor.predict(fixture).outcome)
+        self.assertEqual(Outcome.HOME, points_predictor.predict(fixture).outcome)
+        self.assertNotEqual("v1", provider.list()[1].version)
+        self.assertIs(provider.list()[0], self.home_model)
+
+    def test_pending_models_are_trained_on_first_use(self) -> None:
+        trainings = []
+
+        def train() -> Model:
+            trainings.append(1)
+            return self.away_model
+
+        provider = ModelProvider([self.home_model, PendingModel("away model", train, in_progress=True)])
+
+        self.assertEqual({"home model": "ready", "away model": "pending"}, provider.readiness())
+        self.assertEqual([self.home_model.name, "away model"], [m.name for m in provider.catalog()])
+        self.assertTrue(provider.catalog()[1].predicts_in_progress())
+        self.assertEqual([], trainings)
+
+        self.assertEqual(self.away_predictor, provider.get_in_progress_predictor("away model"))
+        self.assertEqual(self.away_predictor, provider.get_predictor("away model"))
+        self.assertEqual({"home model": "ready", "away model": "ready"}, provider.readiness())
+        self.assertEqual(1, len(trainings))
+
+    def test_warm_up_trains_in_the_background(self) -> None:
+        release = threading.Event()
+
+        def train() -> Model:
+            release.wait(5)
+            return self.away_model
+
+        provider = ModelProvider([self.home_model, PendingModel("away model", train)], partial(ThreadPoolExecutor, 2))
+        provider.warm_up()
+
+        self.assertEqual(self.home_predictor, provider.get_predictor("home model"))
+        self.assertEqual("training", provider.readiness()["away model"])
+        with self.assertRaises(ModelNotReady):
+            provider.get_model("away model")
+
+        release.set()
+
+        self.assertEqual([self.home_model, self.away_model], provider.list())
+        self.assertEqual("ready", provider.readiness()["away model"])
+
+    def test_warm_up_trains_models_concurrently(self) -> None:
+        # Each model waits for the other, so they only finish if they train at the same time.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def train(model: Model) -> Model:
+            barrier.wait()
+            return model
+
+        provider = ModelProvider([
+            PendingModel("home model", lambda: train(self.home_model)),
+            PendingModel("away model", lambda: train(self.away_model)),
+        ], partial(ThreadPoolExecutor, 2))
+
+        provider.warm_up()
+
+        self.assertEqual([self.home_model, self.away_model], provider.list())
+
+    def test_training_left_running_before_a_fork_is_started_again(self) -> None:
+        release = threading.Event()
+        attempts = []
+
+        def train() -> Model:
+            attempts.append(1)
+            if len(attempts) == 1:
+                # Stands in for a pool thread that does not survive the fork.
+                release.wait(5)
+            return self.away_model
+
+        provider = ModelProvider([PendingModel("away model", train)], partial(ThreadPoolExecutor, 1))
+        provider.warm_up()
+
+        with patch("matchpredictor.model.model_provider.os.getpid", return_value=os.getpid() + 1):
+            self.assertEqual("pending", provider.readiness()["away model"])
+            self.assertEqual([self.away_model], provider.list())
+
+        release.set()
+        self.assertEqual(2, len(attempts))
+
+    def test_failed_training_is_retried(self) -> None:
+        attempts = []
+
+        def train() -> Model:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("no data")
+            return self.away_model
+
+        provider = ModelProvider([PendingModel("away model", train)])
+
+        with self.assertRaises(ModelNotReady), self.assertLogs("matchpredictor.model.model_provider", "ERROR"):
+            provider.get_model("away model")
+        self.assertEqual({"away model": "failed"}, provider.readiness())
+
+        self.assertEqual(self.away_model, provider.get_model("away model"))
+        self.assertEqual({"away model": "ready"}, provider.readiness())
+
+    def test_list_and_ingest_skip_failed_models(self) -> None:
+        def train() -> Model:
+            raise ValueError("no data")
+
+        points_model = Model("points model", train_results_predictor([]), "v1")
+        provider = ModelProvider([points_model, PendingModel("broken model", train)])
+
+        with self.assertLogs("matchpredictor.model.model_provider", "ERROR"):
+            self.assertEqual([points_model], provider.list())
+
+        provider.ingest([Result(Fixture(Team("Burnley"), Team("Chelsea"), "League"), Outcome.HOME, 2, 0, 2022)])
+
+        with self.assertLogs("matchpredictor.model.model_provider", "ERROR"):
+            self.assertNotEqual("v1", provider.list()[0].version)
+        self.assertEqual("failed", provider.readiness()["broken model"])
+
+    def test_ingest_reaches_models_still_training(self) -> None:
+        release = threading.Event()
+        points_model = Model("points model", train_results_predictor([]), "v1")
+
+        def train() -> Model:
+            release.wait(5)
+            return points_model
+
+        provider = ModelProvider([PendingModel("points model", train)], partial(ThreadPoolExecutor, 1))
+        provider.warm_up()
+
+        provider.ingest([Result(Fixture(Team("Burnley"), Team("Chelsea"), "League"), Outcome.HOME, 2, 0, 2022)])
+        provider.ingest([Result(Fixture(Team("Roma"), Team("Lazio"), "League"), Outcome.DRAW, 1, 1, 2022)])
+        release.set()
+
+        [model] = provider.list()
+        self.assertNotEqual("v1", model.version)
+        predict = model.predictor.predict
+        self.assertEqual(Outcome.HOME, predict(Fixture(Team("Burnley"), Team("Chelsea"), "League")).outcome)
+        self.assertEqual(Outcome.AWAY, predict(Fixture(Team("Chelsea"), Team("Roma"), "League")).outcome)
@@ -0,0 +1,90 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.model.model_store import ModelStore, model_version, results_fingerprint, training_modules
+from matchpredictor.predictors.past_results_predictor import train_results_predictor
+from matchpredictor.predictors.predictor import Predictor
+from matchpredictor.predictors.simulation_predictor import train_offense_predictor
+
+
+def build_result(home_goals: int, away_goals: int) -> Result:
+    return Result(
+        fixture=Fixture(Team("Chelsea"), Team("Burnley"), "England"),
+        outcome=Outcome.HOME if home_goals > away_goals else Outcome.AWAY,
+        home_goals=home_goals,
+        away_goals=away_goals,
+        season=2022,
+    )
+
+
+class TestModelStore(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = ModelStore(self.directory.name)
+        self.results = [build_result(3, 0)]
+        self.trained = 0
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def train(self) -> Predictor:
+        self.trained += 1
+        return train_offense_predictor(self.results, 10)
+
+    def test_load_or_train__trains_once(self) -> None:
+        version = model_version(results_fingerprint(self.results), train_offense_predictor, (10,))
+
+        self.store.load_or_train("Offense simulator", version, self.train)
+        predictor = self.store.load_or_train("Offense simulator", version, self.train)
+
+        self.assertEqual(1, self.trained)
+        self.assertEqual(
+            Outcome.HOME,
+            predictor.predict(Fixture(Team("Chelsea"), Team("Burnley"), "England")).outcome,
+        )
+
+    def test_load_or_train__retrains_when_data_changes(self) -> None:
+        version = model_version(results_fingerprint(self.results), train_offense_predictor, (10,))
+        self.store.load_or_train("Offense simulator", version, self.train)
+
+        self.results = [build_result(3, 0), build_result(0, 1)]
+        new_version = model_version(results_fingerprint(self.results), train_offense_predictor, (10,))
+        self.store.load_or_train("Offense simulator", new_version, self.train)
+
+        self.assertNotEqual(version, new_version)
+        self.assertEqual(2, self.trained)
+        self.assertEqual([f"offense-simulator-{new_version}.joblib"], os.listdir(self.directory.name))
+
+    def test_load__when_nothing_is_stored(self) -> None:
+        self.assertIsNone(self.store.load("Points", "0123456789abcdef"))
+
+    def test_model_version__depends_on_parameters(self) -> None:
+        fingerprint = results_fingerprint(self.results)
+
+        self.assertNotEqual(
+            model_version(fingerprint, train_offense_predictor, (10,)),
+            model_version(fingerprint, train_offense_predictor, (20,)),
+        )
+        self.assertNotEqual(
+            model_version(fingerprint, train_offense_predictor, ()),
+            model_version(fingerprint, train_results_predictor, ()),
+        )
+
+    def test_training_modules__include_the_modules_the_trainer_uses(self) -> None:
+        modules = training_modules(train_offense_predictor.__module__)
+
+        self.assertIn("matchpredictor.predictors.simulation_predictor", modules)
+        self.assertIn("matchpredictor.predictors.simulators.simulator", modules)
+        self.assertIn("matchpredictor.predictors.simulators.scoring_rates", modules)
+
+    def test_save__removes_the_temporary_file_when_writing_fails(self) -> None:
+        with patch("matchpredictor.model.model_store.joblib.dump", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.store.save("Points", "0123456789abcdef", self.train())
+
+        self.assertEqual([], os.listdir(self.directory.name))
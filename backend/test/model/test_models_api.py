@@ -69,10 +69,15 @@ class TestModelsApi(TestCase):
                 "models": [
                     {"name": "Home", "predicts_in_progress": False},
                     {"name": "Points", "predicts_in_progress": False},
+                    {"name": "Elo", "predicts_in_progress": False},
                     {"name": "Offense simulator (fast)", "predicts_in_progress": True},
                     {"name": "Offense simulator", "predicts_in_progress": True},
+                    {"name": "Offense simulator (exact)", "predicts_in_progress": True},
                     {"name": "Full simulator (fast)", "predicts_in_progress": True},
                     {"name": "Full simulator", "predicts_in_progress": True},
+                    {"name": "Full simulator (exact)", "predicts_in_progress": True},
+                    {"name": "Poisson", "predicts_in_progress": True},
+                    {"name": "Dixon-Coles", "predicts_in_progress": True},
                     {"name": "Alphabet Provider", "predicts_in_progress": False},
                     {"name": "Random Forest Predictor", "predicts_in_progress": False},
                     # {"name": "Linear regression", "predicts_in_progress": False},
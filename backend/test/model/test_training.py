@@ -0,0 +1,50 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from unittest import TestCase
+
+from matchpredictor.model.training import SharedArtifact, train_concurrently
+
+
+class TestTraining(TestCase):
+    def test_shared_artifact_is_built_once(self) -> None:
+        builds: List[int] = []
+
+        def build() -> int:
+            time.sleep(0.05)
+            builds.append(1)
+            return 42
+
+        artifact = SharedArtifact(build)
+        values: List[int] = []
+        threads = [threading.Thread(target=lambda: values.append(artifact.get())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([42] * 4, values)
+        self.assertEqual(1, len(builds))
+
+    def test_train_concurrently_runs_the_trainers_at_the_same_time(self) -> None:
+        # Each trainer waits for the other, so they only finish if they overlap.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def trainer(value: int) -> int:
+            barrier.wait()
+            return value
+
+        with ThreadPoolExecutor(2) as executor:
+            futures = train_concurrently({"one": lambda: trainer(1), "two": lambda: trainer(2)}, executor)
+
+            self.assertEqual({"one": 1, "two": 2}, {name: future.result() for name, future in futures.items()})
+
+    def test_train_concurrently_without_an_executor(self) -> None:
+        def broken() -> int:
+            raise ValueError("no data")
+
+        futures = train_concurrently({"working": lambda: 1, "broken": broken})
+
+        self.assertEqual(1, futures["working"].result())
+        self.assertIsInstance(futures["broken"].exception(), ValueError)
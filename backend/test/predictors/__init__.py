@@ -1 +1,5 @@
+import os
+import tempfile
+
 csv_location = 'https://projects.fivethirtyeight.com/soccer-api/club/spi_matches.csv'
+csv_cache_location = os.path.join(tempfile.gettempdir(), 'matchpredictor-csv-cache')
@@ -0,0 +1,21 @@
+from typing import List
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+
+
+def build_result(
+    home: str, away: str, home_goals: int, away_goals: int, league: str = 'Some league', season: int = 2022
+) -> Result:
+    outcome = Outcome.HOME if home_goals > away_goals else Outcome.AWAY if away_goals > home_goals else Outcome.DRAW
+    return Result(Fixture(Team(home), Team(away), league), outcome, home_goals, away_goals, season)
+
+
+# A season where Strong beats everyone, Middling beats Weak, and Weak wins nothing.
+three_team_results: List[Result] = [
+    build_result('Strong', 'Weak', 3, 0),
+    build_result('Weak', 'Strong', 0, 2),
+    build_result('Strong', 'Middling', 2, 1),
+    build_result('Middling', 'Weak', 1, 1),
+    build_result('Weak', 'Middling', 0, 1),
+    build_result('Middling', 'Strong', 0, 0),
+]
@@ -1,4 +1,4 @@
-from test.predictors import csv_location
+from test.predictors import csv_cache_location, csv_location
 from unittest import TestCase
 
 from matchpredictor.evaluation.evaluator import Evaluator
@@ -11,9 +11,10 @@ from matchpredictor.predictors.alphabet_predictor import \
 class TestAlphaBetPredictor(TestCase):
     def test_accuracy(self) -> None:
         training_data = training_results(
-            csv_location, 2019, result_filter=lambda result: result.season >= 2015
+            csv_location, 2019, result_filter=lambda result: result.season >= 2015,
+            cache_location=csv_cache_location,
         )
-        validation_data = validation_results(csv_location, 2019)
+        validation_data = validation_results(csv_location, 2019, cache_location=csv_cache_location)
         predictor = train_alphabet_predictor(training_data)
 
         accuracy, _ = Evaluator(predictor).measure_accuracy(validation_data)
@@ -3,12 +3,12 @@ from unittest import TestCase
 from matchpredictor.matchresults.results_provider import validation_results
 from matchpredictor.evaluation.evaluator import Evaluator
 from matchpredictor.predictors.home_predictor import HomePredictor
-from test.predictors import csv_location
+from test.predictors import csv_cache_location, csv_location
 
 
 class TestHomePredictor(TestCase):
     def test_accuracy(self) -> None:
-        validation_data = validation_results(csv_location, 2019)
+        validation_data = validation_results(csv_location, 2019, cache_location=csv_cache_location)
         accuracy, _ = Evaluator(HomePredictor()).measure_accuracy(validation_data)
 
         self.assertGreaterEqual(accuracy, .33)
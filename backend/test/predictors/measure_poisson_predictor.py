@@ -0,0 +1,17 @@
+from unittest import TestCase
+
+from matchpredictor.evaluation.evaluator import Evaluator
+from matchpredictor.matchresults.results_provider import training_results, validation_results
+from matchpredictor.predictors.poisson_predictor import train_dixon_coles_predictor
+from test.predictors import csv_cache_location, csv_location
+
+
+class TestDixonColesPredictor(TestCase):
+    def test_accuracy_last_two_seasons(self) -> None:
+        training_data = training_results(csv_location, 2019, result_filter=lambda result: result.season >= 2017, cache_location=csv_cache_location)
+        validation_data = validation_results(csv_location, 2019, cache_location=csv_cache_location)
+        predictor = train_dixon_coles_predictor(training_data)
+
+        accuracy, _ = Evaluator(predictor).measure_accuracy(validation_data)
+
+        self.assertGreaterEqual(accuracy, .33)
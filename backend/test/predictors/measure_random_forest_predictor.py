@@ -1,4 +1,4 @@
-from test.predictors import csv_location
+from test.predictors import csv_cache_location, csv_location
 from unittest import TestCase
 
 from matchpredictor.evaluation.evaluator import Evaluator
@@ -13,14 +13,9 @@ from matchpredictor.predictors.random_forest_regressor import (
 
 class TestRandomForestPredictor(TestCase):
     def test_accuracy(self) -> None:
-        training_data = training_results(
-            csv_location, 2023, result_filter=lambda result: result.season >= 2021
-        )
+        training_data = training_results(csv_location, 2023, cache_location=csv_cache_location)
 
-        # Select just 500 rows for the traing data
-        training_data = training_data[:500]
-
-        validation_data = validation_results(csv_location, 2021)
+        validation_data = validation_results(csv_location, 2021, cache_location=csv_cache_location)
         predictor = train_random_forest_predictor(training_data)
 
         accuracy, _ = Evaluator(predictor).measure_accuracy(validation_data)
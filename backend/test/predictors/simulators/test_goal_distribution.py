@@ -0,0 +1,14 @@
+from unittest import TestCase
+
+from matchpredictor.predictors.simulators.goal_distribution import binomial_pmf
+
+
+class TestGoalDistribution(TestCase):
+    def test_binomial_pmf(self) -> None:
+        pmf = binomial_pmf(2, 0.5)
+
+        self.assertEqual([0.25, 0.5, 0.25], list(pmf))
+
+    def test_binomial_pmf__with_certain_goals(self) -> None:
+        self.assertEqual([0, 0, 1], list(binomial_pmf(2, 1.5)))
+        self.assertEqual([1, 0, 0], list(binomial_pmf(2, 0)))
@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+import numpy as np
+
+from matchpredictor.matchresults.result import Scenario
+from matchpredictor.predictors.simulators.goal_distribution import OutcomeProbabilities, remaining_goals_distribution
+from matchpredictor.predictors.simulators.in_play_table import InPlayTable, in_play_table
+
+
+def exact_outcome_probabilities(
+        home_goal_rate: float,
+        away_goal_rate: float,
+        scenario: Scenario,
+) -> OutcomeProbabilities:
+    """The reference the table is checked against: sums the full joint distribution of remaining goals."""
+    remaining_minutes = max(90 - scenario.minutes_elapsed, 0)
+    joint = remaining_goals_distribution(home_goal_rate, away_goal_rate, remaining_minutes)
+
+    goals = np.arange(remaining_minutes + 1)
+    goal_difference = np.subtract.outer(goals, goals) + (scenario.home_goals - scenario.away_goals)
+
+    return OutcomeProbabilities(
+        home=float(joint[goal_difference > 0].sum()),
+        away=float(joint[goal_difference < 0].sum()),
+        draw=float(joint[goal_difference == 0].sum()),
+    )
+
+
+class TestInPlayTable(TestCase):
+    def test_outcome_probabilities(self) -> None:
+        probabilities = InPlayTable(0.5, 0.5).outcome_probabilities(Scenario(89, 0, 0))
+
+        self.assertEqual(OutcomeProbabilities(home=0.25, away=0.25, draw=0.5), probabilities)
+
+    def test_outcome_probabilities__include_the_current_score(self) -> None:
+        probabilities = InPlayTable(0.5, 0.5).outcome_probabilities(Scenario(89, 0, 1))
+
+        self.assertEqual(OutcomeProbabilities(home=0, away=0.75, draw=0.25), probabilities)
+
+    def test_outcome_probabilities__sum_to_one(self) -> None:
+        probabilities = InPlayTable(0.015, 0.012).outcome_probabilities(Scenario(0, 0, 0))
+
+        self.assertAlmostEqual(1, probabilities.home + probabilities.away + probabilities.draw)
+
+    def test_matches_the_exact_distribution(self) -> None:
+        table = InPlayTable(0.015, 0.011)
+
+        for scenario in [Scenario(0, 0, 0), Scenario(45, 2, 1), Scenario(80, 0, 3), Scenario(89, 1, 1)]:
+            expected = exact_outcome_probabilities(0.015, 0.011, scenario)
+            actual = table.outcome_probabilities(scenario)
+
+            self.assertAlmostEqual(expected.home, actual.home)
+            self.assertAlmostEqual(expected.away, actual.away)
+            self.assertAlmostEqual(expected.draw, actual.draw)
+
+    def test_finished_and_lopsided_matches(self) -> None:
+        table = InPlayTable(0.5, 0.5)
+
+        finished = table.outcome_probabilities(Scenario(90, 1, 0))
+        lopsided = table.outcome_probabilities(Scenario(0, 0, 95))
+
+        self.assertEqual((1, 0, 0), (finished.home, finished.away, finished.draw))
+        self.assertEqual((0, 1, 0), (lopsided.home, lopsided.away, lopsided.draw))
+
+    def test_memoizes_tables_per_goal_rates(self) -> None:
+        self.assertIs(in_play_table(0.02, 0.01), in_play_table(0.02, 0.01))
+        self.assertIsNot(in_play_table(0.02, 0.01), in_play_table(0.02, 0.03))
@@ -1,6 +1,7 @@
 from unittest import TestCase
 
 from matchpredictor.matchresults.result import Result, Fixture, Team, Outcome
+from matchpredictor.matchresults.results_frame import ResultsFrame
 from matchpredictor.predictors.simulators.scoring_rates import ScoringRates
 
 
@@ -55,3 +56,44 @@ class TestScoringRates(TestCase):
 
         self.assertEqual(1, rates.defensive_factor(Team("Not in the results")))
         self.assertEqual(1 / 90, rates.goals_scored_per_minute(Team("Not in the results")))
+
+    def test_add_results(self) -> None:
+        first = Result(Fixture(Team("Chelsea"), Team("Liverpool"), "England"), Outcome.HOME, 4, 2, 2022)
+        second = Result(Fixture(Team("Burnley"), Team("Chelsea"), "England"), Outcome.DRAW, 3, 3, 2022)
+
+        rates = ScoringRates([first])
+        updated = rates.copy()
+        updated.add_results([second])
+
+        self.assertEqual(4 / 90, rates.goals_scored_per_minute(Team("Chelsea")))
+        self.assertEqual(7 / 180, updated.goals_scored_per_minute(Team("Chelsea")))
+        self.assertEqual(3 / 90, updated.goals_scored_per_minute(Team("Burnley")))
+        self.assertEqual(ScoringRates([first, second]).defensive_factor(Team("Chelsea")),
+                         updated.defensive_factor(Team("Chelsea")))
+
+    def test_compiled_arrays(self) -> None:
+        rates = ScoringRates([
+            Result(Fixture(Team("Chelsea"), Team("Liverpool"), "England"), Outcome.HOME, 4, 2, 2022),
+        ])
+
+        chelsea = rates.team_id(Team("Chelsea"))
+        unknown = rates.team_id(Team("Not in the results"))
+
+        self.assertEqual([0, 1, 2], rates.team_ids([Team("Chelsea"), Team("Liverpool"), Team("Unknown")]).tolist())
+        self.assertEqual(4 / 90, rates.attack_rates[chelsea])
+        self.assertEqual(2 / 3, rates.defence_factors[chelsea])
+        self.assertEqual(1 / 90, rates.attack_rates[unknown])
+        self.assertEqual(1, rates.defence_factors[unknown])
+
+    def test_rates_from_a_filtered_frame_match_rates_from_its_results(self) -> None:
+        frame = ResultsFrame.from_results([
+            Result(Fixture(Team("Old"), Team("Chelsea"), "England"), Outcome.HOME, 3, 0, 2019),
+            Result(Fixture(Team("Chelsea"), Team("Burnley"), "England"), Outcome.HOME, 3, 1, 2022),
+            Result(Fixture(Team("Burnley"), Team("Chelsea"), "England"), Outcome.DRAW, 2, 2, 2022),
+        ])
+        kept = frame.filter(frame.season == 2022)
+
+        self.assertEqual(
+            ScoringRates(list(kept)).defensive_factor(Team("Old")),
+            ScoringRates(kept).defensive_factor(Team("Old")),
+        )
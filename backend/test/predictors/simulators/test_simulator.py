@@ -0,0 +1,68 @@
+from math import comb
+from typing import List
+from unittest import TestCase
+
+from matchpredictor.matchresults.result import Fixture, Scenario, Team
+from matchpredictor.predictors.simulators.simulator import (
+    GoalRateSimulator,
+    SimulationCounts,
+    fixture_generator,
+    simulate_outcomes,
+)
+
+
+def binomial(n: int, p: float, k: int) -> float:
+    return comb(n, k) * p ** k * (1 - p) ** (n - k)
+
+
+class TestSimulator(TestCase):
+    def test_simulate_outcomes__counts_every_simulation(self) -> None:
+        counts = simulate_outcomes(0.02, 0.01, Scenario(0, 0, 0), 1_000)
+
+        self.assertEqual(1_000, counts.home + counts.away + counts.draw)
+
+    def test_simulate_outcomes__when_match_is_over(self) -> None:
+        counts = simulate_outcomes(0.5, 0.5, Scenario(90, 2, 1), 100)
+
+        self.assertEqual(SimulationCounts(home=100, away=0, draw=0), counts)
+
+    def test_simulate_outcomes__with_certain_goals(self) -> None:
+        counts = simulate_outcomes(1.5, 0, Scenario(88, 0, 1), 100)
+
+        self.assertEqual(SimulationCounts(home=100, away=0, draw=0), counts)
+
+    def test_simulate_outcomes__matches_per_minute_model(self) -> None:
+        home_rate, away_rate, minutes = 0.02, 0.01, 90
+        expected_home = sum(
+            binomial(minutes, home_rate, h) * binomial(minutes, away_rate, a)
+            for h in range(minutes + 1)
+            for a in range(h)
+        )
+
+        counts = simulate_outcomes(home_rate, away_rate, Scenario(0, 0, 0), 100_000)
+
+        self.assertAlmostEqual(expected_home, counts.home / 100_000, delta=0.01)
+
+    def test_goal_rate_simulator__is_reproducible(self) -> None:
+        fixture = Fixture(Team("Home team"), Team("Away team"), "League")
+        simulator = GoalRateSimulator(lambda f: (0.02, 0.015), seed=42)
+
+        first = simulator(fixture, Scenario(0, 0, 0), 1_000)
+
+        self.assertEqual(first, simulator(fixture, Scenario(0, 0, 0), 1_000))
+        self.assertEqual(first, GoalRateSimulator(lambda f: (0.02, 0.015), seed=42)(fixture, Scenario(0, 0, 0), 1_000))
+
+    def test_fixture_generator__streams_differ_by_seed_fixture_and_scenario(self) -> None:
+        fixture = Fixture(Team("Home team"), Team("Away team"), "League")
+        other_fixture = Fixture(Team("Away team"), Team("Home team"), "League")
+
+        def draws(seed: int, f: Fixture, scenario: Scenario) -> List[float]:
+            values: List[float] = fixture_generator(seed, f, scenario).random(4).tolist()
+            return values
+
+        first = draws(1, fixture, Scenario(0, 0, 0))
+
+        self.assertEqual(first, draws(1, fixture, Scenario(0, 0, 0)))
+        self.assertNotEqual(first, draws(2, fixture, Scenario(0, 0, 0)))
+        self.assertNotEqual(first, draws(1, other_fixture, Scenario(0, 0, 0)))
+        self.assertNotEqual(first, draws(1, fixture, Scenario(10, 0, 0)))
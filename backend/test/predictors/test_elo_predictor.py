@@ -0,0 +1,75 @@
+from test.predictors.builders import build_result, three_team_results
+from unittest import TestCase
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Team
+from matchpredictor.matchresults.results_frame import ResultsFrame
+from matchpredictor.predictors.elo_predictor import EloPredictor, EloRatings, fit_elo, initial_rating
+
+
+class TestEloPredictor(TestCase):
+    def test_record(self) -> None:
+        ratings = EloRatings(k_factor=20, home_advantage=0)
+
+        ratings.record(Team('Winner'), Team('Loser'), 1, 0)
+
+        self.assertAlmostEqual(initial_rating + 10, ratings.rating(Team('Winner')))
+        self.assertAlmostEqual(initial_rating - 10, ratings.rating(Team('Loser')))
+        self.assertEqual(initial_rating, ratings.rating(Team('Unknown')))
+
+    def test_record_weights_goal_difference(self) -> None:
+        narrow = EloRatings(k_factor=20, home_advantage=0)
+        wide = EloRatings(k_factor=20, home_advantage=0)
+
+        narrow.record(Team('Winner'), Team('Loser'), 1, 0)
+        wide.record(Team('Winner'), Team('Loser'), 4, 0)
+
+        self.assertAlmostEqual(initial_rating + 10 * 15 / 8, wide.rating(Team('Winner')))
+        self.assertGreater(wide.rating(Team('Winner')), narrow.rating(Team('Winner')))
+
+    def test_ratings_grow_with_new_teams(self) -> None:
+        ratings = EloRatings(k_factor=20)
+
+        for team in range(40):
+            ratings.record(Team(f'Team {team}'), Team('Opponent'), 1, 0)
+
+        self.assertEqual(41, len(ratings.team_index))
+        self.assertEqual(initial_rating, ratings.rating(Team('Unknown')))
+
+    def test_fit_elo_matches_replaying_results(self) -> None:
+        fitted = fit_elo(ResultsFrame.of(three_team_results), k_factors=[20.0])
+        replayed = EloRatings(k_factor=20.0)
+        replayed.add_results(three_team_results)
+
+        for team in ['Strong', 'Middling', 'Weak']:
+            self.assertAlmostEqual(replayed.rating(Team(team)), fitted.rating(Team(team)))
+        self.assertEqual(20.0, fitted.k_factor)
+
+    def test_predict(self) -> None:
+        predictor = EloPredictor(fit_elo(ResultsFrame.of(three_team_results)))
+
+        prediction = predictor.predict(Fixture(Team('Strong'), Team('Weak'), 'Some league'))
+
+        self.assertEqual(Outcome.HOME, prediction.outcome)
+        assert prediction.confidence is not None
+        self.assertGreater(prediction.confidence, 0.4)
+        self.assertLess(prediction.confidence, 1)
+
+    def test_probabilities_keep_the_expected_score(self) -> None:
+        ratings = fit_elo(ResultsFrame.of(three_team_results))
+        home_ids = ratings.team_ids([Team('Strong'), Team('Weak')])
+        away_ids = ratings.team_ids([Team('Weak'), Team('Strong')])
+
+        home, away, draw = ratings.outcome_probabilities(home_ids, away_ids)
+
+        for h, a, d in zip(home.tolist(), away.tolist(), draw.tolist()):
+            self.assertAlmostEqual(1.0, h + a + d)
+            self.assertGreaterEqual(min(h, a, d), 0)
+
+    def test_updated(self) -> None:
+        predictor = EloPredictor(fit_elo(ResultsFrame.of(three_team_results)))
+        fixture = Fixture(Team('Weak'), Team('Strong'), 'Some league')
+
+        updated = predictor.updated([build_result('Weak', 'Strong', 6, 0)] * 5)
+
+        self.assertEqual(Outcome.HOME, updated.predict(fixture).outcome)
+        self.assertEqual(Outcome.AWAY, predictor.predict(fixture).outcome)
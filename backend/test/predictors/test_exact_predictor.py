@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+from matchpredictor.matchresults.result import Team, Fixture, Outcome, Result, Scenario
+from matchpredictor.predictors.predictor import Prediction
+from matchpredictor.predictors.simulation_predictor import ExactPredictor
+from matchpredictor.predictors.simulators.scoring_rates import ScoringRates
+from matchpredictor.predictors.simulators.simulator import offense_goal_rates
+
+
+class TestExactPredictor(TestCase):
+    scoring_rates = ScoringRates([
+        Result(
+            fixture=Fixture(Team('Scores a lot'), Team('Not so good'), 'Some league'),
+            outcome=Outcome.HOME,
+            home_goals=90,
+            away_goals=0,
+            season=1999,
+        )
+    ])
+
+    predictor = ExactPredictor(goal_rates=offense_goal_rates(scoring_rates))
+
+    def test_confidence(self) -> None:
+        prediction = self.predictor.predict(Fixture(
+            home_team=Team('Scores a lot'),
+            away_team=Team('Not so good'),
+            league='boring league',
+        ))
+
+        self.assertEqual(Prediction(Outcome.HOME, 1), prediction)
+
+    def test_in_progress(self) -> None:
+        prediction = self.predictor.predict_in_progress(Fixture(
+            home_team=Team('Scores a lot'),
+            away_team=Team('Not so good'),
+            league='boring league',
+        ), Scenario(
+            minutes_elapsed=89,
+            home_goals=0,
+            away_goals=4,
+        ))
+
+        self.assertEqual(Prediction(Outcome.AWAY, 1), prediction)
+
+    def test_is_deterministic(self) -> None:
+        fixture = Fixture(Team('Not so good'), Team('Unknown'), 'boring league')
+
+        self.assertEqual(self.predictor.predict(fixture), self.predictor.predict(fixture))
+
+    def test_updated(self) -> None:
+        fixture = Fixture(Team('Not so good'), Team('Newcomer'), 'boring league')
+
+        updated = self.predictor.updated([
+            Result(
+                fixture=Fixture(Team('Not so good'), Team('Newcomer'), 'Some league'),
+                outcome=Outcome.HOME,
+                home_goals=180,
+                away_goals=0,
+                season=2000,
+            )
+        ])
+
+        self.assertEqual(Outcome.AWAY, self.predictor.predict(fixture).outcome)
+        self.assertEqual(Outcome.HOME, updated.predict(fixture).outcome)
+
+    def test_predict_batch(self) -> None:
+        fixtures = [
+            Fixture(Team('Scores a lot'), Team('Not so good'), 'boring league'),
+            Fixture(Team('Not so good'), Team('Unknown'), 'boring league'),
+        ]
+
+        self.assertEqual([self.predictor.predict(f) for f in fixtures], self.predictor.predict_batch(fixtures))
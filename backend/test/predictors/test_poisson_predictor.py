@@ -0,0 +1,85 @@
+from test.predictors.builders import build_result, three_team_results
+from unittest import TestCase
+
+import numpy as np
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Scenario, Team
+from matchpredictor.matchresults.results_frame import ResultsFrame
+from matchpredictor.predictors.poisson_predictor import (
+    PoissonPredictor,
+    fit_strengths,
+    scoreline_matrices,
+    train_poisson_predictor,
+)
+
+
+class TestPoissonPredictor(TestCase):
+    predictor = PoissonPredictor(ResultsFrame.of(three_team_results), dixon_coles=True)
+
+    def test_strengths(self) -> None:
+        strengths = fit_strengths(ResultsFrame.of(three_team_results), dixon_coles=False)
+        strong, weak = strengths.team_ids([Team('Strong'), Team('Weak')])
+
+        self.assertGreater(strengths.attack[strong], strengths.attack[weak])
+        self.assertLess(strengths.defence[strong], strengths.defence[weak])
+        self.assertAlmostEqual(1.0, float(strengths.attack[:-1].mean()))
+        self.assertEqual(0.0, strengths.rho)
+
+    def test_predict(self) -> None:
+        prediction = self.predictor.predict(Fixture(Team('Strong'), Team('Weak'), 'Some league'))
+
+        self.assertEqual(Outcome.HOME, prediction.outcome)
+        assert prediction.confidence is not None
+        self.assertGreater(prediction.confidence, 0.5)
+
+    def test_unknown_teams_are_average(self) -> None:
+        prediction = self.predictor.predict(Fixture(Team('Newcomer'), Team('Another newcomer'), 'Some league'))
+
+        self.assertIn(prediction.outcome, [Outcome.HOME, Outcome.DRAW])
+
+    def test_in_progress(self) -> None:
+        prediction = self.predictor.predict_in_progress(
+            Fixture(Team('Strong'), Team('Weak'), 'Some league'), Scenario(minutes_elapsed=90, home_goals=0, away_goals=1)
+        )
+
+        self.assertEqual(Outcome.AWAY, prediction.outcome)
+        self.assertAlmostEqual(1.0, prediction.confidence or 0)
+
+    def test_predict_batch_matches_predict(self) -> None:
+        newcomer = Fixture(Team('Newcomer'), Team('Weak'), 'Some league')
+        fixtures = [r.fixture for r in three_team_results] + [newcomer]
+
+        self.assertEqual([self.predictor.predict(f) for f in fixtures], self.predictor.predict_batch(fixtures))
+
+    def test_scoreline_matrices(self) -> None:
+        matrices = scoreline_matrices(np.array([1.5, 0.5]), np.array([1.0, 2.0]), rho=-0.1)
+
+        self.assertEqual((2, 11, 11), matrices.shape)
+        np.testing.assert_allclose([1.0, 1.0], matrices.sum(axis=(1, 2)))
+
+    def test_scorelines_agree_with_prediction(self) -> None:
+        fixture = Fixture(Team('Strong'), Team('Weak'), 'Some league')
+        distribution = self.predictor.predict_scorelines(fixture, Scenario(minutes_elapsed=0, home_goals=0, away_goals=0))
+        assert distribution is not None
+
+        self.assertAlmostEqual(1.0, float(distribution.remaining.sum()))
+        self.assertAlmostEqual(self.predictor.predict(fixture).confidence or 0, distribution.markets().home)
+
+    def test_dixon_coles_adds_draws(self) -> None:
+        independent = scoreline_matrices(np.array([1.2]), np.array([1.1]), rho=0.0)[0]
+        corrected = scoreline_matrices(np.array([1.2]), np.array([1.1]), rho=-0.1)[0]
+
+        self.assertGreater(corrected[0, 0], independent[0, 0])
+        self.assertGreater(corrected[1, 1], independent[1, 1])
+
+    def test_updated(self) -> None:
+        fixture = Fixture(Team('Weak'), Team('Newcomer'), 'Some league')
+        predictor = train_poisson_predictor(three_team_results)
+
+        updated = predictor.updated([
+            build_result('Newcomer', 'Weak', 5, 0),
+            build_result('Weak', 'Newcomer', 0, 4),
+        ])
+
+        self.assertIsInstance(updated, PoissonPredictor)
+        self.assertEqual(Outcome.AWAY, updated.predict(fixture).outcome)
@@ -0,0 +1,68 @@
+from test.predictors.builders import build_result, three_team_results
+from dataclasses import replace
+from unittest import TestCase
+
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor  # type: ignore
+
+from matchpredictor.matchresults.result import Fixture, Team
+from matchpredictor.matchresults.results_frame import feature_columns
+from matchpredictor.predictors.past_results_predictor import calculate_table
+from matchpredictor.predictors.random_forest_regressor import (
+    RandomForestPredictor,
+    form_matches,
+    random_forest_predictor,
+    train_random_forest_predictor,
+)
+from matchpredictor.predictors.rolling_form import calculate_form
+from matchpredictor.predictors.team_encoding import TeamEncoding
+from matchpredictor.predictors.tuning import TuningConfig
+
+
+quick_tuning = TuningConfig(search="random", budget=1, cv=2, backend="threading")
+
+
+class TestRandomForestPredictor(TestCase):
+    def test_predictor_uses_the_points_table_and_form_it_is_given(self) -> None:
+        points_table = calculate_table(three_team_results)
+        form = calculate_form(three_team_results, form_matches)
+
+        predictor = random_forest_predictor(three_team_results, points_table, form, quick_tuning)
+
+        assert isinstance(predictor, RandomForestPredictor)
+        self.assertIs(points_table, predictor.points_table)
+        self.assertIs(form, predictor.form)
+
+    def test_predicts_fixtures_without_features(self) -> None:
+        results = [
+            replace(r, fixture=replace(r.fixture, **{name: 50.0 for name in feature_columns}))
+            for r in three_team_results
+        ]
+        predictor = train_random_forest_predictor(results, quick_tuning)
+        assert isinstance(predictor, RandomForestPredictor)
+
+        predictions = predictor.predict_batch([
+            Fixture(Team("Strong"), Team("Weak"), "Some league"),
+            Fixture(Team("Weak"), Team("Middling"), "Some league", home_spi=20.0),
+        ])
+
+        self.assertEqual(2, len(predictions))
+        self.assertEqual([50.0] * len(feature_columns), predictor.feature_fill_values.tolist())
+
+    def test_updated_adds_results_to_points_and_form(self) -> None:
+        results = [build_result("Leaders", "Chasers", 2, 0)]
+        predictor = RandomForestPredictor(
+            RandomForestRegressor(),
+            TeamEncoding(["Leaders", "Chasers"]),
+            calculate_table(results),
+            calculate_form(results, form_matches),
+            np.zeros(len(feature_columns)),
+        )
+
+        updated = predictor.updated([build_result("Chasers", "Leaders", 4, 0)])
+
+        assert isinstance(updated, RandomForestPredictor)
+        self.assertEqual(3, updated.points_table.points_for(Team("Chasers")))
+        self.assertAlmostEqual(2, updated.form.average_goals_scored(Team("Chasers")))
+        self.assertEqual(0, predictor.points_table.points_for(Team("Chasers")))
+        self.assertAlmostEqual(0, predictor.form.average_goals_scored(Team("Chasers")))
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from matchpredictor.matchresults.result import Fixture, Outcome, Result, Team
+from matchpredictor.predictors.rolling_form import calculate_form
+
+home = Team("Home")
+away = Team("Away")
+
+
+def result(home_goals: int, away_goals: int) -> Result:
+    return Result(Fixture(home, away, "League"), Outcome.DRAW, home_goals, away_goals, 2021)
+
+
+class TestRollingForm(TestCase):
+    def test_averages_the_last_matches(self) -> None:
+        form = calculate_form([result(5, 0), result(1, 2), result(3, 4)], 2)
+
+        self.assertAlmostEqual(2, form.average_goals_scored(home))
+        self.assertAlmostEqual(3, form.average_goals_conceded(home))
+        self.assertAlmostEqual(3, form.average_goals_scored(away))
+        self.assertAlmostEqual(2, form.average_goals_conceded(away))
+
+    def test_updates_incrementally(self) -> None:
+        form = calculate_form([result(5, 0), result(1, 2)], 2)
+        form.record(home.name, away.name, 3, 4)
+
+        self.assertAlmostEqual(2, form.average_goals_scored(home))
+
+    def test_copy_is_independent(self) -> None:
+        form = calculate_form([result(5, 0), result(1, 2)], 2)
+
+        updated = form.copy()
+        updated.add_results([result(3, 4)])
+
+        self.assertAlmostEqual(3, form.average_goals_scored(home))
+        self.assertAlmostEqual(2, updated.average_goals_scored(home))
+
+    def test_unknown_team(self) -> None:
+        form = calculate_form([result(1, 0)], 5)
+
+        self.assertEqual(0, form.average_goals_scored(Team("Unknown")))
+        self.assertEqual(0, form.average_goals_conceded(Team("Unknown")))
@@ -0,0 +1,85 @@
+from typing import Tuple
+from unittest import TestCase
+
+import numpy as np
+
+from matchpredictor.matchresults.result import Fixture, Scenario, Team
+from matchpredictor.predictors.scorelines import ScorelineDistribution, ScorelineProbability, max_goals
+from matchpredictor.predictors.simulation_predictor import SimulationPredictor, ExactPredictor
+from matchpredictor.predictors.simulators.simulator import goal_rate_simulator
+
+fixture = Fixture(Team("Home Team"), Team("Away Team"), "Test League")
+
+
+def fixed_goal_rates(fixture: Fixture) -> Tuple[float, float]:
+    return 0.02, 0.01
+
+
+class TestScorelines(TestCase):
+    def test_from_remaining_goals__truncates_and_normalises(self) -> None:
+        remaining = np.full((20, 20), 1 / 400)
+
+        distribution = ScorelineDistribution.from_remaining_goals(remaining, Scenario(80, 2, 1))
+
+        self.assertEqual((max_goals + 1, max_goals + 1), distribution.remaining.shape)
+        self.assertAlmostEqual(1.0, distribution.remaining.sum())
+        self.assertEqual((2, 1), (distribution.home_goals, distribution.away_goals))
+
+    def test_scorelines__add_the_score_so_far(self) -> None:
+        remaining = np.array([[0.5, 0.2], [0.3, 0.0]])
+
+        scorelines = ScorelineDistribution.from_remaining_goals(remaining, Scenario(80, 2, 1)).scorelines()
+
+        self.assertEqual(scorelines, [
+            ScorelineProbability(home_goals=2, away_goals=1, probability=0.5),
+            ScorelineProbability(home_goals=3, away_goals=1, probability=0.3),
+            ScorelineProbability(home_goals=2, away_goals=2, probability=0.2),
+        ])
+
+    def test_markets__with_more_goals_than_the_matrix_holds(self) -> None:
+        remaining = np.array([[0.9, 0.0], [0.1, 0.0]])
+
+        markets = ScorelineDistribution.from_remaining_goals(remaining, Scenario(89, 12, 10)).markets()
+
+        self.assertAlmostEqual(1.0, markets.home)
+        self.assertAlmostEqual(0.0, markets.draw)
+        self.assertAlmostEqual(1.0, markets.both_teams_score)
+        self.assertEqual([1.0] * 5, [line.over for line in markets.total_goals])
+
+    def test_markets(self) -> None:
+        remaining = np.array([[0.4, 0.1], [0.3, 0.2]])
+
+        markets = ScorelineDistribution.from_remaining_goals(remaining, Scenario(0, 0, 0)).markets()
+
+        self.assertAlmostEqual(markets.home, 0.3)
+        self.assertAlmostEqual(markets.draw, 0.6)
+        self.assertAlmostEqual(markets.away, 0.1)
+        self.assertAlmostEqual(markets.both_teams_score, 0.2)
+        self.assertEqual([line.line for line in markets.total_goals], [0.5, 1.5, 2.5, 3.5, 4.5])
+        self.assertAlmostEqual(markets.total_goals[0].over, 0.6)
+        self.assertAlmostEqual(markets.total_goals[0].under, 0.4)
+        self.assertAlmostEqual(markets.total_goals[1].over, 0.2)
+
+    def test_scorelines__leaves_out_unlikely_scores(self) -> None:
+        remaining = np.array([[0.6, 0.0001], [0.3999, 0.0]])
+
+        scorelines = ScorelineDistribution.from_remaining_goals(remaining, Scenario(0, 0, 0)).scorelines()
+
+        self.assertEqual(scorelines, [
+            ScorelineProbability(home_goals=0, away_goals=0, probability=0.6),
+            ScorelineProbability(home_goals=1, away_goals=0, probability=0.3999),
+        ])
+
+    def test_simulation_matches_exact(self) -> None:
+        simulated = SimulationPredictor(goal_rate_simulator(fixed_goal_rates, seed=3), 100_000)
+        exact = ExactPredictor(fixed_goal_rates)
+
+        simulated_distribution = simulated.predict_scorelines(fixture, Scenario(30, 1, 0))
+        exact_distribution = exact.predict_scorelines(fixture, Scenario(30, 1, 0))
+        assert simulated_distribution is not None and exact_distribution is not None
+
+        np.testing.assert_allclose(simulated_distribution.remaining, exact_distribution.remaining, atol=0.01)
+
+        repeated = simulated.predict_scorelines(fixture, Scenario(30, 1, 0))
+        assert repeated is not None
+        np.testing.assert_array_equal(repeated.remaining, simulated_distribution.remaining)
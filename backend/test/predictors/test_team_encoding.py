@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+import numpy as np
+
+from matchpredictor.matchresults.result import Team
+from matchpredictor.predictors.team_encoding import TeamEncoding
+
+
+class TestTeamEncoding(TestCase):
+    def test_encodes_sparse_one_hot_rows(self) -> None:
+        encoding = TeamEncoding(["Burnley", "Hull City", "Leicester City"])
+
+        encoded = encoding.encode_teams([Team("Leicester City"), Team("Burnley")])
+
+        self.assertEqual("csr", encoded.format)
+        self.assertEqual([[0, 0, 1], [1, 0, 0]], encoded.toarray().tolist())
+
+    def test_encodes_team_ids(self) -> None:
+        encoding = TeamEncoding(["Burnley", "Hull City"])
+
+        encoded = encoding.encode(np.array([1, 1, 0], dtype=np.int32))
+
+        self.assertEqual([[0, 1], [0, 1], [1, 0]], encoded.toarray().tolist())
+
+    def test_index_of(self) -> None:
+        encoding = TeamEncoding(["Burnley", "Hull City"])
+
+        self.assertEqual(1, encoding.index_of(Team("Hull City")))
+        self.assertIsNone(encoding.index_of(Team("Unknown")))
@@ -0,0 +1,88 @@
+import os
+import tempfile
+from typing import Any, Dict, List
+from unittest import TestCase
+
+import numpy as np
+from scipy.sparse import csr_matrix  # type: ignore
+
+from matchpredictor.predictors.tuning import (
+    TuningConfig,
+    read_params,
+    tuned_random_forest,
+    tuning_config_from_environment,
+    write_params,
+)
+
+param_grid: Dict[str, List[Any]] = {
+    "n_estimators": [4, 8],
+    "max_depth": [None, 3],
+    "min_samples_leaf": [1, 2],
+}
+
+generator = np.random.default_rng(7)
+x = generator.random((60, 4))
+y = generator.integers(0, 3, (60, 2))
+
+
+class TestTuning(TestCase):
+    def test_searches(self) -> None:
+        for search, budget in [("grid", None), ("random", 3), ("halving", None), ("halving", 3)]:
+            config = TuningConfig(search=search, budget=budget, max_cores=1, backend="threading")
+
+            model = tuned_random_forest(x, y, config, param_grid)
+
+            self.assertEqual((5, 2), model.predict(x[:5]).shape)
+
+    def test_searches_are_repeatable(self) -> None:
+        for search in ["random", "halving"]:
+            config = TuningConfig(search=search, budget=3, max_cores=1, backend="threading", seed=5)
+
+            first = tuned_random_forest(x, y, config, param_grid)
+            second = tuned_random_forest(x, y, config, param_grid)
+
+            self.assertEqual(first.get_params(), second.get_params())
+            np.testing.assert_array_equal(first.predict(x), second.predict(x))
+
+    def test_sparse_features(self) -> None:
+        config = TuningConfig(max_cores=1, backend="threading")
+
+        model = tuned_random_forest(csr_matrix(x), y, config, param_grid)
+
+        self.assertEqual((5, 2), model.predict(csr_matrix(x[:5])).shape)
+
+    def test_unknown_search(self) -> None:
+        with self.assertRaises(ValueError):
+            tuned_random_forest(x, y, TuningConfig(search="exhaustive", max_cores=1), param_grid)
+
+    def test_persists_and_reuses_params(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            location = os.path.join(directory, "params.json")
+            config = TuningConfig(max_cores=1, backend="threading", params_location=location)
+
+            tuned_random_forest(x, y, config, param_grid)
+            self.assertIsNotNone(read_params(location, param_grid))
+
+            write_params(location, param_grid, {"n_estimators": 3, "max_depth": 2, "min_samples_leaf": 1})
+            model = tuned_random_forest(x, y, config, param_grid)
+
+            self.assertEqual(3, model.n_estimators)
+            self.assertEqual(2, model.max_depth)
+
+    def test_ignores_params_from_another_grid(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            location = os.path.join(directory, "params.json")
+            write_params(location, {"n_estimators": [1]}, {"n_estimators": 1})
+
+            self.assertIsNone(read_params(location, param_grid))
+
+    def test_config_from_environment(self) -> None:
+        config = tuning_config_from_environment({
+            "TUNING_SEARCH": "halving",
+            "TUNING_BUDGET": "12",
+            "TUNING_MAX_CORES": "2",
+            "TUNING_BACKEND": "threading",
+            "TUNING_SEED": "3",
+        })
+
+        self.assertEqual(TuningConfig(search="halving", budget=12, max_cores=2, backend="threading", seed=3), config)
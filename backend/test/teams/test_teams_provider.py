@@ -1,6 +1,7 @@
 from unittest import TestCase
 
-from matchpredictor.matchresults.result import Team, Fixture
+from matchpredictor.matchresults.result import Team, Fixture, Outcome, Result
+from matchpredictor.matchresults.results_frame import ResultsFrame
 from matchpredictor.teams.teams_provider import TeamsProvider, TeamWithLeagues
 
 
@@ -23,3 +24,18 @@ class TestTeamsProvider(TestCase):
             TeamWithLeagues(name='Roma', leagues=['japan 1', 'japan 2']),
             TeamWithLeagues(name='Other team', leagues=['japan 1']),
         ])
+
+    def test_all__from_results_frame(self) -> None:
+        frame = ResultsFrame.from_results([
+            Result(Fixture(Team("Chelsea"), Team("Roma"), "japan 2"), Outcome.HOME, 1, 0, 2022),
+            Result(Fixture(Team("Chelsea"), Team("Other team"), "japan 1"), Outcome.DRAW, 1, 1, 2022),
+            Result(Fixture(Team("Roma"), Team("Other team"), "japan 1"), Outcome.AWAY, 0, 2, 2022),
+        ])
+
+        teams = TeamsProvider(frame).all()
+
+        self.assertEqual(teams, [
+            TeamWithLeagues(name='Chelsea', leagues=['japan 1', 'japan 2']),
+            TeamWithLeagues(name='Roma', leagues=['japan 1', 'japan 2']),
+            TeamWithLeagues(name='Other team', leagues=['japan 1']),
+        ])
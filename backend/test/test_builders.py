@@ -1,3 +1,8 @@
+import time
+from typing import Optional
+
+from flask.testing import FlaskClient
+
 from matchpredictor.app import AppEnvironment
 
 
@@ -7,6 +12,8 @@ def build_app_environment(
     regression_csv_include: bool = True,
     season: int = 2023,
     football_data_api_key: str = "football-data-key-100",
+    model_store_location: Optional[str] = None,
+    csv_cache_location: Optional[str] = None,
 ) -> AppEnvironment:
     return AppEnvironment(
         csv_location=csv_location,
@@ -14,4 +21,19 @@ def build_app_environment(
         regression_csv_include=regression_csv_include,
         season=season,
         football_data_api_key=football_data_api_key,
+        model_store_location=model_store_location,
+        csv_cache_location=csv_cache_location,
     )
+
+
+def wait_for_models(test_client: FlaskClient, *model_names: str, timeout_seconds: float = 60) -> None:
+    """Models train in the background, and forecasts for them are refused until they are ready."""
+    deadline = time.monotonic() + timeout_seconds
+
+    while True:
+        models = test_client.get("/").get_json()["models"]
+        if all(models[name] == "ready" for name in model_names):
+            return
+        if time.monotonic() > deadline:
+            raise AssertionError(f"Models did not become ready: {models}")
+        time.sleep(0.01)
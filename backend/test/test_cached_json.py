@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from flask import Flask, Response
+
+from matchpredictor.cached_json import CachedJson
+
+
+class TestCachedJson(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        cached = CachedJson({"teams": [{"name": "Chelsea", "leagues": ["japan 1"]}]})
+
+        app = Flask(__name__)
+
+        @app.get("/teams")
+        def teams() -> Response:
+            return cached.response()
+
+        self.etag = cached.etag
+        self.test_client = app.test_client()
+
+    def test_response(self) -> None:
+        response = self.test_client.get("/teams")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"teams": [{"name": "Chelsea", "leagues": ["japan 1"]}]}, response.get_json())
+        self.assertEqual(f'"{self.etag}"', response.headers["ETag"])
+
+    def test_conditional_request(self) -> None:
+        response = self.test_client.get("/teams", headers={"If-None-Match": f'"{self.etag}"'})
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b"", response.data)
+
+    def test_conditional_request_with_old_etag(self) -> None:
+        response = self.test_client.get("/teams", headers={"If-None-Match": '"old"'})
+
+        self.assertEqual(200, response.status_code)
@@ -0,0 +1,23 @@
+from unittest import TestCase
+
+from matchpredictor.environment import app_environment_from_environment
+
+
+class TestEnvironment(TestCase):
+    def test_serving_needs_the_football_data_api_key(self) -> None:
+        with self.assertRaises(Exception):
+            app_environment_from_environment({})
+
+        env = app_environment_from_environment({"FOOTBALL_DATA_API_KEY": "key"})
+
+        self.assertEqual("key", env.football_data_api_key)
+
+    def test_training_reads_the_same_settings_without_the_key(self) -> None:
+        env = app_environment_from_environment(
+            {"SIMULATION_SEED": "7", "TRAINING_WORKERS": "2", "MODEL_STORE_LOCATION": "models"}, serving=False
+        )
+
+        self.assertEqual("", env.football_data_api_key)
+        self.assertEqual(7, env.simulation_seed)
+        self.assertEqual(2, env.training_workers)
+        self.assertEqual("models", env.model_store_location)
@@ -0,0 +1,50 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, cast
+from unittest import TestCase
+
+from flask import Flask
+
+from matchpredictor.health import health_api
+from matchpredictor.model.model_provider import Model, ModelProvider, PendingModel
+from matchpredictor.predictors.home_predictor import HomePredictor
+
+
+class TestHealth(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.release = threading.Event()
+
+        def train() -> Model:
+            self.release.wait(5)
+            return Model("Slow", HomePredictor())
+
+        self.provider = ModelProvider(
+            [Model("Home", HomePredictor()), PendingModel("Slow", train)], partial(ThreadPoolExecutor, 1)
+        )
+        self.provider.warm_up()
+
+        app = Flask(__name__)
+        app.register_blueprint(health_api(self.provider))
+        self.test_client = app.test_client()
+
+    def tearDown(self) -> None:
+        self.release.set()
+        super().tearDown()
+
+    def test_health_reports_each_model(self) -> None:
+        response = self.test_client.get("/")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"status": "UP", "models": {"Home": "ready", "Slow": "training"}}, response.get_json())
+
+    def test_ready_once_every_model_is_trained(self) -> None:
+        self.assertEqual(503, self.test_client.get("/ready").status_code)
+
+        self.release.set()
+        self.provider.list()
+        response = self.test_client.get("/ready")
+
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(cast(Dict[str, Any], response.get_json())["ready"])
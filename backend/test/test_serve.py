@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+from matchpredictor.app import AppEnvironment
+from matchpredictor.serve import (
+    ServingConfig,
+    check_ingest_is_served_by_one_worker,
+    gunicorn_options,
+    serving_config_from_environment,
+)
+
+
+class TestServe(TestCase):
+    def test_serving_config_from_environment(self) -> None:
+        config = serving_config_from_environment({
+            "PORT": "8080",
+            "SERVE_WORKERS": "4",
+            "SERVE_THREADS": "2",
+            "SERVE_TIMEOUT": "60",
+            "SERVE_GRACEFUL_TIMEOUT": "10",
+        })
+
+        self.assertEqual("0.0.0.0:8080", config.bind)
+        self.assertEqual(4, config.workers)
+        self.assertEqual(2, config.threads)
+        self.assertEqual(60, config.timeout)
+        self.assertEqual(10, config.graceful_timeout)
+        self.assertEqual(ServingConfig().keep_alive, config.keep_alive)
+
+    def test_gunicorn_options_preload_the_app(self) -> None:
+        options = gunicorn_options(ServingConfig(workers=3, max_requests=1000))
+
+        self.assertTrue(options["preload_app"])
+        self.assertEqual(3, options["workers"])
+        self.assertEqual(1000, options["max_requests"])
+
+    def test_ingest_is_served_by_one_worker(self) -> None:
+        env = AppEnvironment("", "", False, 2023, "", ingest_token="secret")
+
+        check_ingest_is_served_by_one_worker(env, ServingConfig(workers=1))
+        check_ingest_is_served_by_one_worker(AppEnvironment("", "", False, 2023, ""), ServingConfig(workers=4))
+        with self.assertRaises(ValueError):
+            check_ingest_is_served_by_one_worker(env, ServingConfig(workers=4))
+        with self.assertRaises(ValueError):
+            check_ingest_is_served_by_one_worker(env, ServingConfig(workers=1, max_requests=1000))
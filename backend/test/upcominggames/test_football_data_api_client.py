@@ -0,0 +1,99 @@
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import TestCase
+
+import responses
+
+from matchpredictor.upcominggames.football_data_api_client import FootballDataApiClient, FootballDataMatchesResponse
+
+matches_url = "https://api.football-data.org/v4/matches?dateFrom=2023-06-01&dateTo=2023-06-10"
+
+matches_body = """{
+    "matches": [
+        {
+            "area": {"name": "Netherlands"},
+            "competition": {"name": "Eredivisie"},
+            "homeTeam": {"shortName": "Groningen"},
+            "awayTeam": {"shortName": "Ajax"}
+        }
+    ]
+}"""
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFootballDataApiClient(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.clock = FakeClock()
+        self.client = FootballDataApiClient("my-api-key", cache_seconds=60, stale_seconds=600, clock=self.clock)
+
+    def fetch(self) -> Optional[FootballDataMatchesResponse]:
+        return self.client.fetch_matches(date(2023, 6, 1))
+
+    @responses.activate
+    def test_caches_each_date_window(self) -> None:
+        responses.add(method="GET", url=matches_url, status=200, body=matches_body)
+
+        first = self.fetch()
+        self.clock.now = 59
+        second = self.fetch()
+
+        self.assertIsNotNone(first)
+        self.assertEqual(first, second)
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual("my-api-key", responses.calls[0].request.headers["X-Auth-Token"])
+
+        self.clock.now = 61
+        self.fetch()
+
+        self.assertEqual(2, len(responses.calls))
+
+    @responses.activate
+    def test_serves_stale_matches_when_rate_limited(self) -> None:
+        responses.add(method="GET", url=matches_url, status=200, body=matches_body)
+        responses.add(method="GET", url=matches_url, status=429)
+        responses.add(method="GET", url=matches_url, status=503)
+
+        first = self.fetch()
+        self.clock.now = 120
+        rate_limited = self.fetch()
+        self.clock.now = 700
+        expired = self.fetch()
+
+        self.assertEqual(first, rate_limited)
+        self.assertIsNone(expired)
+        self.assertEqual(3, len(responses.calls))
+
+    @responses.activate
+    def test_unavailable_without_cached_matches(self) -> None:
+        responses.add(method="GET", url=matches_url, status=500)
+
+        self.assertIsNone(self.fetch())
+
+    @responses.activate
+    def test_concurrent_requests_share_one_upstream_call(self) -> None:
+        def slow_matches(request: Any) -> Tuple[int, Dict[str, str], str]:
+            time.sleep(0.2)
+            return 200, {}, matches_body
+
+        responses.add_callback(method="GET", url=matches_url, callback=slow_matches)
+
+        results: List[Optional[FootballDataMatchesResponse]] = []
+        threads = [threading.Thread(target=lambda: results.append(self.fetch())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len(responses.calls))
+        self.assertEqual(5, len(results))
+        self.assertTrue(all(r is not None and r == results[0] for r in results))
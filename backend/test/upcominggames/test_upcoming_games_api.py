@@ -225,3 +225,65 @@ class TestUpcomingGamesApi(TestCase):
         response = self.test_client.get("/upcoming-games/2023-06-01")
 
         self.assertEqual(503, response.status_code)
+
+    @responses.activate
+    def test_list__with_forecasts(self) -> None:
+        responses.add(
+            method="GET",
+            url="https://api.football-data.org/v4/matches?dateFrom=2023-06-01&dateTo=2023-06-10",
+            status=200,
+            body="""{
+                "matches": [
+                    {
+                        "area": {"name": "England"},
+                        "competition": {"name": "Championship"},
+                        "homeTeam": {"shortName": "Luton Town"},
+                        "awayTeam": {"shortName": "Blackpool"}
+                    },
+                    {
+                        "area": {"name": "Netherlands"},
+                        "competition": {"name": "Eredivisie"},
+                        "homeTeam": {"shortName": "Groningen"},
+                        "awayTeam": {"shortName": "Ajax"}
+                    }
+                ]
+            }""",
+        )
+
+        response = self.test_client.get("/upcoming-games/2023-06-01?model_name=Home&model_name=Alphabet Provider")
+
+        expected_body = {
+            "games": [
+                {
+                    "league": "English League Championship",
+                    "home": "Luton Town",
+                    "away": "Blackpool",
+                    "forecasts": [
+                        {"model_name": "Home", "outcome": "home", "confidence": None},
+                        {"model_name": "Alphabet Provider", "outcome": "away", "confidence": None},
+                    ],
+                },
+                {
+                    "league": "Dutch Eredivisie",
+                    "home": "Groningen",
+                    "away": "Ajax",
+                    "forecasts": [],
+                },
+            ]
+        }
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(expected_body, response.get_json())
+
+    @responses.activate
+    def test_list__with_forecasts_from_unknown_model(self) -> None:
+        responses.add(
+            method="GET",
+            url="https://api.football-data.org/v4/matches?dateFrom=2023-06-01&dateTo=2023-06-10",
+            status=200,
+            body='{"matches": []}',
+        )
+
+        response = self.test_client.get("/upcoming-games/2023-06-01?model_name=Nope")
+
+        self.assertEqual(400, response.status_code)
@@ -0,0 +1,55 @@
+from typing import List
+from unittest import TestCase
+
+from matchpredictor.forecast.forecaster import Forecaster
+from matchpredictor.matchresults.result import Fixture, Outcome, Team
+from matchpredictor.model.model_provider import Model, ModelProvider
+from matchpredictor.predictors.predictor import Prediction, Predictor
+from matchpredictor.teams.teams_provider import TeamsProvider
+from matchpredictor.upcominggames.upcoming_games_api import GameForecast, UpcomingGame, forecast_upcoming_games
+
+
+class CountingHome(Predictor):
+    def __init__(self) -> None:
+        self.batches: List[List[Fixture]] = []
+
+    def predict(self, fixture: Fixture) -> Prediction:
+        return Prediction(outcome=Outcome.HOME, confidence=0.5)
+
+    def predict_batch(self, fixtures: List[Fixture]) -> List[Prediction]:
+        self.batches.append(fixtures)
+        return [self.predict(fixture) for fixture in fixtures]
+
+
+class TestUpcomingGamesForecasts(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.predictor = CountingHome()
+        self.forecaster = Forecaster(ModelProvider([Model("Home", self.predictor)]))
+        self.teams_provider = TeamsProvider([
+            Fixture(home_team=Team("Ajax"), away_team=Team("PSV"), league="Dutch Eredivisie"),
+            Fixture(home_team=Team("Twente"), away_team=Team("Ajax"), league="Dutch Eredivisie"),
+        ])
+
+    def test_forecasts_known_games_in_one_batch(self) -> None:
+        games = [
+            UpcomingGame(league="Dutch Eredivisie", home="Ajax", away="PSV"),
+            UpcomingGame(league="Dutch Eredivisie", home="Groningen", away="Ajax"),
+            UpcomingGame(league="Dutch Eredivisie", home="PSV", away="Twente"),
+        ]
+
+        response = forecast_upcoming_games(games, ["Home"], self.forecaster, self.teams_provider)
+
+        assert response is not None
+        self.assertEqual(
+            [GameForecast(model_name="Home", outcome=Outcome.HOME, confidence=0.5)],
+            response.games[0].forecasts,
+        )
+        self.assertEqual([], response.games[1].forecasts)
+        self.assertEqual(["Ajax", "PSV"], [f.home_team.name for f in self.predictor.batches[0]])
+        self.assertEqual(1, len(self.predictor.batches))
+
+    def test_unknown_model(self) -> None:
+        games = [UpcomingGame(league="Dutch Eredivisie", home="Ajax", away="PSV")]
+
+        self.assertIsNone(forecast_upcoming_games(games, ["Nope"], self.forecaster, self.teams_provider))